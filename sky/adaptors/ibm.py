@@ -8,6 +8,7 @@ import os
 
 from sky import sky_logging
 from sky.adaptors import common
+from sky.utils import annotations
 
 CREDENTIAL_FILE = '~/.ibm/credentials.yaml'
 logger = sky_logging.init_logger(__name__)
@@ -96,8 +97,19 @@ def client(**kwargs):
 
 
 def search_client():
+    return _search_client(get_api_key())
+
+
+@annotations.lru_cache(scope='global', maxsize=1)
+def _search_client(api_key: str):
+    """Returns a search client, cached per API key.
+
+    The client's IAM authenticator refreshes its token when it expires, so
+    reusing the client avoids a new token request on every search.
+    """
     return ibm_platform_services.GlobalSearchV2(
-        authenticator=_get_authenticator())
+        authenticator=ibm_cloud_sdk_core.authenticators.IAMAuthenticator(
+            api_key))
 
 
 def tagging_client():
@@ -1,5 +1,6 @@
 """Util constants/functions for the backends."""
 import asyncio
+import dataclasses
 from datetime import datetime
 import enum
 import fnmatch
@@ -419,6 +420,13 @@ def _optimize_file_mounts(tmp_yaml_path: str) -> None:
     yaml_utils.dump_yaml(tmp_yaml_path, yaml_config)
 
 
+def touch(path: str) -> None:
+    """Creates 'path' if it does not exist, without forking a shell."""
+    fd = os.open(os.path.expanduser(path),
+                 os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    os.close(fd)
+
+
 def path_size_megabytes(path: str) -> int:
     """Returns the size of 'path' (directory or file) in megabytes.
 
@@ -1847,6 +1855,26 @@ def ssh_credentials_from_handles(
     return credentials_to_return
 
 
+@dataclasses.dataclass(frozen=True)
+class DataTransfer:
+    """A command and/or an rsync to run on every node of a cluster.
+
+    Attributes:
+        source: Source for rsync on local node. Also used in messages.
+        target: Destination on remote node for rsync. Also used in messages.
+        cmd: Command to be executed on all nodes, before the rsync.
+        run_rsync: Whether to rsync from source to target.
+        action_message: Message to be printed while the transfer runs.
+        source_bashrc: Source bashrc before running the command.
+    """
+    source: Optional[str]
+    target: str
+    cmd: Optional[str]
+    run_rsync: bool
+    action_message: str
+    source_bashrc: bool = False
+
+
 def parallel_data_transfer_to_nodes(
         runners: List[command_runner.CommandRunner],
         source: Optional[str],
@@ -1873,40 +1901,78 @@ def parallel_data_transfer_to_nodes(
         source_bashrc: bool; Source bashrc before running the command.
         num_threads: Optional[int]; Number of threads to use.
     """
-    style = colorama.Style
+    parallel_data_transfers_to_nodes(runners, [
+        DataTransfer(source=source,
+                     target=target,
+                     cmd=cmd,
+                     run_rsync=run_rsync,
+                     action_message=action_message,
+                     source_bashrc=source_bashrc)
+    ],
+                                     log_path=log_path,
+                                     stream_logs=stream_logs,
+                                     num_threads=num_threads)
+
+
+def parallel_data_transfers_to_nodes(
+        runners: List[command_runner.CommandRunner],
+        transfers: List[DataTransfer],
+        *,
+        # Advanced options.
+        log_path: str = os.devnull,
+        stream_logs: bool = False,
+        num_threads: Optional[int] = None):
+    """Runs multiple data transfers on all nodes.
 
-    origin_source = source
+    All (transfer, node) pairs share one thread pool, so the transfers run
+    in parallel with each other as well as across the nodes.
 
-    def _sync_node(runner: 'command_runner.CommandRunner') -> None:
-        if cmd is not None:
-            rc, stdout, stderr = runner.run(cmd,
-                                            log_path=log_path,
-                                            stream_logs=stream_logs,
-                                            require_outputs=True,
-                                            source_bashrc=source_bashrc)
+    Args:
+        runners: A list of CommandRunner objects that represent multiple nodes.
+        transfers: The data transfers to run on every node.
+        log_path: str; Path to the log file
+        stream_logs: bool; Whether to stream logs to stdout
+        num_threads: Optional[int]; Number of threads to use.
+
+    Raises:
+        CommandError: The first failing transfer, in the order of transfers.
+    """
+    style = colorama.Style
+
+    def _sync_node(
+        transfer_and_runner: Tuple[DataTransfer, 'command_runner.CommandRunner']
+    ) -> None:
+        transfer, runner = transfer_and_runner
+        if transfer.cmd is not None:
+            rc, stdout, stderr = runner.run(
+                transfer.cmd,
+                log_path=log_path,
+                stream_logs=stream_logs,
+                require_outputs=True,
+                source_bashrc=transfer.source_bashrc)
             err_msg = (f'{colorama.Style.RESET_ALL}{colorama.Style.DIM}'
                        f'----- CMD -----\n'
-                       f'{cmd}\n'
+                       f'{transfer.cmd}\n'
                        f'----- CMD END -----\n'
                        f'{colorama.Style.RESET_ALL}'
                        f'{colorama.Fore.RED}'
                        f'Failed to run command before rsync '
-                       f'{origin_source} -> {target}. '
+                       f'{transfer.source} -> {transfer.target}. '
                        f'{colorama.Style.RESET_ALL}')
             if log_path != os.devnull:
                 err_msg += ux_utils.log_path_hint(log_path)
             subprocess_utils.handle_returncode(rc,
-                                               cmd,
+                                               transfer.cmd,
                                                err_msg,
                                                stderr=stdout + stderr)
 
-        if run_rsync:
-            assert source is not None
+        if transfer.run_rsync:
+            assert transfer.source is not None
             # TODO(zhwu): Optimize for large amount of files.
             # zip / transfer / unzip
             runner.rsync(
-                source=source,
-                target=target,
+                source=transfer.source,
+                target=transfer.target,
                 up=True,
                 log_path=log_path,
                 stream_logs=stream_logs,
@@ -1914,10 +1980,14 @@ def parallel_data_transfer_to_nodes(
 
     num_nodes = len(runners)
     plural = 's' if num_nodes > 1 else ''
-    message = (f'  {style.DIM}{action_message} (to {num_nodes} node{plural})'
-               f': {origin_source} -> {target}{style.RESET_ALL}')
-    logger.info(message)
-    subprocess_utils.run_in_parallel(_sync_node, runners, num_threads)
+    for transfer in transfers:
+        message = (f'  {style.DIM}{transfer.action_message} (to {num_nodes} '
+                   f'node{plural}): {transfer.source} -> {transfer.target}'
+                   f'{style.RESET_ALL}')
+        logger.info(message)
+    subprocess_utils.run_in_parallel(
+        _sync_node, [(transfer, runner) for transfer in transfers
+                     for runner in runners], num_threads)
 
 
 def check_local_gpus() -> bool:
@@ -4229,9 +4299,17 @@ def get_backend_from_handle(
     return backend
 
 
-def get_task_demands_dict(task: 'task_lib.Task') -> Dict[str, float]:
+def get_task_demands_dict(
+        task: 'task_lib.Task',
+        resources: Optional['resources_lib.Resources'] = None
+) -> Dict[str, float]:
     """Returns the resources dict of the task.
 
+    Args:
+        task: The task to get the demands of.
+        resources: If set, the resources to run the task with, overriding
+            the task's own (best) resources.
+
     Returns:
         A dict of the resources of the task. The keys are the resource names
         and the values are the number of the resources. It always contains
@@ -4245,13 +4323,14 @@ def get_task_demands_dict(task: 'task_lib.Task') -> Dict[str, float]:
         'CPU': (constants.CONTROLLER_PROCESS_CPU_DEMAND
                 if task.is_controller_task() else DEFAULT_TASK_CPU_DEMAND)
     }
-    if task.best_resources is not None:
-        resources = task.best_resources
-    else:
-        # Task may (e.g., sky launch) or may not (e.g., sky exec) have undergone
-        # sky.optimize(), so best_resources may be None.
-        assert len(task.resources) == 1, task.resources
-        resources = list(task.resources)[0]
+    if resources is None:
+        if task.best_resources is not None:
+            resources = task.best_resources
+        else:
+            # Task may (e.g., sky launch) or may not (e.g., sky exec) have
+            # undergone sky.optimize(), so best_resources may be None.
+            assert len(task.resources) == 1, task.resources
+            resources = list(task.resources)[0]
     if resources is not None and resources.accelerators is not None:
         resources_dict.update(resources.accelerators)
     return resources_dict
@@ -4267,26 +4346,37 @@ def get_num_gpus_per_node(task: 'task_lib.Task') -> int:
     return int(math.ceil(acc_count))
 
 
-def get_task_resources_str(task: 'task_lib.Task',
-                           is_managed_job: bool = False) -> str:
+def get_task_resources_str(
+        task: 'task_lib.Task',
+        is_managed_job: bool = False,
+        resources: Optional['resources_lib.Resources'] = None) -> str:
     """Returns the resources string of the task.
 
     The resources string is only used as a display purpose, so we only show
     the accelerator demands (if any). Otherwise, the CPU demand is shown.
+
+    If resources is set, it is shown in place of the task's own resources, as
+    if the task had been set to run with only those resources.
     """
+    best_resources = task.best_resources
+    task_resources: Union[List['resources_lib.Resources'],
+                          Set['resources_lib.Resources']] = task.resources
+    if resources is not None:
+        best_resources = None
+        task_resources = [resources]
     spot_str = ''
     is_controller_task = task.is_controller_task()
     task_cpu_demand = (str(constants.CONTROLLER_PROCESS_CPU_DEMAND)
                        if is_controller_task else str(DEFAULT_TASK_CPU_DEMAND))
     if is_controller_task:
         resources_str = f'CPU:{task_cpu_demand}'
-    elif task.best_resources is not None:
-        accelerator_dict = task.best_resources.accelerators
+    elif best_resources is not None:
+        accelerator_dict = best_resources.accelerators
         if is_managed_job:
-            if task.best_resources.use_spot:
+            if best_resources.use_spot:
                 spot_str = '[Spot]'
-            assert task.best_resources.cpus is not None
-            task_cpu_demand = task.best_resources.cpus
+            assert best_resources.cpus is not None
+            task_cpu_demand = best_resources.cpus
         if accelerator_dict is None:
             resources_str = f'CPU:{task_cpu_demand}'
         else:
@@ -4296,7 +4386,7 @@ def get_task_resources_str(task: 'task_lib.Task',
         resource_accelerators = []
         min_cpus = float('inf')
         spot_type: Set[str] = set()
-        for resource in task.resources:
+        for resource in task_resources:
             task_cpu_demand = '1+'
             if resource.cpus is not None:
                 task_cpu_demand = resource.cpus
@@ -4312,7 +4402,7 @@ def get_task_resources_str(task: 'task_lib.Task',
                 resource_accelerators.append(f'{k}:{v}')
 
         if is_managed_job:
-            if len(task.resources) > 1:
+            if len(task_resources) > 1:
                 task_cpu_demand = f'{min_cpus}+'
             if 'Spot' in spot_type:
                 spot_str = '|'.join(sorted(spot_type))
@@ -2,6 +2,7 @@
 import copy
 import dataclasses
 import enum
+import functools
 import json
 import math
 import os
@@ -69,6 +70,7 @@ from sky.utils import cluster_utils
 from sky.utils import command_runner
 from sky.utils import common
 from sky.utils import common_utils
+from sky.utils import context as context_lib
 from sky.utils import context_utils
 from sky.utils import controller_utils
 from sky.utils import directory_utils
@@ -154,10 +156,25 @@ _RETRY_UNTIL_UP_INIT_GAP_SECONDS = 30
 # The maximum retry count for fetching IP address.
 _FETCH_IP_MAX_ATTEMPTS = 3
 
-# How many times to query the cloud provider to make sure instances are
-# stopping/terminating, and how long to wait between each query.
-_TEARDOWN_WAIT_MAX_ATTEMPTS = 10
-_TEARDOWN_WAIT_BETWEEN_ATTEMPS_SECONDS = 1
+# How long in total to wait between queries to the cloud provider to make sure
+# instances are stopping/terminating. The wait between two queries backs off
+# exponentially from the initial wait, up to the max backoff factor times it.
+_TEARDOWN_WAIT_MAX_TOTAL_SECONDS = 9
+_TEARDOWN_WAIT_INITIAL_BACKOFF_SECONDS = 0.5
+_TEARDOWN_WAIT_MAX_BACKOFF_FACTOR = 4
+# Node statuses that count as torn down when checking for abnormal nodes.
+# FIXME(cooperc): Some clouds (e.g. GCP) do not distinguish between
+# "stopping/stopped" and "terminating/terminated", so we allow for either
+# status instead of casing on `terminate`.
+_TEARDOWN_DONE_NODE_STATUSES = frozenset(
+    [None, status_lib.ClusterStatus.STOPPED])
+
+# Attempts to acquire the cluster status lock for a teardown. The wait between
+# two attempts backs off from the initial wait, up to the max backoff factor
+# times it.
+_TEARDOWN_LOCK_MAX_ATTEMPTS = 3
+_TEARDOWN_LOCK_INITIAL_BACKOFF_SECONDS = 1
+_TEARDOWN_LOCK_MAX_BACKOFF_FACTOR = 4
 
 _TEARDOWN_FAILURE_MESSAGE = (
     f'\n{colorama.Fore.RED}Failed to terminate '
@@ -177,6 +194,10 @@ _TEARDOWN_PURGE_WARNING = (
     'Details: {details}'
     f'{colorama.Style.RESET_ALL}')
 
+_NO_MATCHING_LOG_DIRS_MESSAGE = (f'{colorama.Fore.YELLOW}'
+                                 'No matching log directories found'
+                                 f'{colorama.Style.RESET_ALL}')
+
 _RSYNC_NOT_FOUND_MESSAGE = (
     '`rsync` command is not found in the specified image. '
     'Please use an image with rsync installed.')
@@ -188,9 +209,9 @@ _MAX_RAY_UP_RETRY = 5
 # Number of retries for getting zones.
 _MAX_GET_ZONE_RETRY = 3
 
-_JOB_ID_PATTERN = re.compile(r'Job ID: ([0-9]+)')
+_JOB_ID_MARKER = 'Job ID: '
 _JOB_IDS_PATTERN = re.compile(r'Job IDs: ([0-9,]+)')
-_LOG_DIR_PATTERN = re.compile(r'Log Dir: ([^ ]+)')
+_LOG_DIR_MARKER = 'Log Dir: '
 
 # Path to the monkey-patched ray up script.
 # We don't do import then __file__ because that script needs to be filled in
@@ -206,6 +227,33 @@ _EXCEPTION_MSG_AND_RETURNCODE_FOR_DUMP_INLINE_SCRIPT = [
     ('400 bad request', 1),  # CloudFlare 400 error
 ]
 
+
+def _compile_dump_inline_script_patterns() -> Dict[int, 're.Pattern[str]']:
+    """Compiles the messages above into one pattern per return code.
+
+    The patterns are case-insensitive, so that (potentially large) outputs
+    do not need to be lowercased for every message.
+    """
+    messages_by_returncode: Dict[int, List[str]] = {}
+    for match_str, returncode in (
+            _EXCEPTION_MSG_AND_RETURNCODE_FOR_DUMP_INLINE_SCRIPT):
+        messages_by_returncode.setdefault(returncode,
+                                          []).append(re.escape(match_str))
+    return {
+        returncode: re.compile('|'.join(messages), re.IGNORECASE)
+        for returncode, messages in messages_by_returncode.items()
+    }
+
+
+_DUMP_INLINE_SCRIPT_PATTERNS = _compile_dump_inline_script_patterns()
+
+# SSH command used by a node to reach other nodes of the same cluster, with
+# the intra-cluster key configured in the node's ~/.ssh/config. BatchMode makes
+# it fail fast instead of prompting when the key is not set up.
+_INTRA_CLUSTER_SSH_CMD = ('ssh -o BatchMode=yes -o ConnectTimeout=10 '
+                          '-o StrictHostKeyChecking=no '
+                          '-o UserKnownHostsFile=/dev/null')
+
 _RESOURCES_UNAVAILABLE_LOG = (
     'Reasons for provision failures (for details, please check the log above):')
 
@@ -272,6 +320,48 @@ _CLUSTER_LOCK_TIMEOUT = 5.0
 _CLUSTER_LOCK_RETRY_GAP_SECONDS = 30
 
 
+def _install_interrupt_handlers() -> None:
+    """Installs the SIGINT/SIGTSTP handlers for streaming remote commands.
+
+    With the stdin=subprocess.DEVNULL, the ctrl-c will not directly kill the
+    process, so we need to handle it manually. Signal handlers can only be
+    installed from the main thread, and are left alone if already in place.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+    if signal.getsignal(signal.SIGINT) is not backend_utils.interrupt_handler:
+        signal.signal(signal.SIGINT, backend_utils.interrupt_handler)
+    if signal.getsignal(signal.SIGTSTP) is not backend_utils.stop_handler:
+        signal.signal(signal.SIGTSTP, backend_utils.stop_handler)
+
+
+def _parse_add_job_result(result_str: str) -> Tuple[int, Optional[str]]:
+    """Parses the job id and log dir printed by JobLibCodeGen.add_job.
+
+    The output looks like ``Job ID: <id>\nLog Dir: <dir>``. Older runtimes
+    print only the job id, either bare or after the ``Job ID:`` marker, in
+    which case the log dir is None.
+
+    Raises:
+        ValueError: if the job id cannot be parsed.
+    """
+    start = result_str.find(_JOB_ID_MARKER)
+    if start == -1:
+        # For backward compatibility.
+        return int(result_str), None
+    start += len(_JOB_ID_MARKER)
+    end = result_str.find('\n', start)
+    job_id = int(result_str[start:end if end != -1 else None])
+
+    log_dir = None
+    start = result_str.find(_LOG_DIR_MARKER)
+    if start != -1:
+        start += len(_LOG_DIR_MARKER)
+        end = result_str.find(' ', start)
+        log_dir = result_str[start:end if end != -1 else None].strip()
+    return job_id, log_dir
+
+
 def _is_message_too_long(returncode: int,
                          output: Optional[str] = None,
                          file_path: Optional[str] = None) -> bool:
@@ -296,19 +386,12 @@ def _is_message_too_long(returncode: int,
     """
     assert (output is None) != (file_path is None), (
         'Either output or file_path must be provided.', output, file_path)
-    to_check = []
-    for (match_str,
-         desired_rc) in _EXCEPTION_MSG_AND_RETURNCODE_FOR_DUMP_INLINE_SCRIPT:
-        if desired_rc == returncode:
-            to_check.append(match_str)
-    if not to_check:
+    pattern = _DUMP_INLINE_SCRIPT_PATTERNS.get(returncode)
+    if pattern is None:
         return False
 
     def _check_output_for_match_str(output: str) -> bool:
-        for match_str in to_check:
-            if match_str.lower() in output.lower():
-                return True
-        return False
+        return pattern.search(output) is not None
 
     if file_path is not None:
         try:
@@ -400,6 +483,21 @@ def _add_to_blocked_resources(blocked_resources: Set['resources_lib.Resources'],
     blocked_resources.add(resources)
 
 
+def _has_nested_paths(paths: List[str]) -> bool:
+    """Returns whether any path is the same as or nested under another."""
+    normalized_paths = [os.path.normpath(path) for path in paths]
+    path_set = set(normalized_paths)
+    if len(path_set) < len(normalized_paths):
+        return True
+    for path in normalized_paths:
+        parent = os.path.dirname(path)
+        while parent and parent != path:
+            if parent in path_set:
+                return True
+            path, parent = parent, os.path.dirname(parent)
+    return False
+
+
 class FailoverCloudErrorHandlerV1:
     """Handles errors during provisioning and updates the blocked_resources.
 
@@ -1042,7 +1140,7 @@ class RetryingVmProvisioner(object):
         log_abs_path = os.path.abspath(log_path)
         if not dryrun:
             os.makedirs(os.path.expanduser(self.log_dir), exist_ok=True)
-            os.system(f'touch {log_path}')
+            backend_utils.touch(log_path)
 
         rich_utils.force_update_status(
             ux_utils.spinner_message('Launching',
@@ -3121,6 +3219,9 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         # Do not make directories to avoid create folder for commands that
         # do not need it (`sky status`, `sky logs` ...)
         # os.makedirs(self.log_dir, exist_ok=True)
+        # Whether the local log directory has been created. See
+        # _ensure_local_log_dir().
+        self._local_log_dir_created = False
 
         self._dag = None
         self._optimize_target = None
@@ -3154,6 +3255,14 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 quote_levels += 1
         return quote_levels
 
+    def _ensure_local_log_dir(self) -> str:
+        """Creates the local log directory once and returns its local path."""
+        local_log_dir = os.path.expanduser(self.log_dir)
+        if not self._local_log_dir_created:
+            os.makedirs(local_log_dir, exist_ok=True)
+            self._local_log_dir_created = True
+        return local_log_dir
+
     # --- Implementation of Backend APIs ---
 
     def register_info(self, **kwargs) -> None:
@@ -3677,6 +3786,15 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             # Get actual zone info and save it into handle.
             # NOTE: querying zones is expensive, observed 1node GCP >=4s.
             zone = handle.launched_resources.zone
+            if zone is None:
+                # Fast path: the zone is already known from the cluster config
+                # when the cluster is restricted to a single zone.
+                provider_zones = config.get('provider',
+                                            {}).get('availability_zone')
+                if provider_zones and ',' not in str(provider_zones):
+                    zone = str(provider_zones)
+                    handle.launched_resources = (
+                        handle.launched_resources.copy(zone=zone))
             if zone is None:
                 get_zone_cmd = (
                     handle.launched_resources.cloud.get_zone_shell_cmd())
@@ -3750,8 +3868,6 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             config_hash: str) -> None:
         usage_lib.messages.usage.update_cluster_resources(
             handle.launched_nodes, handle.launched_resources)
-        usage_lib.messages.usage.update_final_cluster_status(
-            status_lib.ClusterStatus.UP)
 
         runtime_metadata = handle.provision_runtime_metadata
 
@@ -3812,13 +3928,15 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                     'Failed to set previously in-progress jobs to FAILED',
                     stdout + stderr)
 
-        prev_ports = None
-        if prev_handle is not None:
-            prev_ports = prev_handle.launched_resources.ports
         current_ports = handle.launched_resources.ports
-        open_new_ports = bool(
-            resources_utils.port_ranges_to_set(current_ports) -
-            resources_utils.port_ranges_to_set(prev_ports))
+        open_new_ports = False
+        if current_ports:
+            prev_ports = None
+            if prev_handle is not None:
+                prev_ports = prev_handle.launched_resources.ports
+            open_new_ports = (current_ports != prev_ports and
+                              not resources_utils.port_ranges_cover(
+                                  prev_ports, current_ports))
         if open_new_ports:
             launched_resources = handle.launched_resources.assert_launchable()
             if not (launched_resources.cloud.OPEN_PORTS_VERSION <=
@@ -3914,8 +4032,8 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         logger.info(
             f'  {style.DIM}Syncing workdir (to {num_nodes} node{plural}): '
             f'{SKY_REMOTE_WORKDIR}{style.RESET_ALL}')
-        os.makedirs(os.path.expanduser(self.log_dir), exist_ok=True)
-        os.system(f'touch {log_path}')
+        self._ensure_local_log_dir()
+        backend_utils.touch(log_path)
         num_threads = subprocess_utils.get_parallel_threads(
             str(handle.launched_resources.cloud))
         with rich_utils.safe_status(
@@ -3965,19 +4083,73 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 stream_logs=False,
             )
 
+        # Filter the copy from the head node the same way as the upload from
+        # local, so that files on the head node that are ignored locally
+        # (e.g., outputs and logs of earlier runs) are not copied to the
+        # workers.
+        rsync_filter_options = [command_runner.RSYNC_FILTER_GITIGNORE]
+        if os.path.exists(
+                os.path.join(full_workdir, constants.SKY_IGNORE_FILE)):
+            rsync_filter_options = [command_runner.RSYNC_FILTER_SKYIGNORE]
+        elif os.path.exists(
+                os.path.join(full_workdir, command_runner.GIT_EXCLUDE)):
+            # Relative to the workdir, which the rsync below runs in.
+            rsync_filter_options.append(
+                command_runner.RSYNC_EXCLUDE_OPTION.format(
+                    command_runner.GIT_EXCLUDE))
+
+        def _sync_workdir_from_head(
+                runner_and_ip: Tuple[command_runner.CommandRunner, str]
+        ) -> None:
+            runner, internal_ip = runner_and_ip
+            head_runner = runners[0]
+            assert isinstance(head_runner, command_runner.SSHCommandRunner)
+            rsync_cmd = (f'cd {SKY_REMOTE_WORKDIR} && rsync -az '
+                         f'{" ".join(rsync_filter_options)} '
+                         f'-e {shlex.quote(_INTRA_CLUSTER_SSH_CMD)} ./ '
+                         f'{head_runner.ssh_user}@{internal_ip}:'
+                         f'{SKY_REMOTE_WORKDIR}/')
+            returncode = head_runner.run(rsync_cmd,
+                                         log_path=log_path,
+                                         stream_logs=False)
+            if returncode != 0:
+                logger.debug(f'Failed to sync workdir from the head node to '
+                             f'{internal_ip} (returncode: {returncode}). '
+                             'Falling back to syncing from local.')
+                _sync_workdir_node(runner)
+
         num_nodes = handle.launched_nodes
         plural = 's' if num_nodes > 1 else ''
         logger.info(
             f'  {style.DIM}Syncing workdir (to {num_nodes} node{plural}): '
             f'{workdir} -> {SKY_REMOTE_WORKDIR}{style.RESET_ALL}')
-        os.makedirs(os.path.expanduser(self.log_dir), exist_ok=True)
-        os.system(f'touch {log_path}')
+        self._ensure_local_log_dir()
+        backend_utils.touch(log_path)
         num_threads = subprocess_utils.get_parallel_threads(
             str(handle.launched_resources.cloud))
+        # Upload the workdir from local only once, to the head node, and
+        # let the head node copy it to the workers over the cluster network,
+        # when the nodes are plain VMs that can ssh into each other. Slurm
+        # runners are SSH runners too, but their nodes are reached through
+        # the login node.
+        sync_from_head = (
+            len(runners) > 1 and handle.docker_user is None and
+            not os.path.islink(full_workdir) and
+            not isinstance(handle.launched_resources.cloud, clouds.Slurm) and
+            all(
+                isinstance(runner, command_runner.SSHCommandRunner)
+                for runner in runners))
         with rich_utils.safe_status(
                 ux_utils.spinner_message('Syncing workdir', log_path)):
-            subprocess_utils.run_in_parallel(_sync_workdir_node, runners,
-                                             num_threads)
+            if sync_from_head:
+                internal_ips = handle.internal_ips()
+                _sync_workdir_node(runners[0])
+                subprocess_utils.run_in_parallel(
+                    _sync_workdir_from_head,
+                    list(zip(runners[1:], internal_ips[1:])), num_threads)
+            else:
+                subprocess_utils.run_in_parallel(_sync_workdir_node, runners,
+                                                 num_threads)
         logger.info(ux_utils.finishing_message('Synced workdir.', log_path))
 
     def _sync_file_mounts(
@@ -4015,7 +4187,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                         isinstance(resource.accelerators, dict)):
                     if len(resource.accelerators) > 0:
                         return math.ceil(
-                            list(resource.accelerators.values())[0])
+                            next(iter(resource.accelerators.values())))
         return 0
 
     def _setup(self, handle: CloudVmRayResourceHandle, task: task_lib.Task,
@@ -4038,21 +4210,52 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         unset_ray_env_vars = ' && '.join(
             [f'unset {var}' for var in task_codegen.UNSET_RAY_ENV_VARS])
         setup_cmd = f'{unset_ray_env_vars}; {setup_cmd}'
+        # The setup commands are run without the SSH ControlMaster, while the
+        # short script uploads reuse the master connection that has already
+        # been established for the cluster.
         runners = handle.get_command_runners(avoid_ssh_control=True)
+        upload_runners = handle.get_command_runners()
 
-        def _setup_node(node_id: int) -> None:
-            setup_envs = task_lib.get_plaintext_envs_and_secrets(
-                task.envs_and_secrets)
-            setup_envs.update(self._skypilot_predefined_env_vars(handle))
-            setup_envs['SKYPILOT_SETUP_NODE_IPS'] = '\n'.join(internal_ips)
-            setup_envs['SKYPILOT_SETUP_NODE_RANK'] = str(node_id)
-            setup_envs[constants.SKYPILOT_SETUP_NUM_GPUS_PER_NODE] = (str(
-                self._get_num_gpus(task)))
+        setup_envs = task_lib.get_plaintext_envs_and_secrets(
+            task.envs_and_secrets)
+        setup_envs.update(self._skypilot_predefined_env_vars(handle))
+        setup_envs['SKYPILOT_SETUP_NODE_IPS'] = '\n'.join(internal_ips)
+        setup_envs[constants.SKYPILOT_SETUP_NUM_GPUS_PER_NODE] = (str(
+            self._get_num_gpus(task)))
+
+        # The setup script only differs across nodes by the node rank. When
+        # setup runs in the foreground, the rank is exported by the command
+        # instead, so the script is generated and written locally only once
+        # and shared by all the nodes.
+        shared_setup_script = log_lib.make_task_bash_script(
+            setup, env_vars=setup_envs)
+        encoded_shared_script = shlex.quote(shared_setup_script)
+        shared_setup_sh_path: Optional[str] = None
+        if not detach_setup:
+            with tempfile.NamedTemporaryFile('w',
+                                             prefix='sky_setup_',
+                                             delete=False) as f:
+                f.write(shared_setup_script)
+                shared_setup_sh_path = f.name
 
+        def _setup_node(node_id: int) -> None:
             runner = runners[node_id]
-            setup_script = log_lib.make_task_bash_script(setup,
-                                                         env_vars=setup_envs)
-            encoded_script = shlex.quote(setup_script)
+            # Self-contained script with the node rank, for the cases where
+            # the script is executed outside of this function.
+            node_setup_script = None
+            if self._dump_final_script or detach_setup:
+                node_setup_script = log_lib.make_task_bash_script(
+                    setup,
+                    env_vars={
+                        **setup_envs, 'SKYPILOT_SETUP_NODE_RANK': str(node_id)
+                    })
+
+            def _rsync_script(setup_sh_path: str,
+                              target_dir: str = remote_setup_file_name) -> None:
+                upload_runners[node_id].rsync(source=setup_sh_path,
+                                              target=target_dir,
+                                              up=True,
+                                              stream_logs=False)
 
             def _dump_final_script(
                     setup_script: str,
@@ -4060,11 +4263,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 with tempfile.NamedTemporaryFile('w', prefix='sky_setup_') as f:
                     f.write(setup_script)
                     f.flush()
-                    setup_sh_path = f.name
-                    runner.rsync(source=setup_sh_path,
-                                 target=target_dir,
-                                 up=True,
-                                 stream_logs=False)
+                    _rsync_script(f.name, target_dir)
 
             # Always dump the full setup script to the persistent path first
             # In high availability mode, we need to dump the full setup script
@@ -4073,21 +4272,29 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             # setup script, rather than a reference to a temporary file that
             # would no longer exist after restart.
             if self._dump_final_script:
-                _dump_final_script(setup_script,
+                assert node_setup_script is not None
+                _dump_final_script(node_setup_script,
                                    constants.PERSISTENT_SETUP_SCRIPT_PATH)
 
-            if (detach_setup or backend_utils.is_command_length_over_limit(
-                    encoded_script,
-                    quote_levels=self._inline_command_quote_levels(handle))):
-                _dump_final_script(setup_script)
+            if detach_setup:
+                # The setup command is run later as part of the job, so the
+                # script needs to carry the node rank itself.
+                assert node_setup_script is not None
+                _dump_final_script(node_setup_script)
+                return
+            assert shared_setup_sh_path is not None
+
+            node_setup_cmd = (f'export SKYPILOT_SETUP_NODE_RANK={node_id}; '
+                              f'{setup_cmd}')
+            if backend_utils.is_command_length_over_limit(
+                    encoded_shared_script,
+                    quote_levels=self._inline_command_quote_levels(handle)):
+                _rsync_script(shared_setup_sh_path)
                 create_script_code = 'true'
             else:
-                create_script_code = (f'{{ echo {encoded_script} > '
+                create_script_code = (f'{{ echo {encoded_shared_script} > '
                                       f'{remote_setup_file_name}; }}')
 
-            if detach_setup:
-                return
-
             setup_log_path = os.path.join(self.log_dir,
                                           f'setup-{runner.node_id}.log')
 
@@ -4105,7 +4312,8 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                     skip_num_lines=3)
                 return returncode
 
-            returncode = _run_setup(f'{create_script_code} && {setup_cmd}',)
+            returncode = _run_setup(
+                f'{create_script_code} && {node_setup_cmd}')
 
             if _is_message_too_long(returncode, file_path=setup_log_path):
                 # If the setup script is too long, we need to retry it
@@ -4114,18 +4322,16 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 logger.debug('Failed to run setup command inline due to '
                              'command length limit. Dumping setup script to '
                              'file and running it with SSH.')
-                _dump_final_script(setup_script)
-                returncode = _run_setup(setup_cmd)
+                _rsync_script(shared_setup_sh_path)
+                returncode = _run_setup(node_setup_cmd)
 
             def error_message() -> str:
                 # Use the function to avoid tailing the file in success case
                 try:
-                    last_10_lines = subprocess.run(
-                        ['tail', '-n10',
-                         os.path.expanduser(setup_log_path)],
-                        stdout=subprocess.PIPE,
-                        check=True).stdout.decode('utf-8')
-                except subprocess.CalledProcessError:
+                    lines, _ = log_lib.tail_lines_from_end(
+                        os.path.expanduser(setup_log_path), tail=10)
+                    last_10_lines = ''.join(lines)
+                except OSError:
                     last_10_lines = None
 
                 err_msg = (f'Failed to setup with return code {returncode}. '
@@ -4160,7 +4366,12 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         # even if some of them raise exceptions. We should replace it with
         # multi-process.
         rich_utils.stop_safe_status()
-        subprocess_utils.run_in_parallel(_setup_node, list(range(num_nodes)))
+        try:
+            subprocess_utils.run_in_parallel(_setup_node,
+                                             list(range(num_nodes)))
+        finally:
+            if shared_setup_sh_path is not None:
+                os.remove(shared_setup_sh_path)
 
         if detach_setup:
             # Only set this when setup needs to be run outside the self._setup()
@@ -4247,6 +4458,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             code = code + ' && ' + wait_code
 
         job_submit_cmd = ' && '.join([mkdir_code, create_script_code, code])
+        quote_levels = self._inline_command_quote_levels(handle)
 
         # Should also be ealier than is_command_length_over_limit
         # Same reason as in _setup
@@ -4298,8 +4510,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                         execution=execution)
 
                 if backend_utils.is_command_length_over_limit(
-                        codegen,
-                        quote_levels=self._inline_command_quote_levels(handle)):
+                        codegen, quote_levels=quote_levels):
                     _dump_code_to_file(codegen)
                     queue_job_request = jobsv1_pb2.QueueJobRequest(
                         job_id=job_id,
@@ -4323,8 +4534,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
 
         if use_legacy:
             if backend_utils.is_command_length_over_limit(
-                    job_submit_cmd,
-                    quote_levels=self._inline_command_quote_levels(handle)):
+                    job_submit_cmd, quote_levels=quote_levels):
                 _dump_code_to_file(codegen)
                 job_submit_cmd = f'{mkdir_code} && {code}'
 
@@ -4420,18 +4630,10 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                                                'Failed to fetch job id.',
                                                stderr)
             try:
-                job_id_match = _JOB_ID_PATTERN.search(result_str)
-                if job_id_match is not None:
-                    job_id = int(job_id_match.group(1))
-                else:
-                    # For backward compatibility.
-                    job_id = int(result_str)
-                log_dir_match = _LOG_DIR_PATTERN.search(result_str)
-                if log_dir_match is not None:
-                    log_dir = log_dir_match.group(1).strip()
-                else:
-                    # For backward compatibility, use the same log dir as local.
-                    log_dir = self.log_dir
+                job_id, parsed_log_dir = _parse_add_job_result(result_str)
+                # For backward compatibility, use the same log dir as local.
+                log_dir = (parsed_log_dir
+                           if parsed_log_dir is not None else self.log_dir)
             except ValueError as e:
                 logger.error(stderr)
                 raise ValueError(f'Failed to parse job id: {result_str}; '
@@ -4574,29 +4776,32 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             valid_resource = self.check_resources_fit_cluster(handle,
                                                               task,
                                                               check_ports=True)
-        task_copy = copy.copy(task)
-        # Handle multiple resources exec case.
-        task_copy.set_resources(valid_resource)
-        if len(task.resources) > 1:
-            logger.info('Multiple resources are specified '
-                        f'for the task, using: {valid_resource}')
-        task_copy.best_resources = None
-        resources_str = backend_utils.get_task_resources_str(task_copy)
-
         if dryrun:
+            # The resources have been validated against the cluster above;
+            # nothing else is needed for a dryrun.
             logger.info(f'Dryrun complete. Would have run:\n{task}')
             return None
+        if len(task.resources) > 1:
+            # Handle multiple resources exec case.
+            logger.info('Multiple resources are specified '
+                        f'for the task, using: {valid_resource}')
+        # The task is run with valid_resource, which is passed down explicitly
+        # so that the user's task is never copied or mutated here.
+        resources_str = backend_utils.get_task_resources_str(
+            task, resources=valid_resource)
 
-        job_id, log_dir = self._add_job(handle, task_copy.name, resources_str,
+        job_id, log_dir = self._add_job(handle, task.name, resources_str,
                                         task.metadata_json)
 
         num_actual_nodes = task.num_nodes * handle.num_ips_per_node
         # Case: task_lib.Task(run, num_nodes=N) or TPU VM Pods
         if num_actual_nodes > 1:
-            self._execute_task_n_nodes(handle, task_copy, job_id, log_dir)
+            self._execute_task_n_nodes(handle, task, valid_resource, job_id,
+                                       log_dir)
         else:
             # Case: task_lib.Task(run, num_nodes=1)
-            self._execute_task_one_node(handle, task_copy, job_id, log_dir)
+            self._execute_task_one_node(handle, task, valid_resource, job_id,
+                                        log_dir)
 
         return job_id
 
@@ -4608,10 +4813,37 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
 
     def _teardown_ephemeral_storage(self, task: task_lib.Task) -> None:
         storage_mounts = task.storage_mounts
-        if storage_mounts is not None:
-            for _, storage in storage_mounts.items():
-                if not storage.persistent:
-                    storage.delete()
+        if storage_mounts is None:
+            return
+        ephemeral_storages = [
+            storage for storage in storage_mounts.values()
+            if not storage.persistent
+        ]
+
+        def _delete(storage: storage_lib.Storage) -> Optional[Exception]:
+            try:
+                storage.delete()
+            except Exception as e:  # pylint: disable=broad-except
+                return e
+            return None
+
+        # Each deletion is a blocking call to the cloud storage API, so the
+        # storages are deleted in parallel, with the request's config. Failures
+        # are collected so that one failing storage does not leave the others
+        # behind.
+        errors = [
+            e for e in subprocess_utils.run_in_parallel(
+                context_lib.with_current_context(_delete), ephemeral_storages)
+            if e is not None
+        ]
+        if len(errors) == 1:
+            raise errors[0]
+        if errors:
+            error_str = '\n'.join(
+                f'  {common_utils.format_exception(e)}' for e in errors)
+            raise RuntimeError(
+                f'Failed to delete {len(errors)} ephemeral storages:\n'
+                f'{error_str}') from errors[0]
 
     def _teardown(self,
                   handle: CloudVmRayResourceHandle,
@@ -4656,30 +4888,37 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         lock_id = backend_utils.cluster_status_lock_id(cluster_name)
         lock = locks.get_lock(lock_id, timeout=1)
         # Retry in case new cluster operation comes in and holds the lock
-        # right after the lock is removed.
-        n_attempts = 2
-        while True:
-            n_attempts -= 1
-            # We have to kill the cluster requests, because `down` and `stop`
-            # should be higher priority than the cluster requests, and we should
-            # release the lock from other requests.
-            exclude_request_to_kill = 'sky.down' if terminate else 'sky.stop'
-            try:
-                # TODO(zhwu): we should get rid of this when it is being called
-                # internally without involving an API server, e.g., when a
-                # controller is trying to terminate a cluster.
-                requests_lib.kill_cluster_requests(handle.cluster_name,
-                                                   exclude_request_to_kill)
-            except Exception as e:  # pylint: disable=broad-except
-                # We allow the failure to kill other launch requests, because
-                # it is not critical to the cluster teardown.
-                logger.warning(
-                    'Failed to kill other launch requests for the '
-                    f'cluster {handle.cluster_name}: '
-                    f'{common_utils.format_exception(e, use_bracket=True)}')
-            # In case other running cluster operations are still holding the
-            # lock.
-            lock.force_unlock()
+        # right after the lock is removed. Back off with jitter so that
+        # concurrent teardowns do not keep stealing the lock from each other.
+        backoff = common_utils.Backoff(
+            initial_backoff=_TEARDOWN_LOCK_INITIAL_BACKOFF_SECONDS,
+            max_backoff_factor=_TEARDOWN_LOCK_MAX_BACKOFF_FACTOR)
+        for attempt in range(_TEARDOWN_LOCK_MAX_ATTEMPTS):
+            killed_requests = False
+            if attempt > 0:
+                # The lock is held by another request. We have to kill the
+                # cluster requests, because `down` and `stop` should be higher
+                # priority than the cluster requests, and we should release
+                # the lock from other requests.
+                exclude_request_to_kill = ('sky.down'
+                                           if terminate else 'sky.stop')
+                try:
+                    # TODO(zhwu): we should get rid of this when it is being
+                    # called internally without involving an API server, e.g.,
+                    # when a controller is trying to terminate a cluster.
+                    requests_lib.kill_cluster_requests(handle.cluster_name,
+                                                       exclude_request_to_kill)
+                    killed_requests = True
+                except Exception as e:  # pylint: disable=broad-except
+                    # We allow the failure to kill other launch requests,
+                    # because it is not critical to the cluster teardown.
+                    logger.warning(
+                        'Failed to kill other launch requests for the '
+                        f'cluster {handle.cluster_name}: '
+                        f'{common_utils.format_exception(e, use_bracket=True)}')
+                # In case other running cluster operations are still holding
+                # the lock.
+                lock.force_unlock()
             try:
                 with lock:
                     self.teardown_no_lock(
@@ -4692,17 +4931,21 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                         # ClusterOwnerIdentityMismatchError. The argument/flag
                         # `purge` should bypass such ID mismatch errors.
                         refresh_cluster_status=(
-                            not is_identity_mismatch_and_purge))
+                            not is_identity_mismatch_and_purge),
+                        # On a retry, the requests were just killed above,
+                        # right before taking the lock.
+                        already_killed_requests=killed_requests)
                 if terminate:
                     lock.force_unlock()
                 break
             except locks.LockTimeout as e:
-                logger.debug(f'Failed to acquire lock for {cluster_name}, '
-                             f'retrying...')
-                if n_attempts <= 0:
+                if attempt == _TEARDOWN_LOCK_MAX_ATTEMPTS - 1:
                     raise RuntimeError(
                         f'Cluster {cluster_name!r} is locked by {lock_id}. '
                         'Check to see if it is still being launched') from e
+                logger.debug(f'Failed to acquire lock for {cluster_name}, '
+                             f'retrying...')
+                time.sleep(backoff.current_backoff())
 
     # --- CloudVMRayBackend Specific APIs ---
 
@@ -4891,9 +5134,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                                         ).get_log_dirs_for_jobs(request))
                 job_log_dirs = response.job_log_dirs
                 if not job_log_dirs:
-                    logger.info(f'{colorama.Fore.YELLOW}'
-                                'No matching log directories found'
-                                f'{colorama.Style.RESET_ALL}')
+                    logger.info(_NO_MATCHING_LOG_DIRS_MESSAGE)
                     return {}
                 for job_id, log_dir in job_log_dirs.items():
                     # Convert to string for backwards compatibility
@@ -4913,36 +5154,38 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                                                'Failed to sync logs.', stderr)
             job_to_dir = message_utils.decode_payload(stdout)
             if not job_to_dir:
-                logger.info(f'{colorama.Fore.YELLOW}'
-                            'No matching log directories found'
-                            f'{colorama.Style.RESET_ALL}')
+                logger.info(_NO_MATCHING_LOG_DIRS_MESSAGE)
                 return {}
 
-        job_ids = list(job_to_dir.keys())
-        dirs = list(job_to_dir.values())
-        remote_log_dirs = [
-            # TODO(aylei): backward compatibility for legacy runtime that
-            # returns run_timestamp only, remove after 0.12.0
-            (dir if constants.SKY_LOGS_DIRECTORY in dir else os.path.join(
-                constants.SKY_LOGS_DIRECTORY, dir)) for dir in dirs
-        ]
         # Include cluster name in local log directory path to avoid conflicts
         # when the same job_id exists on different clusters
-        cluster_name = handle.cluster_name
-        local_log_dirs = []
-        for remote_log_dir in dirs:
-            if constants.SKY_LOGS_DIRECTORY in remote_log_dir:
+        cluster_local_dir = os.path.join(local_dir, handle.cluster_name)
+        # Expand once; the returned paths keep the caller's unexpanded form.
+        expanded_cluster_local_dir = os.path.expanduser(cluster_local_dir)
+        sky_logs_dir = constants.SKY_LOGS_DIRECTORY
+        job_to_local_dir: Dict[str, str] = {}
+        # (remote_log_dir, expanded local_log_dir) for each job.
+        log_dir_pairs: List[Tuple[str, str]] = []
+        for job_id, log_dir in job_to_dir.items():
+            if sky_logs_dir in log_dir:
+                remote_log_dir = log_dir
                 # Extract the job-specific directory name from the full path
                 # e.g., ~/sky_logs/1-job_name -> 1-job_name
-                job_dir = remote_log_dir.replace(constants.SKY_LOGS_DIRECTORY,
-                                                 '').lstrip('/')
-                local_log_dir = os.path.join(local_dir, cluster_name, job_dir)
+                job_dir = log_dir.replace(sky_logs_dir, '').lstrip('/')
             else:
-                # remote_log_dir is already just the job directory name (e.g.,
+                # TODO(aylei): backward compatibility for legacy runtime that
+                # returns run_timestamp only, remove after 0.12.0
+                remote_log_dir = os.path.join(sky_logs_dir, log_dir)
+                # log_dir is already just the job directory name (e.g.,
                 # "1-job_name")
-                local_log_dir = os.path.join(local_dir, cluster_name,
-                                             remote_log_dir)
-            local_log_dirs.append(local_log_dir)
+                job_dir = log_dir
+            local_log_dir = os.path.join(cluster_local_dir, job_dir)
+            job_to_local_dir[job_id] = local_log_dir
+            expanded_local_log_dir = os.path.join(expanded_cluster_local_dir,
+                                                  job_dir)
+            # Create the local log dir once, rather than once per node.
+            os.makedirs(expanded_local_log_dir, exist_ok=True)
+            log_dir_pairs.append((remote_log_dir, expanded_local_log_dir))
 
         runners = handle.get_command_runners()
         if head_only:
@@ -4954,17 +5197,16 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             """Rsync down logs from remote nodes.
 
             Args:
-                args: A tuple of (runner, local_log_dir, remote_log_dir)
+                args: A tuple of (runner, remote_log_dir, local_log_dir)
             """
-            (runner, local_log_dir, remote_log_dir) = args
+            (runner, remote_log_dir, local_log_dir) = args
             try:
-                os.makedirs(os.path.expanduser(local_log_dir), exist_ok=True)
                 runner.rsync_driver(
                     # Require a `/` at the end to make sure the parent dir
                     # are not created locally. We do not add additional '*' as
                     # kubernetes's rsync does not work with an ending '*'.
                     source=f'{remote_log_dir}/',
-                    target=os.path.expanduser(local_log_dir),
+                    target=local_log_dir,
                     up=False,
                     stream_logs=False,
                 )
@@ -4976,11 +5218,11 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 else:
                     raise
 
-        parallel_args = [[runner, *item]
-                         for item in zip(local_log_dirs, remote_log_dirs)
+        parallel_args = [(runner, *pair)
+                         for pair in log_dir_pairs
                          for runner in runners]
         subprocess_utils.run_in_parallel(_rsync_down, parallel_args)
-        return dict(zip(job_ids, local_log_dirs))
+        return job_to_local_dir
 
     @context_utils.cancellation_guard
     def tail_logs(
@@ -5048,11 +5290,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             logger.info(
                 'Job ID not provided. Streaming the logs of the latest job.')
 
-        # With the stdin=subprocess.DEVNULL, the ctrl-c will not directly
-        # kill the process, so we need to handle it manually here.
-        if threading.current_thread() is threading.main_thread():
-            signal.signal(signal.SIGINT, backend_utils.interrupt_handler)
-            signal.signal(signal.SIGTSTP, backend_utils.stop_handler)
+        _install_interrupt_handlers()
         try:
             final = self.run_on_head(
                 handle,
@@ -5138,11 +5376,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                        f'{log_path}; '
                        f'else echo "No {event} hook log found."; exit 1; fi')
 
-        # With the stdin=subprocess.DEVNULL, the ctrl-c will not directly
-        # kill the process, so we need to handle it manually here.
-        if threading.current_thread() is threading.main_thread():
-            signal.signal(signal.SIGINT, backend_utils.interrupt_handler)
-            signal.signal(signal.SIGTSTP, backend_utils.stop_handler)
+        _install_interrupt_handlers()
         try:
             returncode = self.run_on_head(
                 handle,
@@ -5170,11 +5404,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         code = managed_jobs.ManagedJobCodeGen.stream_logs(
             job_name, job_id, follow, controller, tail, tail_offset, task)
 
-        # With the stdin=subprocess.DEVNULL, the ctrl-c will not directly
-        # kill the process, so we need to handle it manually here.
-        if threading.current_thread() is threading.main_thread():
-            signal.signal(signal.SIGINT, backend_utils.interrupt_handler)
-            signal.signal(signal.SIGTSTP, backend_utils.stop_handler)
+        _install_interrupt_handlers()
 
         # Refer to the notes in tail_logs.
         try:
@@ -5211,7 +5441,15 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         # if job_name and job_id should not both be specified
         assert job_name is None or job_id is None, (job_name, job_id)
 
-        if job_id is None:
+        # {job_id: run_timestamp}, filled in early when it is known without a
+        # separate lookup.
+        run_timestamps: Optional[Dict[Any, str]] = None
+        if job_id is not None and not controller:
+            # The job logs are streamed into a file below, so the run
+            # timestamp would only name the local directory. Derive the name
+            # from the job id to save a round-trip to the controller.
+            run_timestamps = {job_id: f'managed-jobs-{job_id}'}
+        elif job_id is None:
             # get the job_id
             # if job_name is None, get all job_ids
             # TODO: Only get the latest job_id, since that's the only one we use
@@ -5231,7 +5469,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                     logger.debug(f'gRPC failed, falling back to SSH: {e}')
                     use_legacy = True
 
-            if use_legacy:
+            if use_legacy and isinstance(handle, LocalResourcesHandle):
                 code = managed_jobs.ManagedJobCodeGen.get_all_job_ids_by_name(
                     job_name=job_name)
                 returncode, job_ids_payload, stderr = self.run_on_head(
@@ -5244,6 +5482,24 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                                                    'Failed to sync down logs.',
                                                    stderr)
                 job_ids = message_utils.decode_payload(job_ids_payload)
+            elif use_legacy:
+                # Look up the job ids and the latest job's log dir together
+                # to save an SSH round-trip.
+                code = (managed_jobs.ManagedJobCodeGen.
+                        get_latest_job_log_dir_by_name(job_name=job_name))
+                returncode, payload, stderr = self.run_on_head(
+                    handle,
+                    code,
+                    stream_logs=False,
+                    require_outputs=True,
+                    separate_stderr=True)
+                subprocess_utils.handle_returncode(returncode, code,
+                                                   'Failed to sync down logs.',
+                                                   stderr)
+                job_ids = message_utils.decode_payload(payload,
+                                                       payload_type='job_ids')
+                run_timestamps = message_utils.decode_payload(
+                    payload, payload_type='log_dirs')
             if not job_ids:
                 logger.info(f'{colorama.Fore.YELLOW}'
                             'No matching job found'
@@ -5268,7 +5524,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             run_timestamps = {
                 job_id: f'managed-jobs-consolidation-mode-{job_id}'
             }
-        else:
+        elif run_timestamps is None:
             # get the run_timestamp
             # the function takes in [job_id]
             use_legacy = not handle.is_grpc_enabled_with_flag
@@ -5306,13 +5562,10 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 run_timestamps = message_utils.decode_payload(
                     run_timestamps_payload)
         if not run_timestamps:
-            logger.info(f'{colorama.Fore.YELLOW}'
-                        'No matching log directories found'
-                        f'{colorama.Style.RESET_ALL}')
+            logger.info(_NO_MATCHING_LOG_DIRS_MESSAGE)
             return {}
 
-        run_timestamp = list(run_timestamps.values())[0]
-        job_id = list(run_timestamps.keys())[0]
+        job_id, run_timestamp = next(iter(run_timestamps.items()))
 
         # If run_timestamp contains the full path with SKY_LOGS_DIRECTORY,
         # strip the prefix to get just the relative part to avoid duplication
@@ -5326,8 +5579,8 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                                       f'{job_id}.log')
             local_log_dir = os.path.join(local_dir, 'managed_jobs',
                                          run_timestamp)
-            os.makedirs(os.path.dirname(os.path.expanduser(local_log_dir)),
-                        exist_ok=True)
+            # Create the local log dir once, rather than once per node.
+            os.makedirs(os.path.expanduser(local_log_dir), exist_ok=True)
 
             logger.debug(f'{colorama.Fore.CYAN}'
                          f'Job {job_id} local logs: {local_log_dir}'
@@ -5343,8 +5596,6 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 """
                 (runner, local_log_dir, remote_log) = args
                 try:
-                    os.makedirs(os.path.expanduser(local_log_dir),
-                                exist_ok=True)
                     runner.rsync(
                         source=remote_log,
                         target=f'{local_log_dir}/controller.log',
@@ -5367,9 +5618,9 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         else:  # download job logs
             local_log_dir = os.path.join(local_dir, 'managed_jobs',
                                          run_timestamp)
-            os.makedirs(os.path.dirname(os.path.expanduser(local_log_dir)),
-                        exist_ok=True)
-            log_file = os.path.join(local_log_dir, 'run.log')
+            expanded_local_log_dir = os.path.expanduser(local_log_dir)
+            os.makedirs(os.path.dirname(expanded_local_log_dir), exist_ok=True)
+            log_file = os.path.join(expanded_local_log_dir, 'run.log')
 
             # TODO(kevin): Migrate stream_logs to gRPC
             code = managed_jobs.ManagedJobCodeGen.stream_logs(
@@ -5377,18 +5628,14 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 job_id=int(job_id),
                 follow=False,
                 controller=False)
-            # With the stdin=subprocess.DEVNULL, the ctrl-c will not
-            # kill the process, so we need to handle it manually here.
-            if threading.current_thread() is threading.main_thread():
-                signal.signal(signal.SIGINT, backend_utils.interrupt_handler)
-                signal.signal(signal.SIGTSTP, backend_utils.stop_handler)
+            _install_interrupt_handlers()
 
             # We redirect the output to the log file
             # and disable the STDOUT and STDERR
             self.run_on_head(
                 handle,
                 code,
-                log_path=os.path.expanduser(log_file),
+                log_path=log_file,
                 stream_logs=False,
                 process_stream=False,
                 ssh_mode=command_runner.SshMode.INTERACTIVE,
@@ -5405,7 +5652,8 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                          purge: bool = False,
                          post_teardown_cleanup: bool = True,
                          refresh_cluster_status: bool = True,
-                         remove_from_db: bool = True) -> None:
+                         remove_from_db: bool = True,
+                         already_killed_requests: bool = False) -> None:
         """Teardown the cluster without acquiring the cluster status lock.
 
         NOTE: This method should not be called without holding the cluster
@@ -5414,6 +5662,10 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         refresh_cluster_status is only used internally in the status refresh
         process, and should not be set to False in other cases.
 
+        already_killed_requests is set by _teardown when it retries the lock,
+        as it kills the other requests on the cluster right before acquiring
+        the lock again.
+
         Raises:
             RuntimeError: If the cluster fails to be terminated/stopped.
         """
@@ -5426,25 +5678,26 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 f'{handle.cluster_name}: '
                 f'{common_utils.format_exception(e, use_bracket=True)}')
 
-        exclude_request_to_kill = 'sky.down' if terminate else 'sky.stop'
-        # We have to kill the cluster requests again within the lock, because
+        # We have to kill the cluster requests within the lock, because
         # any pending requests on the same cluster should be cancelled after
         # the cluster is terminated/stopped. Otherwise, it will be quite
         # confusing to see the cluster restarted immediately after it is
         # terminated/stopped, when there is a pending launch request.
-        try:
-            # TODO(zhwu): we should get rid of this when it is being called
-            # internally without involving an API server, e.g., when a
-            # controller is trying to terminate a cluster.
-            requests_lib.kill_cluster_requests(handle.cluster_name,
-                                               exclude_request_to_kill)
-        except Exception as e:  # pylint: disable=broad-except
-            # We allow the failure to kill other launch requests, because
-            # it is not critical to the cluster teardown.
-            logger.warning(
-                'Failed to kill other launch requests for the '
-                f'cluster {handle.cluster_name}: '
-                f'{common_utils.format_exception(e, use_bracket=True)}')
+        if not already_killed_requests:
+            exclude_request_to_kill = 'sky.down' if terminate else 'sky.stop'
+            try:
+                # TODO(zhwu): we should get rid of this when it is being called
+                # internally without involving an API server, e.g., when a
+                # controller is trying to terminate a cluster.
+                requests_lib.kill_cluster_requests(handle.cluster_name,
+                                                   exclude_request_to_kill)
+            except Exception as e:  # pylint: disable=broad-except
+                # We allow the failure to kill other launch requests, because
+                # it is not critical to the cluster teardown.
+                logger.warning(
+                    'Failed to kill other launch requests for the '
+                    f'cluster {handle.cluster_name}: '
+                    f'{common_utils.format_exception(e, use_bracket=True)}')
         cluster_status_fetched = False
         if refresh_cluster_status:
             try:
@@ -5513,10 +5766,16 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 clouds.ProvisionerVersion.RAY_PROVISIONER_SKYPILOT_TERMINATOR):
             logger.debug(f'Provisioner version: {cloud.PROVISIONER_VERSION} '
                          'using new provisioner for teardown.')
-            # Stop the ray autoscaler first to avoid the head node trying to
-            # re-launch the worker nodes, during the termination of the
-            # cluster.
-            if handle.provision_runtime_metadata.has_ray:
+            # Stop ray on the head node first, so that it shuts down cleanly
+            # before the nodes are stopped. Terminated nodes are deleted
+            # together with their ray processes, and the SkyPilot provisioner
+            # does not run the ray autoscaler that could relaunch workers, so
+            # this round-trip is skipped on termination.
+            if terminate and (cloud.PROVISIONER_VERSION >=
+                              clouds.ProvisionerVersion.SKYPILOT):
+                logger.debug('Skipping ray stop, as the cluster is being '
+                             'terminated.')
+            elif handle.provision_runtime_metadata.has_ray:
                 try:
                     # We do not check the return code, since Ray returns
                     # non-zero return code when calling Ray stop,
@@ -5550,20 +5809,13 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                                 e, use_bracket=True)))
                 else:
                     raise
-
-            if post_teardown_cleanup:
-                self.post_teardown_cleanup(handle, terminate, purge,
-                                           remove_from_db)
-            return
-
-        if (isinstance(cloud, clouds.IBM) and terminate and
-                prev_cluster_status == status_lib.ClusterStatus.STOPPED):
+        elif (isinstance(cloud, clouds.IBM) and terminate and
+              prev_cluster_status == status_lib.ClusterStatus.STOPPED):
             # pylint: disable= W0622 W0703 C0415
             from sky.adaptors import ibm
             from sky.skylet.providers.ibm.vpc_provider import IBMVPCProvider
 
-            config_provider = global_user_state.get_cluster_yaml_dict(
-                handle.cluster_yaml)['provider']
+            config_provider = config['provider']
             region = config_provider['region']
             search_client = ibm.search_client()
             vpc_found = False
@@ -5571,8 +5823,10 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             vpcs_filtered_by_tags_and_region = search_client.search(
                 query=(f'type:vpc AND tags:{cluster_name_on_cloud} '
                        f'AND region:{region}'),
-                fields=['tags', 'region', 'type'],
-                limit=1000).get_result()['items']
+                # Only the crn of the first match is used; the query already
+                # constrains the tags, region and type.
+                fields=['crn'],
+                limit=1).get_result()['items']
             vpc_id = None
             try:
                 vpc_id = vpcs_filtered_by_tags_and_region[0]['crn'].rsplit(
@@ -5592,12 +5846,19 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 returncode = 0
 
         else:
-            config['provider']['cache_stopped_nodes'] = not terminate
+            # Copy rather than modify the config, which is reused by the
+            # post teardown cleanup below.
+            ray_down_config = dict(config,
+                                   provider=dict(
+                                       config['provider'],
+                                       cache_stopped_nodes=not terminate))
+            # The temporary yaml is only read by `ray down` below, so remove
+            # it once the teardown finishes.
             with tempfile.NamedTemporaryFile('w',
                                              prefix='sky_',
-                                             delete=False,
+                                             delete=True,
                                              suffix='.yml') as f:
-                yaml_utils.dump_yaml(f.name, config)
+                f.write(yaml_utils.dump_yaml_str(ray_down_config))
                 f.flush()
 
                 teardown_verb = 'Terminating' if terminate else 'Stopping'
@@ -5646,14 +5907,19 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         # (i.e., prev_status is None), as the cleanup has already been done
         # if the cluster is removed from the status table.
         if post_teardown_cleanup:
-            self.post_teardown_cleanup(handle, terminate, purge)
+            self.post_teardown_cleanup(handle,
+                                       terminate,
+                                       purge,
+                                       remove_from_db,
+                                       config=config)
 
     def post_teardown_cleanup(self,
                               handle: CloudVmRayResourceHandle,
                               terminate: bool,
                               purge: bool = False,
                               remove_from_db: bool = True,
-                              failover: bool = False) -> None:
+                              failover: bool = False,
+                              config: Optional[Dict[str, Any]] = None) -> None:
         """Cleanup local configs/caches and delete TPUs after teardown.
 
         This method will handle the following cleanup steps:
@@ -5665,11 +5931,21 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
           Direct if failover is False, otherwise, only delete the subnets);
         * Updating the local state of the cluster;
         * Removing the terminated cluster's scripts and ray yaml files.
+
+        Args:
+            config: The cluster yaml config, if the caller has already loaded
+                it. The config does not change during teardown, so it is
+                loaded at most once here.
         """
         cluster_name_on_cloud = handle.cluster_name_on_cloud
         cloud = handle.launched_resources.cloud
+        # The nodes are gone (or stopped and may come back with new IPs), so
+        # drop the runners cached earlier in this request. The cache sits
+        # under the cancellation guard, hence the __wrapped__.
+        get_command_runners = CloudVmRayResourceHandle.get_command_runners
+        get_command_runners.__wrapped__.cache_clear()  # type: ignore
 
-        if terminate and handle.launched_resources.is_image_managed is True:
+        def _delete_cloned_image() -> bool:
             # Delete the image when terminating a "cloned" cluster, i.e.,
             # whose image is created by SkyPilot (--clone-disk-from)
             logger.debug(f'Deleting image {handle.launched_resources.image_id}')
@@ -5678,7 +5954,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             image_dict = cluster_resources.image_id
             assert cluster_cloud is not None, cluster_resources
             assert image_dict is not None and len(image_dict) == 1
-            image_id = list(image_dict.values())[0]
+            image_id = next(iter(image_dict.values()))
             try:
                 cluster_cloud.delete_image(image_id,
                                            handle.launched_resources.region)
@@ -5687,7 +5963,63 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                     f'Failed to delete cloned image {image_id}. Please '
                     'remove it manually to avoid image leakage. Details: '
                     f'{common_utils.format_exception(e, use_bracket=True)}')
+            return True
+
+        def _cleanup_ports(
+                cloud: clouds.Cloud, provider_config: Dict[str, Any],
+                unsupported_features: Set[clouds.CloudImplementationFeatures]
+        ) -> bool:
+            """Returns whether the ports are cleaned up."""
+            if (clouds.CloudImplementationFeatures.OPEN_PORTS
+                    in unsupported_features):
+                return True
+            try:
+                provision_lib.cleanup_ports(repr(cloud), cluster_name_on_cloud,
+                                            handle.launched_resources.ports,
+                                            provider_config)
+            except exceptions.PortDoesNotExistError:
+                logger.debug('Ports do not exist. Skipping cleanup.')
+            except Exception as e:  # pylint: disable=broad-except
+                if purge:
+                    msg = common_utils.format_exception(e, use_bracket=True)
+                    logger.warning(
+                        f'Failed to cleanup ports. Skipping since purge is '
+                        f'set. Details: {msg}')
+                    return False
+                raise
+            return True
+
+        def _cleanup_custom_multi_network(
+                cloud: clouds.Cloud, provider_config: Dict[str, Any],
+                unsupported_features: Set[clouds.CloudImplementationFeatures]
+        ) -> bool:
+            """Returns whether the custom multi networks are cleaned up."""
+            # Clean up custom multi networks, e.g. the subnets, firewalls,
+            # and VPCs created for GCP GPUDirect TCPX
+            if (clouds.CloudImplementationFeatures.CUSTOM_MULTI_NETWORK
+                    in unsupported_features):
+                return True
+            try:
+                provision_lib.cleanup_custom_multi_network(
+                    repr(cloud), cluster_name_on_cloud, provider_config,
+                    failover)
+            except Exception as e:  # pylint: disable=broad-except
+                if purge:
+                    msg = common_utils.format_exception(e, use_bracket=True)
+                    logger.warning(
+                        f'Failed to cleanup custom multi network. Skipping '
+                        f'since purge is set. Details: {msg}')
+                    return False
+                raise
+            return True
+
         if terminate:
+            # These cleanups are independent cloud API calls, so they are run
+            # concurrently, with the request's config. Each returns whether
+            # its cleanup succeeded.
+            cleanup_fns: List[Callable[[], bool]] = []
+            if handle.launched_resources.is_image_managed is True:
+                cleanup_fns.append(_delete_cloned_image)
             # This function could be directly called from status refresh,
             # where we need to cleanup the cluster profile.
             metadata_utils.remove_cluster_metadata(handle.cluster_name)
@@ -5697,62 +6029,54 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 launched_resources = (
                     handle.launched_resources.assert_launchable())
                 cloud = launched_resources.cloud
-                config = global_user_state.get_cluster_yaml_dict(
-                    handle.cluster_yaml)
-                ports_cleaned_up = False
-                custom_multi_network_cleaned_up = False
-                try:
-                    cloud.check_features_are_supported(
-                        launched_resources,
-                        {clouds.CloudImplementationFeatures.OPEN_PORTS})
-                    provision_lib.cleanup_ports(repr(cloud),
-                                                cluster_name_on_cloud,
-                                                handle.launched_resources.ports,
-                                                config['provider'])
-                    ports_cleaned_up = True
-                except exceptions.NotSupportedError:
-                    ports_cleaned_up = True
-                except exceptions.PortDoesNotExistError:
-                    logger.debug('Ports do not exist. Skipping cleanup.')
-                    ports_cleaned_up = True
-                except Exception as e:  # pylint: disable=broad-except
-                    if purge:
-                        msg = common_utils.format_exception(e, use_bracket=True)
-                        logger.warning(
-                            f'Failed to cleanup ports. Skipping since purge is '
-                            f'set. Details: {msg}')
-                    else:
-                        raise
-
-                # Clean up custom multi networks, e.g. the subnets, firewalls,
-                # and VPCs created for GCP GPUDirect TCPX
+                if config is None:
+                    config = global_user_state.get_cluster_yaml_dict(
+                        handle.cluster_yaml)
+                provider_config = config['provider']
+                network_features_checked = False
                 try:
-                    cloud.check_features_are_supported(
-                        handle.launched_resources, {
+                    # Check both features with a single lookup, which can be
+                    # slow on some clouds (e.g. it queries the Kubernetes
+                    # cluster).
+                    unsupported_features = cloud.get_unsupported_features(
+                        launched_resources, {
+                            clouds.CloudImplementationFeatures.OPEN_PORTS,
                             clouds.CloudImplementationFeatures.
                             CUSTOM_MULTI_NETWORK
                         })
-                    provision_lib.cleanup_custom_multi_network(
-                        repr(cloud), cluster_name_on_cloud, config['provider'],
-                        failover)
-                    custom_multi_network_cleaned_up = True
-                except exceptions.NotSupportedError:
-                    custom_multi_network_cleaned_up = True
+                    network_features_checked = True
                 except Exception as e:  # pylint: disable=broad-except
                     if purge:
                         msg = common_utils.format_exception(e, use_bracket=True)
                         logger.warning(
-                            f'Failed to cleanup custom multi network. Skipping '
-                            f'since purge is set. Details: {msg}')
+                            f'Failed to check the network features of the '
+                            f'cluster. Skipping cleanup of ports and custom '
+                            f'multi network since purge is set. Details: {msg}')
                     else:
                         raise
+                if network_features_checked:
+                    cleanup_fns.append(
+                        functools.partial(_cleanup_ports, cloud,
+                                          provider_config,
+                                          unsupported_features))
+                    cleanup_fns.append(
+                        functools.partial(_cleanup_custom_multi_network, cloud,
+                                          provider_config,
+                                          unsupported_features))
+            cleanup_results = subprocess_utils.run_in_parallel(
+                context_lib.with_current_context(lambda fn: fn()), cleanup_fns)
+            if handle.cluster_yaml is not None:
+                # Both the ports and the custom multi networks must be cleaned
+                # up before the cluster config can be removed.
+                ports_and_network_cleaned_up = (network_features_checked and
+                                                all(cleanup_results[-2:]))
 
                 # Clean up all cluster resources (e.g., Kubernetes services).
                 # This is a no-op for most clouds, but Kubernetes needs it to
                 # clean up orphaned services when pods are deleted externally.
                 try:
                     provision_lib.cleanup_cluster_resources(
-                        repr(cloud), cluster_name_on_cloud, config['provider'])
+                        repr(cloud), cluster_name_on_cloud, provider_config)
                 except Exception as e:  # pylint: disable=broad-except
                     if purge:
                         msg = common_utils.format_exception(e, use_bracket=True)
@@ -5762,7 +6086,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                     else:
                         raise
 
-                if ports_cleaned_up and custom_multi_network_cleaned_up:
+                if ports_and_network_cleaned_up:
                     try:
                         self.remove_cluster_config(handle)
                     except Exception as e:  # pylint: disable=broad-except
@@ -5778,7 +6102,8 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         cluster_utils.SSHConfigHelper.remove_cluster(handle.cluster_name)
 
         def _detect_abnormal_non_terminated_nodes(
-                handle: CloudVmRayResourceHandle) -> None:
+                handle: CloudVmRayResourceHandle,
+                provider_config: Dict[str, Any]) -> None:
             # Confirm that instances have actually transitioned state before
             # updating the state database. We do this immediately before
             # removing the state from the database, so that we can guarantee
@@ -5790,16 +6115,17 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             # terminate_instances. See
             # https://github.com/skypilot-org/skypilot/pull/4443#discussion_r1872798032
             attempts = 0
+            waited_seconds = 0.0
+            backoff = common_utils.Backoff(
+                initial_backoff=_TEARDOWN_WAIT_INITIAL_BACKOFF_SECONDS,
+                max_backoff_factor=_TEARDOWN_WAIT_MAX_BACKOFF_FACTOR)
             while True:
-                config = global_user_state.get_cluster_yaml_dict(
-                    handle.cluster_yaml)
-
                 logger.debug(f'instance statuses attempt {attempts + 1}')
                 node_status_dict = provision_lib.query_instances(
                     repr(cloud),
                     handle.cluster_name,
                     cluster_name_on_cloud,
-                    config['provider'],
+                    provider_config,
                     non_terminated_only=False)
 
                 unexpected_nodes = []
@@ -5807,21 +6133,18 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                     node_status, reason = node_status_tuple
                     reason_str = '' if reason is None else f' ({reason})'
                     logger.debug(f'{node_id} status: {node_status}{reason_str}')
-                    # FIXME(cooperc): Some clouds (e.g. GCP) do not distinguish
-                    # between "stopping/stopped" and "terminating/terminated",
-                    # so we allow for either status instead of casing on
-                    # `terminate`.
-                    if node_status not in [
-                            None, status_lib.ClusterStatus.STOPPED
-                    ]:
+                    if node_status not in _TEARDOWN_DONE_NODE_STATUSES:
                         unexpected_nodes.append((node_id, node_status, reason))
 
                 if not unexpected_nodes:
                     break
 
                 attempts += 1
-                if attempts < _TEARDOWN_WAIT_MAX_ATTEMPTS:
-                    time.sleep(_TEARDOWN_WAIT_BETWEEN_ATTEMPS_SECONDS)
+                wait_seconds = backoff.current_backoff()
+                if (waited_seconds + wait_seconds <=
+                        _TEARDOWN_WAIT_MAX_TOTAL_SECONDS):
+                    time.sleep(wait_seconds)
+                    waited_seconds += wait_seconds
                 else:
                     unexpected_nodes_str = '\n'.join([
                         f'  - {node_id}: {node_status}' +
@@ -5834,8 +6157,12 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         # If cluster_yaml is None, the cluster should ensured to be terminated,
         # so we don't need to do the double check.
         if handle.cluster_yaml is not None:
+            if config is None:
+                config = global_user_state.get_cluster_yaml_dict(
+                    handle.cluster_yaml)
             try:
-                _detect_abnormal_non_terminated_nodes(handle)
+                _detect_abnormal_non_terminated_nodes(handle,
+                                                      config['provider'])
             except exceptions.ClusterStatusFetchingError as e:
                 if purge:
                     msg = common_utils.format_exception(e, use_bracket=True)
@@ -6298,21 +6625,25 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             # to all resources.
             one_task_resource = list(task.resources)[0]
 
-            # Assume resources share the same ports.
+            # Assume resources share the same ports. Docker login should also
+            # always be the same for all resources, since it's set from envs.
             for resource in task.resources:
                 assert resource.ports == one_task_resource.ports
-            requested_ports_set = resources_utils.port_ranges_to_set(
-                one_task_resource.ports)
-            current_ports_set = resources_utils.port_ranges_to_set(
-                handle.launched_resources.ports)
-            all_ports = resources_utils.port_set_to_ranges(current_ports_set |
-                                                           requested_ports_set)
+                assert (resource.docker_login_config ==
+                        one_task_resource.docker_login_config), (
+                            resource.docker_login_config,
+                            one_task_resource.docker_login_config)
+            requested_ports = one_task_resource.ports
+            current_ports = handle.launched_resources.ports
+            all_ports = resources_utils.merge_port_ranges(
+                current_ports, requested_ports)
             to_provision = handle.launched_resources
             assert to_provision is not None
             to_provision = to_provision.assert_launchable()
             if (to_provision.cloud.OPEN_PORTS_VERSION <=
                     clouds.OpenPortsVersion.LAUNCH_ONLY):
-                if not requested_ports_set <= current_ports_set:
+                if not resources_utils.port_ranges_cover(
+                        current_ports, requested_ports):
                     current_cloud = to_provision.cloud
                     with ux_utils.print_exception_no_traceback():
                         raise exceptions.NotSupportedError(
@@ -6323,13 +6654,6 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                             'a new cluster with the desired ports open.')
             if all_ports:
                 to_provision = to_provision.copy(ports=all_ports)
-            # Docker login should always be the same for all resources, since
-            # it's set from envs.
-            for resource in task.resources:
-                assert (resource.docker_login_config ==
-                        one_task_resource.docker_login_config), (
-                            resource.docker_login_config,
-                            one_task_resource.docker_login_config)
             # If we have docker login config in the new task, override the
             # existing resources to pick up new credentials. This allows the
             # user to specify new or fixed credentials if the existing
@@ -6563,7 +6887,6 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
         #  (2) then, create symlinks from '/.../file' to '<prefix>/.../file'.
         if file_mounts is None or not file_mounts:
             return
-        symlink_commands = []
         fore = colorama.Fore
         style = colorama.Style
         start = time.time()
@@ -6573,30 +6896,28 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             file_mounts, str(handle.launched_resources.cloud))
 
         # Check the files and warn
-        for dst, src in file_mounts.items():
+        full_srcs: Dict[str, str] = {}
+        for src in file_mounts.values():
             if not data_utils.is_cloud_store_url(src):
                 full_src = os.path.abspath(os.path.expanduser(src))
                 # Checked during Task.set_file_mounts().
                 assert os.path.exists(
                     full_src), f'{full_src} does not exist. {file_mounts}'
-                src_size = backend_utils.path_size_megabytes(full_src)
-                if src_size >= _PATH_SIZE_MEGABYTES_WARN_THRESHOLD:
-                    logger.warning(
-                        f'  {fore.YELLOW}The size of file mount src {src!r} '
-                        f'is {src_size} MB. Try to keep src small or use '
-                        '.skyignore to exclude large files, as large sizes '
-                        f'will slow down rsync. {style.RESET_ALL}')
-                if os.path.islink(full_src):
-                    logger.warning(
-                        f'  {fore.YELLOW}Source path {src!r} is a symlink. '
-                        f'Symlink contents are not uploaded.{style.RESET_ALL}')
+                full_srcs[src] = full_src
+        for src, full_src in full_srcs.items():
+            if os.path.islink(full_src):
+                logger.warning(
+                    f'  {fore.YELLOW}Source path {src!r} is a symlink. '
+                    f'Symlink contents are not uploaded.{style.RESET_ALL}')
 
-        os.makedirs(os.path.expanduser(self.log_dir), exist_ok=True)
-        os.system(f'touch {log_path}')
+        self._ensure_local_log_dir()
+        backend_utils.touch(log_path)
 
         rich_utils.force_update_status(
             ux_utils.spinner_message('Syncing file mounts', log_path))
 
+        # (dst, transfer) of each file mount.
+        transfers: List[Tuple[str, backend_utils.DataTransfer]] = []
         for dst, src in file_mounts.items():
             # TODO: room for improvement.  Here there are many moving parts
             # (download gsutil on remote, run gsutil on remote).  Consider
@@ -6606,35 +6927,44 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 dst = f'{SKY_REMOTE_WORKDIR}/{dst}'
             # Sync 'src' to 'wrapped_dst', a safe-to-write "wrapped" path.
             wrapped_dst = dst
+            symlink_command = None
             if not dst.startswith('~/') and not dst.startswith('/tmp/'):
                 # Handles the remote paths possibly without write access.
                 # (1) add <prefix> to these target paths.
                 wrapped_dst = backend_utils.FileMountHelper.wrap_file_mount(dst)
-                cmd = backend_utils.FileMountHelper.make_safe_symlink_command(
-                    source=dst, target=wrapped_dst)
-                symlink_commands.append(cmd)
-
-            if not data_utils.is_cloud_store_url(src):
-                full_src = os.path.abspath(os.path.expanduser(src))
-
+                # (2) create the symlink in the same command that prepares
+                # the wrapped path, as the symlink does not depend on the
+                # synced content. This saves a separate round of commands on
+                # all the nodes after the sync.
+                # ALIAS_SUDO_TO_EMPTY_FOR_ROOT_CMD sets sudo to empty string
+                # for root. We need this as we do not source bashrc for the
+                # rsync command for better performance, and our sudo handling
+                # is only in bashrc.
+                symlink_command = (
+                    f'{command_runner.ALIAS_SUDO_TO_EMPTY_FOR_ROOT_CMD} && ' +
+                    backend_utils.FileMountHelper.make_safe_symlink_command(
+                        source=dst, target=wrapped_dst))
+
+            # Local sources were resolved while checking the files above.
+            full_src = full_srcs.get(src)
+            if full_src is not None:
                 if os.path.isfile(full_src):
                     mkdir_for_wrapped_dst = (
                         f'mkdir -p {os.path.dirname(wrapped_dst)}')
                 else:
                     mkdir_for_wrapped_dst = f'mkdir -p {wrapped_dst}'
+                prepare_commands = [mkdir_for_wrapped_dst]
+                if symlink_command is not None:
+                    prepare_commands.append(symlink_command)
 
                 # TODO(mluo): Fix method so that mkdir and rsync run together
-                backend_utils.parallel_data_transfer_to_nodes(
-                    runners,
-                    source=src,
-                    target=wrapped_dst,
-                    cmd=mkdir_for_wrapped_dst,
-                    run_rsync=True,
-                    action_message='Syncing',
-                    log_path=log_path,
-                    stream_logs=False,
-                    num_threads=num_threads,
-                )
+                transfers.append((dst,
+                                  backend_utils.DataTransfer(
+                                      source=src,
+                                      target=wrapped_dst,
+                                      cmd=' && '.join(prepare_commands),
+                                      run_rsync=True,
+                                      action_message='Syncing')))
                 continue
 
             storage = cloud_stores.get_storage_from_path(src)
@@ -6656,41 +6986,60 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                 # Both the wrapped and the symlink dir exist; sync.
                 sync_cmd,
             ]
+            if symlink_command is not None:
+                download_target_commands.append(symlink_command)
             command = ' && '.join(download_target_commands)
             # dst is only used for message printing.
-            backend_utils.parallel_data_transfer_to_nodes(
-                runners,
-                source=src,
-                target=dst,
-                cmd=command,
-                run_rsync=False,
-                action_message='Syncing',
-                log_path=log_path,
-                stream_logs=False,
-                # Need to source bashrc, as the cloud specific CLI or SDK may
-                # require PATH in bashrc.
-                source_bashrc=True,
-                num_threads=num_threads,
-            )
-        # (2) Run the commands to create symlinks on all the nodes.
-        symlink_command = ' && '.join(symlink_commands)
-        if symlink_command:
-            # ALIAS_SUDO_TO_EMPTY_FOR_ROOT_CMD sets sudo to empty string for
-            # root. We need this as we do not source bashrc for the command for
-            # better performance, and our sudo handling is only in bashrc.
-            symlink_command = (
-                f'{command_runner.ALIAS_SUDO_TO_EMPTY_FOR_ROOT_CMD} && '
-                f'{symlink_command}')
-
-            def _symlink_node(runner: command_runner.CommandRunner):
-                returncode = runner.run(symlink_command, log_path=log_path)
-                subprocess_utils.handle_returncode(
-                    returncode, symlink_command,
-                    'Failed to create symlinks. The target destination '
-                    f'may already exist. Log: {log_path}')
+            transfers.append((
+                dst,
+                backend_utils.DataTransfer(
+                    source=src,
+                    target=dst,
+                    cmd=command,
+                    run_rsync=False,
+                    action_message='Syncing',
+                    # Need to source bashrc, as the cloud specific CLI or SDK
+                    # may require PATH in bashrc.
+                    source_bashrc=True)))
+        # Run the transfers of all the file mounts in one thread pool, so
+        # that they run in parallel with each other and across the nodes.
+        # Destinations nested in each other are synced in order instead, so
+        # that the later file mounts still take precedence.
+        if _has_nested_paths([transfer_dst for transfer_dst, _ in transfers]):
+            transfer_batches = [[transfer] for _, transfer in transfers]
+        else:
+            transfer_batches = [[transfer for _, transfer in transfers]]
 
-            subprocess_utils.run_in_parallel(_symlink_node, runners,
-                                             num_threads)
+        def _sync_transfers() -> None:
+            for transfer_batch in transfer_batches:
+                backend_utils.parallel_data_transfers_to_nodes(
+                    runners,
+                    transfer_batch,
+                    log_path=log_path,
+                    stream_logs=False,
+                    num_threads=num_threads,
+                )
+
+        def _warn_large_srcs() -> None:
+            src_sizes = subprocess_utils.run_in_parallel(
+                backend_utils.path_size_megabytes, list(full_srcs.values()),
+                num_threads)
+            for src, src_size in zip(full_srcs, src_sizes):
+                if src_size >= _PATH_SIZE_MEGABYTES_WARN_THRESHOLD:
+                    logger.warning(
+                        f'  {fore.YELLOW}The size of file mount src {src!r} '
+                        f'is {src_size} MB. Try to keep src small or use '
+                        '.skyignore to exclude large files, as large sizes '
+                        f'will slow down rsync. {style.RESET_ALL}')
+
+        # Estimating the size of a src runs an rsync dry run over it. The
+        # sizes are only used for warnings, so they are estimated while the
+        # file mounts are synced, and warned about as soon as they are known.
+        # The results are collected in order, so the warnings are printed
+        # before an error from the sync is raised.
+        subprocess_utils.run_in_parallel(
+            context_lib.with_current_context(lambda func: func()),
+            [_warn_large_srcs, _sync_transfers], 2)
         end = time.time()
         logger.debug(f'File mount sync took {end - start} seconds.')
         logger.info(ux_utils.finishing_message('Synced file_mounts.', log_path))
@@ -6729,6 +7078,9 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             ux_utils.spinner_message(
                 f'Mounting {len(storage_mounts)} storage{plural}', log_path))
 
+        transfers: List[backend_utils.DataTransfer] = []
+        # Maps each mount command to its mount path, for error messages.
+        mount_dsts: Dict[str, str] = {}
         for dst, storage_obj in storage_mounts.items():
             storage_obj.construct()
             if not os.path.isabs(dst) and not dst.startswith('~/'):
@@ -6743,7 +7095,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                         'verify that the bucket exists. The cluster started '
                         'successfully without mounting the bucket.')
             # Get the first store and use it to mount
-            store = list(storage_obj.stores.values())[0]
+            store = next(iter(storage_obj.stores.values()))
             assert store is not None, storage_obj
             if storage_obj.mode == storage_lib.StorageMode.MOUNT:
                 read_only = bool(storage_obj.mount_config and
@@ -6768,49 +7120,64 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
                          if storage_obj.source else storage_obj.name)
             if isinstance(src_print, list):
                 src_print = ', '.join(src_print)
-            try:
-                backend_utils.parallel_data_transfer_to_nodes(
-                    runners,
+            mount_dsts[mount_cmd] = dst
+            transfers.append(
+                backend_utils.DataTransfer(
                     source=src_print,
                     target=dst,
                     cmd=mount_cmd,
                     run_rsync=False,
                     action_message=action_message,
-                    log_path=log_path,
                     # Need to source bashrc, as the cloud specific CLI or SDK
                     # may require PATH in bashrc.
-                    source_bashrc=True,
+                    source_bashrc=True))
+
+        # Mount all the storages in one thread pool, so that they are mounted
+        # in parallel with each other and across the nodes. Mount paths
+        # nested in each other are mounted in order instead, as a later mount
+        # can shadow an earlier one.
+        if _has_nested_paths(list(mount_dsts.values())):
+            transfer_batches = [[transfer] for transfer in transfers]
+        else:
+            transfer_batches = [transfers]
+        try:
+            for transfer_batch in transfer_batches:
+                backend_utils.parallel_data_transfers_to_nodes(
+                    runners,
+                    transfer_batch,
+                    log_path=log_path,
                     num_threads=num_threads,
                 )
-            except exceptions.CommandError as e:
-                if e.returncode == exceptions.MOUNT_PATH_NON_EMPTY_CODE:
-                    mount_path = (f'{colorama.Fore.RED}'
-                                  f'{colorama.Style.BRIGHT}{dst}'
-                                  f'{colorama.Style.RESET_ALL}')
-                    error_msg = (f'Mount path {mount_path} is non-empty.'
-                                 f' {mount_path} may be a standard unix '
-                                 f'path or may contain files from a previous'
-                                 f' task. To fix, change the mount path'
-                                 f' to an empty or non-existent path.')
-                    raise RuntimeError(error_msg) from None
+        except exceptions.CommandError as e:
+            if e.returncode == exceptions.MOUNT_PATH_NON_EMPTY_CODE:
+                mount_path = (f'{colorama.Fore.RED}'
+                              f'{colorama.Style.BRIGHT}'
+                              f'{mount_dsts.get(e.command, e.command)}'
+                              f'{colorama.Style.RESET_ALL}')
+                error_msg = (f'Mount path {mount_path} is non-empty.'
+                             f' {mount_path} may be a standard unix '
+                             f'path or may contain files from a previous'
+                             f' task. To fix, change the mount path'
+                             f' to an empty or non-existent path.')
+                raise RuntimeError(error_msg) from None
+            else:
+                # By default, raising an error caused from mounting_utils
+                # shows a big heredoc as part of it. Here, we want to
+                # conditionally show the heredoc only if SKYPILOT_DEBUG
+                # is set
+                if env_options.Options.SHOW_DEBUG_INFO.get():
+                    raise exceptions.CommandError(
+                        e.returncode,
+                        command='to mount',
+                        error_msg=e.error_msg,
+                        detailed_reason=e.detailed_reason)
                 else:
-                    # By default, raising an error caused from mounting_utils
-                    # shows a big heredoc as part of it. Here, we want to
-                    # conditionally show the heredoc only if SKYPILOT_DEBUG
-                    # is set
-                    if env_options.Options.SHOW_DEBUG_INFO.get():
-                        raise exceptions.CommandError(
-                            e.returncode,
-                            command='to mount',
-                            error_msg=e.error_msg,
-                            detailed_reason=e.detailed_reason)
-                    else:
-                        # Strip the command (a big heredoc) from the exception
-                        raise exceptions.CommandError(
-                            e.returncode,
-                            command='to mount',
-                            error_msg=e.error_msg,
-                            detailed_reason=e.detailed_reason) from None
+                    # Strip the command (a big heredoc) from the exception
+                    raise exceptions.CommandError(
+                        e.returncode,
+                        command='to mount',
+                        error_msg=e.error_msg,
+                        detailed_reason=e.detailed_reason) from None
 
         end = time.time()
         logger.debug(f'Storage mount sync took {end - start} seconds.')
@@ -6870,15 +7237,21 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
 
         if storage_mounts_metadata is None:
             return None
-        storage_mounts = {}
-        for dst, storage_metadata in storage_mounts_metadata.items():
+
+        def _from_metadata(storage_metadata) -> storage_lib.Storage:
             # Setting 'sync_on_reconstruction' to False prevents from Storage
             # object creation to sync local source syncing to the bucket. Local
             # source specified in Storage object is synced to the bucket only
             # when it is created with 'sky launch'.
-            storage_mounts[dst] = storage_lib.Storage.from_metadata(
+            return storage_lib.Storage.from_metadata(
                 storage_metadata, sync_on_reconstruction=False)
-        return storage_mounts
+
+        # Reconstructing a storage may look up its buckets on the cloud, so
+        # restore all of them in parallel, with the request's config.
+        storages = subprocess_utils.run_in_parallel(
+            context_lib.with_current_context(_from_metadata),
+            list(storage_mounts_metadata.values()))
+        return dict(zip(storage_mounts_metadata.keys(), storages))
 
     def _skypilot_predefined_env_vars(
             self, handle: CloudVmRayResourceHandle) -> Dict[str, str]:
@@ -6948,12 +7321,13 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             return task_codegen.RayCodeGen()
 
     def _execute_task_one_node(self, handle: CloudVmRayResourceHandle,
-                               task: task_lib.Task, job_id: int,
+                               task: task_lib.Task,
+                               resources: resources_lib.Resources, job_id: int,
                                remote_log_dir: str) -> None:
         # Launch the command as a Ray task.
         log_dir = os.path.join(remote_log_dir, 'tasks')
 
-        resources_dict = backend_utils.get_task_demands_dict(task)
+        resources_dict = backend_utils.get_task_demands_dict(task, resources)
         internal_ips = handle.internal_ips()
         assert internal_ips is not None, 'internal_ips is not cached in handle'
 
@@ -6976,7 +7350,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             bash_script=task.run,
             env_vars=task_env_vars,
             task_name=task.name,
-            resources_dict=backend_utils.get_task_demands_dict(task),
+            resources_dict=resources_dict,
             log_dir=log_dir)
 
         codegen.add_epilogue()
@@ -6990,14 +7364,15 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             remote_log_dir=remote_log_dir)
 
     def _execute_task_n_nodes(self, handle: CloudVmRayResourceHandle,
-                              task: task_lib.Task, job_id: int,
+                              task: task_lib.Task,
+                              resources: resources_lib.Resources, job_id: int,
                               remote_log_dir: str) -> None:
         # Strategy:
         #   ray.init(...)
         #   for node:
         #     submit _run_cmd(cmd) with resource {node_i: 1}
         log_dir = os.path.join(remote_log_dir, 'tasks')
-        resources_dict = backend_utils.get_task_demands_dict(task)
+        resources_dict = backend_utils.get_task_demands_dict(task, resources)
         internal_ips = handle.internal_ips()
         assert internal_ips is not None, 'internal_ips is not cached in handle'
 
@@ -7022,7 +7397,7 @@ class CloudVmRayBackend(backends.Backend['CloudVmRayResourceHandle']):
             bash_script=task.run,
             env_vars=task_env_vars,
             task_name=task.name,
-            resources_dict=backend_utils.get_task_demands_dict(task),
+            resources_dict=resources_dict,
             log_dir=log_dir)
 
         codegen.add_epilogue()
@@ -15,6 +15,7 @@ from sky import sky_logging
 from sky.skylet import constants
 from sky.skylet import log_lib
 from sky.utils import accelerator_registry
+from sky.utils import annotations
 from sky.utils import ux_utils
 
 # Unset RAY_RAYLET_PID to prevent the Ray cluster in the SkyPilot runtime
@@ -24,6 +25,30 @@ UNSET_RAY_ENV_VARS = ['RAY_RAYLET_PID']
 logger = sky_logging.init_logger(__name__)
 
 
+@annotations.lru_cache(scope='global', maxsize=1)
+def _get_logging_functions_source() -> List[str]:
+    """Returns the source of the log streaming functions from log_lib.
+
+    Cached, as inspect.getsource() scans the source file on every call and
+    the source does not change within a process. Callers must not mutate the
+    returned list.
+    """
+    return [
+        # FIXME: This is a hack to make sure that the functions can be found
+        # by ray.remote. This should be removed once we have a better way to
+        # specify dependencies for ray.
+        inspect.getsource(log_lib._ProcessingArgs),  # pylint: disable=protected-access
+        inspect.getsource(log_lib._get_context),  # pylint: disable=protected-access
+        inspect.getsource(log_lib._handle_io_stream),  # pylint: disable=protected-access
+        inspect.getsource(log_lib.process_subprocess_stream),
+        inspect.getsource(log_lib.run_with_log),
+        inspect.getsource(log_lib.make_task_bash_script),
+        inspect.getsource(log_lib.add_ray_env_vars),
+        inspect.getsource(log_lib.run_bash_command_with_log),
+        inspect.getsource(log_lib.run_bash_command_with_log_and_return_pid),
+    ]
+
+
 class TaskCodeGen:
     """Base code generator for task execution on Ray and Slurm."""
 
@@ -70,20 +95,7 @@ class TaskCodeGen:
 
     def _add_logging_functions(self) -> None:
         """Add log streaming functions from log_lib."""
-        self._code += [
-            # FIXME: This is a hack to make sure that the functions can be found
-            # by ray.remote. This should be removed once we have a better way to
-            # specify dependencies for ray.
-            inspect.getsource(log_lib._ProcessingArgs),  # pylint: disable=protected-access
-            inspect.getsource(log_lib._get_context),  # pylint: disable=protected-access
-            inspect.getsource(log_lib._handle_io_stream),  # pylint: disable=protected-access
-            inspect.getsource(log_lib.process_subprocess_stream),
-            inspect.getsource(log_lib.run_with_log),
-            inspect.getsource(log_lib.make_task_bash_script),
-            inspect.getsource(log_lib.add_ray_env_vars),
-            inspect.getsource(log_lib.run_bash_command_with_log),
-            inspect.getsource(log_lib.run_bash_command_with_log_and_return_pid),
-        ]
+        self._code += _get_logging_functions_source()
 
     def _add_waiting_for_resources_msg(self, num_nodes: int) -> None:
         self._code.append(
@@ -440,6 +452,7 @@ class RayCodeGen(TaskCodeGen):
         # Set CPU to avoid ray hanging the resources allocation
         # for remote functions, since the task will request 1 CPU
         # by default.
+        resources_dict = resources_dict.copy()
         task_cpu_demand = resources_dict.pop('CPU')
 
         if resources_dict:
@@ -580,28 +593,18 @@ class RayCodeGen(TaskCodeGen):
                  resources_dict: Dict[str, float],
                  log_dir: str,
                  env_vars: Optional[Dict[str, str]] = None) -> None:
+        """Generates code for ray remote tasks that run a bash command.
+
+        One task is submitted per node, each constrained to its placement
+        group bundle. The script and env vars are emitted once and the tasks
+        are submitted in a loop, so the generated code does not grow with
+        num_nodes.
+        """
         # TODO(zhwu): The resources limitation for multi-node ray.tune and
         # horovod should be considered.
-        for i in range(num_nodes):
-            # Ray's per-node resources, to constrain scheduling each command to
-            # the corresponding node, represented by private IPs.
-            self._add_ray_task(bash_script=bash_script,
-                               task_name=task_name,
-                               resources_dict=resources_dict.copy(),
-                               log_dir=log_dir,
-                               env_vars=env_vars,
-                               gang_scheduling_id=i)
-
-    def _add_ray_task(self,
-                      bash_script: Optional[str],
-                      task_name: Optional[str],
-                      resources_dict: Dict[str, float],
-                      log_dir: str,
-                      env_vars: Optional[Dict[str, str]] = None,
-                      gang_scheduling_id: int = 0) -> None:
-        """Generates code for a ray remote task that runs a bash command."""
         assert self._has_setup, 'Call add_setup() before add_task().'
 
+        resources_dict = resources_dict.copy()
         task_cpu_demand = resources_dict.pop('CPU')
         # Build remote_task.options(...)
         #   resources=...
@@ -619,23 +622,12 @@ class RayCodeGen(TaskCodeGen):
                     acc_name):
                 num_gpus = acc_count
                 options.append(f'num_gpus={num_gpus}')
+        # Ray's per-node resources, to constrain scheduling each command to
+        # the corresponding node, represented by private IPs.
         options.append(
             'scheduling_strategy=ray.util.scheduling_strategies.PlacementGroupSchedulingStrategy('  # pylint: disable=line-too-long
             'placement_group=pg, '
-            f'placement_group_bundle_index={gang_scheduling_id})')
-
-        sky_env_vars_dict_str = [
-            textwrap.dedent(f"""\
-            sky_env_vars_dict = {{}}
-            sky_env_vars_dict['{constants.SKYPILOT_NODE_IPS}'] = job_ip_list_str
-            sky_env_vars_dict['{constants.SKYPILOT_NUM_NODES}'] = len(job_ip_rank_list)
-            """)
-        ]
-
-        if env_vars is not None:
-            sky_env_vars_dict_str.extend(f'sky_env_vars_dict[{k!r}] = {v!r}'
-                                         for k, v in env_vars.items())
-        sky_env_vars_dict_str = '\n'.join(sky_env_vars_dict_str)
+            'placement_group_bundle_index=gang_scheduling_id)')
 
         options_str = ', '.join(options)
         logger.debug('Added Task with options: '
@@ -646,40 +638,45 @@ class RayCodeGen(TaskCodeGen):
             bash_script, env_prefix=unset_ray_env_vars)
                             if bash_script is not None else None)
         self._code += [
-            sky_env_vars_dict_str,
+            f'task_env_vars = {env_vars or {}!r}',
             textwrap.dedent(f"""\
         script = {task_bash_script!r}
 
         if script is not None:
-            sky_env_vars_dict['{constants.SKYPILOT_NUM_GPUS_PER_NODE}'] = {int(math.ceil(num_gpus))!r}
-
-            ip = gang_scheduling_id_to_ip[{gang_scheduling_id!r}]
-            rank = job_ip_rank_map[ip]
-
-            if len(cluster_ips_to_node_id) == 1: # Single-node task on single-node cluter
-                name_str = '{task_name},' if {task_name!r} != None else 'task,'
-                log_path = os.path.expanduser(os.path.join({log_dir!r}, 'run.log'))
-            else: # Single-node or multi-node task on multi-node cluster
-                idx_in_cluster = cluster_ips_to_node_id.get(ip, len(cluster_ips_to_node_id) + {gang_scheduling_id!r})
-                if idx_in_cluster == 0:
-                    node_name = 'head'
-                else:
-                    node_name = f'worker{{idx_in_cluster}}'
-                name_str = f'{{node_name}}, rank={{rank}},'
-                log_path = os.path.expanduser(os.path.join({log_dir!r}, f'{{rank}}-{{node_name}}.log'))
-            sky_env_vars_dict['{constants.SKYPILOT_NODE_RANK}'] = rank
-
-            sky_env_vars_dict['SKYPILOT_INTERNAL_JOB_ID'] = {self.job_id}
-
-            futures.append(run_bash_command_with_log_and_return_pid \\
-                    .options(name=name_str, {options_str}) \\
-                    .remote(
-                        script,
-                        log_path,
-                        env_vars=sky_env_vars_dict,
-                        stream_logs=True,
-                        with_ray=True,
-                    ))""")
+            for gang_scheduling_id in range({num_nodes!r}):
+                sky_env_vars_dict = {{}}
+                sky_env_vars_dict['{constants.SKYPILOT_NODE_IPS}'] = job_ip_list_str
+                sky_env_vars_dict['{constants.SKYPILOT_NUM_NODES}'] = len(job_ip_rank_list)
+                sky_env_vars_dict.update(task_env_vars)
+                sky_env_vars_dict['{constants.SKYPILOT_NUM_GPUS_PER_NODE}'] = {int(math.ceil(num_gpus))!r}
+
+                ip = gang_scheduling_id_to_ip[gang_scheduling_id]
+                rank = job_ip_rank_map[ip]
+
+                if len(cluster_ips_to_node_id) == 1: # Single-node task on single-node cluter
+                    name_str = '{task_name},' if {task_name!r} != None else 'task,'
+                    log_path = os.path.expanduser(os.path.join({log_dir!r}, 'run.log'))
+                else: # Single-node or multi-node task on multi-node cluster
+                    idx_in_cluster = cluster_ips_to_node_id.get(ip, len(cluster_ips_to_node_id) + gang_scheduling_id)
+                    if idx_in_cluster == 0:
+                        node_name = 'head'
+                    else:
+                        node_name = f'worker{{idx_in_cluster}}'
+                    name_str = f'{{node_name}}, rank={{rank}},'
+                    log_path = os.path.expanduser(os.path.join({log_dir!r}, f'{{rank}}-{{node_name}}.log'))
+                sky_env_vars_dict['{constants.SKYPILOT_NODE_RANK}'] = rank
+
+                sky_env_vars_dict['SKYPILOT_INTERNAL_JOB_ID'] = {self.job_id}
+
+                futures.append(run_bash_command_with_log_and_return_pid \\
+                        .options(name=name_str, {options_str}) \\
+                        .remote(
+                            script,
+                            log_path,
+                            env_vars=sky_env_vars_dict,
+                            stream_logs=True,
+                            with_ray=True,
+                        ))""")
         ]
 
     def add_epilogue(self) -> None:
@@ -824,7 +821,7 @@ class SlurmCodeGen(TaskCodeGen):
             num_gpus = int(math.ceil(acc_count))
 
         # Slurm does not support fractional CPUs.
-        task_cpu_demand = int(math.ceil(resources_dict.pop('CPU')))
+        task_cpu_demand = int(math.ceil(resources_dict['CPU']))
 
         sky_env_vars_dict_str = [
             textwrap.dedent(f"""\
@@ -123,12 +123,10 @@ def get_default_instance_type(
         valid, _ = OCI.check_disk_tier(instance_type, disk_tier)
         return valid
 
-    instance_type_prefix = tuple(
-        f'{family}' for family in oci_utils.oci_config.DEFAULT_INSTANCE_FAMILY)
-
     df = _get_df()
     df = df[df['InstanceType'].notna()]
-    df = df[df['InstanceType'].str.startswith(instance_type_prefix)]
+    df = df[df['InstanceType'].str.startswith(
+        oci_utils.oci_config.DEFAULT_INSTANCE_FAMILY)]
     df = df.loc[df['InstanceType'].apply(_filter_disk_type)]
 
     logger.debug(f'# get_default_instance_type: {df}')
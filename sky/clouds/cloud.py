@@ -745,6 +745,41 @@ class Cloud:
             exceptions.NotSupportedError: If the cloud does not support all the
             requested features.
         """
+        unsupported_features2reason = cls._requested_unsupported_features(
+            resources, requested_features, region)
+        if unsupported_features2reason:
+            table = log_utils.create_table(['Feature', 'Reason'])
+            for feature, reason in unsupported_features2reason.items():
+                table.add_row([feature.value, reason])
+            with ux_utils.print_exception_no_traceback():
+                raise exceptions.NotSupportedError(
+                    f'The following features are not supported by {cls._REPR}:'
+                    '\n\t' + table.get_string().replace('\n', '\n\t'))
+
+    @classmethod
+    def get_unsupported_features(
+        cls,
+        resources: 'resources_lib.Resources',
+        requested_features: Set[CloudImplementationFeatures],
+        region: Optional[str] = None,
+    ) -> Set[CloudImplementationFeatures]:
+        """Returns the requested features that the cloud does not support.
+
+        Unlike check_features_are_supported(), this does not raise, so several
+        features can be checked separately with a single lookup.
+        """
+        return set(
+            cls._requested_unsupported_features(resources, requested_features,
+                                                region))
+
+    @classmethod
+    def _requested_unsupported_features(
+        cls,
+        resources: 'resources_lib.Resources',
+        requested_features: Set[CloudImplementationFeatures],
+        region: Optional[str] = None,
+    ) -> Dict[CloudImplementationFeatures, str]:
+        """Returns {feature: reason} for the unsupported requested features."""
         unsupported_features2reason = cls._unsupported_features_for_resources(
             resources, region)
 
@@ -761,18 +796,11 @@ class Cloud:
                     'the config.'),
             })
 
-        unsupported_features = set(unsupported_features2reason.keys())
-        unsupported_features = requested_features.intersection(
-            unsupported_features)
-        if unsupported_features:
-            table = log_utils.create_table(['Feature', 'Reason'])
-            for feature in unsupported_features:
-                table.add_row(
-                    [feature.value, unsupported_features2reason[feature]])
-            with ux_utils.print_exception_no_traceback():
-                raise exceptions.NotSupportedError(
-                    f'The following features are not supported by {cls._REPR}:'
-                    '\n\t' + table.get_string().replace('\n', '\n\t'))
+        return {
+            feature: reason
+            for feature, reason in unsupported_features2reason.items()
+            if feature in requested_features
+        }
 
     @classmethod
     def _unsupported_features_for_resources(
@@ -23,8 +23,28 @@ from sky.utils import status_lib
 logger = sky_logging.init_logger(__name__)
 
 
+def _get_region_config_or_default(region, keys):
+    """Gets the OCI config of 'region', falling back to the 'default' one.
+
+    The 'default' region config is only looked up if the region has no
+    value set.
+    """
+    value = skypilot_config.get_effective_region_config(cloud='oci',
+                                                        region=region,
+                                                        keys=keys,
+                                                        default_value=None)
+    if value is None:
+        value = skypilot_config.get_effective_region_config(
+            cloud='oci', region='default', keys=keys, default_value=None)
+    return value
+
+
 class OCIConfig:
     """OCI Configuration."""
+    # Only a namespace of constants and getters; `oci_config` below is its
+    # single instance and holds no state.
+    __slots__ = ()
+
     IMAGE_TAG_SPERATOR = '|'
     INSTANCE_TYPE_RES_SPERATOR = '$_'
     CPU_MEM_SPERATOR = '_'
@@ -33,14 +53,14 @@ class OCIConfig:
     DEFAULT_MEMORY_CPU_RATIO = 4
 
     VM_PREFIX = 'VM.Standard'
-    DEFAULT_INSTANCE_FAMILY = [
+    DEFAULT_INSTANCE_FAMILY = (
         # CPU: AMD, Memory: 8 GiB RAM per 1 vCPU;
         f'{VM_PREFIX}.E',
         # CPU: Intel, Memory: 8 GiB RAM per 1 vCPU;
         f'{VM_PREFIX}3',
         # CPU: ARM, Memory: 6 GiB RAM per 1 vCPU;
         # f'{VM_PREFIX}.A',
-    ]
+    )
 
     COMPARTMENT = 'skypilot_compartment'
     VCN_NAME = 'skypilot_vcn'
@@ -102,23 +122,13 @@ class OCIConfig:
         'TERMINATING': None,
     }
 
-    @classmethod
-    def get_compartment(cls, region):
+    @staticmethod
+    def get_compartment(region):
         # Allow task(cluster)-specific compartment/VCN parameters.
-        default_compartment_ocid = skypilot_config.get_effective_region_config(
-            cloud='oci',
-            region='default',
-            keys=('compartment_ocid',),
-            default_value=None)
-        compartment = skypilot_config.get_effective_region_config(
-            cloud='oci',
-            region=region,
-            keys=('compartment_ocid',),
-            default_value=default_compartment_ocid)
-        return compartment
+        return _get_region_config_or_default(region, ('compartment_ocid',))
 
-    @classmethod
-    def get_vcn_ocid(cls, region):
+    @staticmethod
+    def get_vcn_ocid(region):
         # Will reuse the regional VCN if specified.
         vcn = skypilot_config.get_effective_region_config(cloud='oci',
                                                           region=region,
@@ -126,8 +136,8 @@ class OCIConfig:
                                                           default_value=None)
         return vcn
 
-    @classmethod
-    def get_vcn_subnet(cls, region):
+    @staticmethod
+    def get_vcn_subnet(region):
         # Will reuse the subnet if specified.
         vcn = skypilot_config.get_effective_region_config(cloud='oci',
                                                           region=region,
@@ -135,8 +145,8 @@ class OCIConfig:
                                                           default_value=None)
         return vcn
 
-    @classmethod
-    def get_default_gpu_image_tag(cls) -> str:
+    @staticmethod
+    def get_default_gpu_image_tag() -> str:
         # Get the default image tag (for gpu instances). Instead of hardcoding,
         # we give a choice to set the default image tag (for gpu instances) in
         # the sky's user-config file (if not specified, use the hardcode one at
@@ -147,8 +157,8 @@ class OCIConfig:
             keys=('image_tag_gpu',),
             default_value='skypilot:gpu-ubuntu-2204')
 
-    @classmethod
-    def get_default_image_tag(cls) -> str:
+    @staticmethod
+    def get_default_image_tag() -> str:
         # Get the default image tag. Instead of hardcoding, we give a choice to
         # set the default image tag in the sky's user-config file. (if not
         # specified, use the hardcode one at last)
@@ -158,8 +168,12 @@ class OCIConfig:
             keys=('image_tag_general',),
             default_value='skypilot:cpu-ubuntu-2204')
 
-    @classmethod
-    def get_sky_user_config_file(cls) -> str:
+    @staticmethod
+    def get_nsg_name(cluster_name: str) -> str:
+        return OCIConfig.NSG_NAME_TEMPLATE.format(cluster_name=cluster_name)
+
+    @staticmethod
+    def get_sky_user_config_file() -> str:
         config_path_via_env_var = os.environ.get(
             skypilot_config.ENV_VAR_SKYPILOT_CONFIG)
         if config_path_via_env_var is not None:
@@ -168,16 +182,16 @@ class OCIConfig:
             config_path = skypilot_config.get_user_config_path()
         return config_path
 
-    @classmethod
-    def get_profile(cls) -> str:
+    @staticmethod
+    def get_profile() -> str:
         return skypilot_config.get_effective_region_config(
             cloud='oci',
             region='default',
             keys=('oci_config_profile',),
             default_value='DEFAULT')
 
-    @classmethod
-    def get_default_image_os(cls) -> str:
+    @staticmethod
+    def get_default_image_os() -> str:
         # Get the default image OS. Instead of hardcoding, we give a choice to
         # set the default image OS type in the sky's user-config file. (if not
         # specified, use the hardcode one at last)
@@ -29,11 +29,13 @@ from sky.usage import usage_lib
 from sky.utils import admin_policy_utils
 from sky.utils import common
 from sky.utils import common_utils
+from sky.utils import context
 from sky.utils import controller_utils
 from sky.utils import dag_utils
 from sky.utils import resources_utils
 from sky.utils import rich_utils
 from sky.utils import status_lib
+from sky.utils import subprocess_utils
 from sky.utils import tempstore
 from sky.utils import timeline
 from sky.utils import ux_utils
@@ -41,9 +43,23 @@ from sky.utils import ux_utils
 if typing.TYPE_CHECKING:
     import sky
     from sky import resources as resources_lib
+    from sky.data import storage as storage_lib
 
 logger = sky_logging.init_logger(__name__)
 
+_SPOT_WITHOUT_RECOVERY_HINT = (
+    f'{colorama.Fore.YELLOW}Launching a spot job that does not '
+    'automatically recover from preemptions. To get automatic recovery, use '
+    f'managed job instead: {colorama.Style.RESET_ALL}'
+    f'{colorama.Style.BRIGHT}sky jobs launch{colorama.Style.RESET_ALL} '
+    f'{colorama.Fore.YELLOW}or{colorama.Style.RESET_ALL} '
+    f'{colorama.Style.BRIGHT}sky.jobs.launch(){colorama.Style.RESET_ALL}.')
+_JOB_RECOVERY_IGNORED_WARNING = (
+    f'{colorama.Style.DIM}The task has `job_recovery` specified, but is '
+    'launched as an unmanaged job. It will be ignored.To enable job '
+    'recovery, use managed jobs: sky jobs launch.'
+    f'{colorama.Style.RESET_ALL}')
+
 
 class Stage(enum.Enum):
     """Stages for a run of a sky.Task."""
@@ -59,16 +75,14 @@ class Stage(enum.Enum):
     DOWN = enum.auto()
 
 
-def _maybe_clone_disk_from_cluster(clone_disk_from: Optional[str],
-                                   cluster_name: Optional[str],
-                                   task: 'sky.Task') -> 'sky.Task':
-    if clone_disk_from is None:
-        return task
+def _clone_disk_from_cluster(clone_disk_from: str,
+                             cluster_name: Optional[str],
+                             task: 'sky.Task') -> 'sky.Task':
     task, handle = backend_utils.check_can_clone_disk_and_override_task(
         clone_disk_from, cluster_name, task)
     original_cloud = handle.launched_resources.cloud
     assert original_cloud is not None, handle.launched_resources
-    task_resources = list(task.resources)[0]
+    task_resources = next(iter(task.resources))
 
     with rich_utils.safe_status('Creating image from source cluster '
                                 f'{clone_disk_from!r}'):
@@ -199,6 +213,29 @@ def _compute_set_autostop_args_for_hooks_only_relaunch(
     )
 
 
+def _construct_storages(storages: List['storage_lib.Storage']) -> None:
+    """Constructs the storages, in parallel across buckets.
+
+    Constructing a storage creates or looks up its bucket and may upload to
+    it. Storages of the same bucket are constructed one after another, so
+    that only the first one creates the bucket and the rest reuse it.
+    """
+    storages_by_bucket: Dict[str, List['storage_lib.Storage']] = {}
+    for storage in storages:
+        bucket = (storage.name
+                  if storage.name is not None else str(storage.source))
+        storages_by_bucket.setdefault(bucket, []).append(storage)
+
+    def _construct(bucket_storages: List['storage_lib.Storage']) -> None:
+        for storage in bucket_storages:
+            storage.construct()
+
+    # The request's config and temp dir live in the context, so the workers
+    # run in a copy of it.
+    subprocess_utils.run_in_parallel(context.with_current_context(_construct),
+                                     list(storages_by_bucket.values()))
+
+
 def _execute(
     entrypoint: Union['sky.Task', 'sky.Dag'],
     dryrun: bool = False,
@@ -311,11 +348,11 @@ def _execute(
                 not _is_launched_by_sky_serve_controller):
             # Only process pre-mount operations on API server.
             dag.pre_mount_volumes()
-        for task in dag.tasks:
-            if task.storage_mounts is not None:
-                for storage in task.storage_mounts.values():
-                    # Ensure the storage is constructed.
-                    storage.construct()
+        # Ensure the storages are constructed.
+        _construct_storages([
+            storage for task in dag.tasks if task.storage_mounts is not None
+            for storage in task.storage_mounts.values()
+        ])
         _resolve_managed_secrets(dag)
         return _execute_dag(
             dag,
@@ -371,11 +408,7 @@ def _execute_dag(
     task = dag.tasks[0]
 
     if any(r.job_recovery is not None for r in task.resources):
-        job_logger.warning(
-            f'{colorama.Style.DIM}The task has `job_recovery` specified, '
-            'but is launched as an unmanaged job. It will be ignored.'
-            'To enable job recovery, use managed jobs: sky jobs launch.'
-            f'{colorama.Style.RESET_ALL}')
+        job_logger.warning(_JOB_RECOVERY_IGNORED_WARNING)
 
     cluster_exists = False
     if cluster_name is not None:
@@ -387,7 +420,9 @@ def _execute_dag(
         # `cpus` and `memory` are not used as a job scheduling constraint,
         # unlike `gpus`.
 
-    stages = stages if stages is not None else list(Stage)
+    # A set copy, for the membership checks below and so that removing a
+    # stage does not modify the caller's list.
+    stage_set = set(stages) if stages is not None else set(Stage)
 
     # Requested features that some clouds support and others don't.
     requested_features = set()
@@ -398,7 +433,7 @@ def _execute_dag(
     if controller is not None:
         requested_features.add(
             clouds.CloudImplementationFeatures.HOST_CONTROLLERS)
-        if controller_utils.high_availability_specified(cluster_name):
+        if controller_utils.controller_high_availability_specified(controller):
             requested_features.add(clouds.CloudImplementationFeatures.
                                    HIGH_AVAILABILITY_CONTROLLERS)
             # If we provision a cluster that supports high availability
@@ -424,12 +459,12 @@ def _execute_dag(
         #   provisioning.
         # - Need to send info message about idle_minutes_to_autostop==0 here
         # - Need to check if autostop is supported by the backend.
-        resources = list(task.resources)
-        for resource in resources:
-            if resource.autostop_config != resources[0].autostop_config:
-                raise ValueError(
-                    'All resources must have the same autostop config.')
-        resource_autostop_config = resources[0].autostop_config
+        resource_autostop_config = next(iter(
+            task.resources)).autostop_config
+        if any(r.autostop_config != resource_autostop_config
+               for r in task.resources):
+            raise ValueError(
+                'All resources must have the same autostop config.')
 
         idle_minutes_to_autostop: Optional[int] = None
         down = False
@@ -459,8 +494,7 @@ def _execute_dag(
                                 '(after all jobs finish).'
                                 f'{colorama.Style.RESET_ALL}')
                 idle_minutes_to_autostop = 1
-            if Stage.DOWN in stages:
-                stages.remove(Stage.DOWN)
+            stage_set.discard(Stage.DOWN)
             if idle_minutes_to_autostop >= 0:
                 if down:
                     requested_features.add(
@@ -472,9 +506,8 @@ def _execute_dag(
         # (cloud/resource) to check STOP_SPOT_INSTANCE here. This is checked in
         # the backend.
 
-    if Stage.CLONE_DISK in stages:
-        task = _maybe_clone_disk_from_cluster(clone_disk_from, cluster_name,
-                                              task)
+    if Stage.CLONE_DISK in stage_set and clone_disk_from is not None:
+        task = _clone_disk_from_cluster(clone_disk_from, cluster_name, task)
 
     is_managed = (_is_launched_by_jobs_controller or
                   _is_launched_by_sky_serve_controller)
@@ -482,18 +515,10 @@ def _execute_dag(
     if not cluster_exists:
         # If spot is launched on serve or jobs controller, we don't need to
         # print out the hint.
-        if (Stage.PROVISION in stages and task.use_spot and not is_managed):
-            yellow = colorama.Fore.YELLOW
-            bold = colorama.Style.BRIGHT
-            reset = colorama.Style.RESET_ALL
-            job_logger.info(
-                f'{yellow}Launching a spot job that does not '
-                f'automatically recover from preemptions. To '
-                'get automatic recovery, use managed job instead: '
-                f'{reset}{bold}sky jobs launch{reset} {yellow}or{reset} '
-                f'{bold}sky.jobs.launch(){reset}.')
-
-        if Stage.OPTIMIZE in stages:
+        if (Stage.PROVISION in stage_set and task.use_spot and not is_managed):
+            job_logger.info(_SPOT_WITHOUT_RECOVERY_HINT)
+
+        if Stage.OPTIMIZE in stage_set:
             if task.best_resources is None:
                 # TODO: fix this for the situation where number of requested
                 # accelerators is not an integer.
@@ -502,8 +527,6 @@ def _execute_dag(
                     # no-credential machine should not enter optimize(), which
                     # would directly error out ('No cloud is enabled...').  Fix
                     # by moving `sky check` checks out of optimize()?
-                    controller = controller_utils.Controllers.from_name(
-                        cluster_name)
                     if controller is not None:
                         job_logger.info(
                             f'Choosing resources for {controller.value.name}...'
@@ -522,7 +545,7 @@ def _execute_dag(
     # the lock only when no reusable snapshot and no caller plan exist.
     planner: Optional[Callable[['sky.Task'], 'resources_lib.Resources']] = None
     if isinstance(backend,
-                  backends.CloudVmRayBackend) and Stage.OPTIMIZE in stages:
+                  backends.CloudVmRayBackend) and Stage.OPTIMIZE in stage_set:
 
         def _planner(_t: 'sky.Task'):
             new_dag = optimizer.Optimizer.optimize(dag,
@@ -553,7 +576,7 @@ def _execute_dag(
 
     try:
         provisioning_skipped = False
-        if Stage.PROVISION in stages:
+        if Stage.PROVISION in stage_set:
             assert handle is None or skip_unnecessary_provisioning, (
                 'Provisioning requested, but handle is already set. PROVISION '
                 'should be excluded from stages or '
@@ -574,9 +597,9 @@ def _execute_dag(
             job_logger.info('Dryrun finished.')
             return None, None
 
-        do_workdir = (Stage.SYNC_WORKDIR in stages and not dryrun and
+        do_workdir = (Stage.SYNC_WORKDIR in stage_set and not dryrun and
                       task.workdir is not None)
-        do_file_mounts = (Stage.SYNC_FILE_MOUNTS in stages and not dryrun and
+        do_file_mounts = (Stage.SYNC_FILE_MOUNTS in stage_set and not dryrun and
                           (task.file_mounts is not None or
                            task.storage_mounts is not None))
         if do_workdir or do_file_mounts:
@@ -603,7 +626,7 @@ def _execute_dag(
 
         if no_setup:
             job_logger.info('Setup commands skipped.')
-        elif Stage.SETUP in stages and not dryrun:
+        elif Stage.SETUP in stage_set and not dryrun:
             if skip_unnecessary_provisioning and provisioning_skipped:
                 job_logger.debug('Unnecessary provisioning was skipped, so '
                                  'skipping setup as well.')
@@ -615,7 +638,7 @@ def _execute_dag(
                         global_user_state.ClusterEventType.STATUS_CHANGE)
                 backend.setup(handle, task, detach_setup=detach_setup)
 
-        if Stage.PRE_EXEC in stages and not dryrun:
+        if Stage.PRE_EXEC in stage_set and not dryrun:
             task_hooks = resources[0].hooks
             # Hooks payload sent to skylet:
             #   None  → "leave stored hooks alone" (first launch w/o hooks)
@@ -662,7 +685,7 @@ def _execute_dag(
                 backend.set_autostop(handle, **kwargs)
 
         job_id = None
-        if Stage.EXEC in stages:
+        if Stage.EXEC in stage_set:
             try:
                 global_user_state.update_last_use(handle.get_cluster_name())
                 job_id = backend.execute(handle, task, dryrun=dryrun)
@@ -670,7 +693,7 @@ def _execute_dag(
                 # Enables post_execute() to be run after KeyboardInterrupt.
                 backend.post_execute(handle, down)
 
-        if Stage.DOWN in stages and not dryrun:
+        if Stage.DOWN in stage_set and not dryrun:
             if down and idle_minutes_to_autostop is None:
                 backend.teardown_ephemeral_storage(task)
                 backend.teardown(handle, terminate=True)
@@ -830,12 +853,10 @@ def launch(
                 f'Autostop completed. Cluster status: '
                 f'{cluster_status.value if cluster_status else "TERMINATED"}')
 
-    # Check if cluster exists and we are doing fast provisioning
+    # Check if cluster exists and we are doing fast provisioning. This reuses
+    # the cluster_status/maybe_handle fetched above, where a None status means
+    # the cluster does not exist.
     if fast and cluster_name is not None:
-        # Reuse cluster_status/maybe_handle if already fetched
-        if cluster_status is None:
-            cluster_status, maybe_handle = (
-                backend_utils.refresh_cluster_status_handle(cluster_name))
         if cluster_status == status_lib.ClusterStatus.INIT:
             # If the cluster is INIT, it may be provisioning. We want to prevent
             # concurrent calls from queueing up many sequential reprovision
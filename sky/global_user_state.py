@@ -7,6 +7,7 @@ Concepts:
   interact with a cluster.
 """
 import asyncio
+import copy
 import enum
 import json
 import os
@@ -3431,6 +3432,22 @@ def _set_cluster_yaml_from_file(cluster_yaml_path: str,
     return None
 
 
+@annotations.lru_cache(scope='global', maxsize=128)
+def _parse_cluster_yaml(yaml_str: str) -> Dict[str, Any]:
+    """Parses a cluster yaml, cached on its content.
+
+    Callers must not mutate the returned dict; use _load_cluster_yaml().
+    """
+    return yaml_utils.safe_load(yaml_str)
+
+
+def _load_cluster_yaml(yaml_str: str) -> Dict[str, Any]:
+    # Copying the cached dict is much cheaper than parsing the yaml again,
+    # and keeps callers free to modify the returned dict. The cache is keyed
+    # on the yaml content, so an updated yaml is always parsed again.
+    return copy.deepcopy(_parse_cluster_yaml(yaml_str))
+
+
 def get_cluster_yaml_dict(cluster_yaml_path: Optional[str]) -> Dict[str, Any]:
     """Get the cluster yaml as a dictionary from the database.
 
@@ -3439,7 +3456,7 @@ def get_cluster_yaml_dict(cluster_yaml_path: Optional[str]) -> Dict[str, Any]:
     yaml_str = get_cluster_yaml_str(cluster_yaml_path)
     if yaml_str is None:
         raise ValueError(f'Cluster yaml {cluster_yaml_path} not found.')
-    return yaml_utils.safe_load(yaml_str)
+    return _load_cluster_yaml(yaml_str)
 
 
 def get_cluster_yaml_dict_multiple(
@@ -3451,7 +3468,7 @@ def get_cluster_yaml_dict_multiple(
         if yaml_str is None:
             raise ValueError(
                 f'Cluster yaml {cluster_yaml_paths[idx]} not found.')
-        yaml_dicts.append(yaml_utils.safe_load(yaml_str))
+        yaml_dicts.append(_load_cluster_yaml(yaml_str))
     return yaml_dicts
 
 
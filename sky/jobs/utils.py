@@ -3908,6 +3908,34 @@ class ManagedJobCodeGen:
         """)
         return cls._build(code)
 
+    @classmethod
+    def get_latest_job_log_dir_by_name(cls, job_name: Optional[str]) -> str:
+        """Looks up the job ids and the latest job's log dir in one call.
+
+        Emits two typed payloads: ``job_ids`` (as get_all_job_ids_by_name)
+        and ``log_dirs`` (as JobLibCodeGen.get_log_dirs_for_jobs for the
+        latest job id, empty if there is no matching job).
+        """
+        code = textwrap.dedent(f"""\
+        from sky.skylet import job_lib
+        from sky.utils import message_utils
+        job_ids = managed_job_state.get_all_job_ids_by_name({job_name!r})
+        log_dirs = {{}}
+        if job_ids:
+            # TODO(aylei): backward compatibility, remove after 0.12.0.
+            if hasattr(job_lib, "get_log_dir_for_jobs"):
+                log_dirs = job_lib.get_log_dir_for_jobs([str(job_ids[0])])
+            else:
+                log_dirs = job_lib.run_timestamp_with_globbing_payload(
+                    [str(job_ids[0])])
+            log_dirs = message_utils.decode_payload(log_dirs)
+        print(message_utils.encode_payload(job_ids, payload_type='job_ids'),
+              end="", flush=True)
+        print(message_utils.encode_payload(log_dirs, payload_type='log_dirs'),
+              end="", flush=True)
+        """)
+        return cls._build(code)
+
     @classmethod
     def get_debug_dump_manifest(cls, job_ids: List[int]) -> str:
         code = textwrap.dedent(f"""\
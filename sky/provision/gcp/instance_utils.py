@@ -596,7 +596,8 @@ class GCPComputeInstance(GCPInstance):
         project_id: str,
         firewall_rule_name: str,
     ) -> None:
-        rule = cls.load_resource().firewalls().list(
+        compute = cls.load_resource()
+        rule = compute.firewalls().list(
             project=project_id, filter=f'name={firewall_rule_name}').execute()
         # For the return value format, please refer to
         # https://developers.google.com/resources/api-libraries/documentation/compute/alpha/python/latest/compute_alpha.firewalls.html#list # pylint: disable=line-too-long
@@ -604,7 +605,7 @@ class GCPComputeInstance(GCPInstance):
             logger.warning(f'Firewall rule {firewall_rule_name} not found. '
                            'Skip cleanup.')
             return
-        cls.load_resource().firewalls().delete(
+        compute.firewalls().delete(
             project=project_id,
             firewall=firewall_rule_name,
         ).execute()
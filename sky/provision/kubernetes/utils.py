@@ -41,6 +41,7 @@ from sky.utils import kubernetes_enums
 from sky.utils import plugin_extensions
 from sky.utils import schemas
 from sky.utils import status_lib
+from sky.utils import subprocess_utils
 from sky.utils import timeline
 from sky.utils import ux_utils
 from sky.utils import yaml_utils
@@ -4745,22 +4746,30 @@ def filter_pods(namespace: str,
     return {pod.metadata.name: pod for pod in sorted_pods}
 
 
-def _remove_pod_annotation(pod: Any,
-                           annotation_key: str,
-                           namespace: str,
-                           context: Optional[str] = None) -> None:
+def _remove_pod_annotations(pod: Any,
+                            annotation_keys: List[str],
+                            namespace: str,
+                            context: Optional[str] = None) -> None:
     """Removes specified Annotations from a Kubernetes pod."""
     try:
-        # Remove the specified annotation
-        if pod.metadata.annotations:
-            if annotation_key in pod.metadata.annotations:
-                # Patch the pod with the updated metadata.
-                body = {'metadata': {'annotations': {annotation_key: None}}}
-                kubernetes.core_api(context).patch_namespaced_pod(
-                    name=pod.metadata.name,
-                    namespace=namespace,
-                    body=body,
-                    _request_timeout=kubernetes.API_TIMEOUT)
+        # Remove the specified annotations that are set on the pod, in a
+        # single patch.
+        existing_keys = [
+            key for key in annotation_keys
+            if pod.metadata.annotations and key in pod.metadata.annotations
+        ]
+        if existing_keys:
+            # Patch the pod with the updated metadata.
+            body = {
+                'metadata': {
+                    'annotations': {key: None for key in existing_keys}
+                }
+            }
+            kubernetes.core_api(context).patch_namespaced_pod(
+                name=pod.metadata.name,
+                namespace=namespace,
+                body=body,
+                _request_timeout=kubernetes.API_TIMEOUT)
 
     except kubernetes.api_exception() as e:
         if e.status == 404:
@@ -4769,7 +4778,7 @@ def _remove_pod_annotation(pod: Any,
                     pod_name=pod.metadata.name,
                     namespace=namespace,
                     action='remove',
-                    annotation=annotation_key))
+                    annotation=', '.join(annotation_keys)))
         else:
             with ux_utils.print_exception_no_traceback():
                 raise
@@ -4815,19 +4824,14 @@ def set_autodown_annotations(handle: 'backends.CloudVmRayResourceHandle',
     context = get_context_from_config(provider_config)
     running_pods = filter_pods(namespace, context, tags)
 
-    for _, pod in running_pods.items():
+    def _set_pod_annotations(pod: Any) -> None:
         if down:
-            idle_minutes_to_autostop_annotation = {
-                IDLE_MINUTES_TO_AUTOSTOP_ANNOTATION_KEY:
-                    str(idle_minutes_to_autostop)
-            }
-            autodown_annotation = {AUTODOWN_ANNOTATION_KEY: 'true'}
             _add_pod_annotation(pod=pod,
-                                annotation=idle_minutes_to_autostop_annotation,
-                                namespace=namespace,
-                                context=context)
-            _add_pod_annotation(pod=pod,
-                                annotation=autodown_annotation,
+                                annotation={
+                                    IDLE_MINUTES_TO_AUTOSTOP_ANNOTATION_KEY:
+                                        str(idle_minutes_to_autostop),
+                                    AUTODOWN_ANNOTATION_KEY: 'true',
+                                },
                                 namespace=namespace,
                                 context=context)
 
@@ -4836,15 +4840,17 @@ def set_autodown_annotations(handle: 'backends.CloudVmRayResourceHandle',
         # command.
         elif (idle_minutes_to_autostop is not None and
               idle_minutes_to_autostop < 0):
-            _remove_pod_annotation(
-                pod=pod,
-                annotation_key=IDLE_MINUTES_TO_AUTOSTOP_ANNOTATION_KEY,
-                namespace=namespace,
-                context=context)
-            _remove_pod_annotation(pod=pod,
-                                   annotation_key=AUTODOWN_ANNOTATION_KEY,
-                                   namespace=namespace,
-                                   context=context)
+            _remove_pod_annotations(pod=pod,
+                                    annotation_keys=[
+                                        IDLE_MINUTES_TO_AUTOSTOP_ANNOTATION_KEY,
+                                        AUTODOWN_ANNOTATION_KEY
+                                    ],
+                                    namespace=namespace,
+                                    context=context)
+
+    # Each pod is patched with its own API call, so patch them in parallel.
+    subprocess_utils.run_in_parallel(_set_pod_annotations,
+                                     list(running_pods.values()))
 
 
 def get_context_from_config(provider_config: Dict[str, Any]) -> Optional[str]:
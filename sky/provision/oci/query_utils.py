@@ -92,8 +92,7 @@ class QueryHelper:
         logger.debug(f'Terminate instance by tags: {tag_filters}')
 
         cluster_name = tag_filters[constants.TAG_RAY_CLUSTER_NAME]
-        nsg_name = oci_utils.oci_config.NSG_NAME_TEMPLATE.format(
-            cluster_name=cluster_name)
+        nsg_name = oci_utils.oci_config.get_nsg_name(cluster_name)
         nsg_id = cls.find_nsg(region, nsg_name, create_if_not_exist=False)
 
         core_client = oci_adaptor.get_core_client(
@@ -565,8 +564,7 @@ class QueryHelper:
         net_client = oci_adaptor.get_net_client(
             region, oci_utils.oci_config.get_profile())
 
-        nsg_name = oci_utils.oci_config.NSG_NAME_TEMPLATE.format(
-            cluster_name=cluster_name)
+        nsg_name = oci_utils.oci_config.get_nsg_name(cluster_name)
         nsg_id = cls.find_nsg(region, nsg_name, create_if_not_exist=True)
 
         filters = {constants.TAG_RAY_CLUSTER_NAME: cluster_name}
@@ -667,8 +665,7 @@ class QueryHelper:
         net_client = oci_adaptor.get_net_client(
             region, oci_utils.oci_config.get_profile())
 
-        nsg_name = oci_utils.oci_config.NSG_NAME_TEMPLATE.format(
-            cluster_name=cluster_name)
+        nsg_name = oci_utils.oci_config.get_nsg_name(cluster_name)
         nsg_id = cls.find_nsg(region, nsg_name, create_if_not_exist=False)
         if nsg_id is None:
             return
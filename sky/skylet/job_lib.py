@@ -1209,6 +1209,8 @@ class JobLibCodeGen:
         'from sky import exceptions',
         'from sky.skylet import log_lib, job_lib, constants',
     ]
+    # The prefix is static, so join it once instead of on every _build().
+    _PREFIX_STR = ';'.join(_PREFIX)
 
     @classmethod
     def add_job(cls, job_name: Optional[str], username: str, run_timestamp: str,
@@ -1489,7 +1491,6 @@ class JobLibCodeGen:
 
     @classmethod
     def _build(cls, code: List[str]) -> str:
-        code = cls._PREFIX + code
-        code = ';'.join(code)
+        code = ';'.join([cls._PREFIX_STR] + code)
         return (f'{constants.ACTIVATE_SKY_REMOTE_PYTHON_ENV}; '
                 f'{constants.SKY_PYTHON_CMD} -u -c {shlex.quote(code)}')
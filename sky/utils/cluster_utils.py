@@ -438,6 +438,50 @@ class SSHConfigHelper:
 
     @classmethod
     @lock_events.FileLockEvent(ssh_conf_lock_path)
+    def _ensure_ssh_config_include(cls) -> None:
+        """Adds the Include line for all clusters to ~/.ssh/config.
+
+        This is the only part of adding a cluster that touches the shared
+        ~/.ssh/config, so it is the only part under the global SSH config
+        lock.
+        """
+        config_path = os.path.expanduser(cls.ssh_conf_path)
+        os.makedirs(os.path.dirname(config_path), exist_ok=True, mode=0o700)
+
+        if not os.path.exists(config_path):
+            config = ['\n']
+            with open(config_path,
+                      'w',
+                      encoding='utf-8',
+                      opener=functools.partial(os.open, mode=0o644)) as f:
+                f.writelines(config)
+
+        with open(config_path, 'r', encoding='utf-8') as f:
+            config = f.readlines()
+
+        ssh_dir = cls.ssh_cluster_path.format('')
+        os.makedirs(os.path.expanduser(ssh_dir), exist_ok=True, mode=0o700)
+
+        # Handle Include on top of Config file
+        include_str = f'Include {cls.ssh_cluster_path.format("*")}'
+        found = False
+        for line in config:
+            config_str = line.strip()
+            if config_str == include_str:
+                found = True
+                break
+            if 'Host' in config_str:
+                break
+        if not found:
+            # Did not find Include string. Insert `Include` lines.
+            with open(config_path, 'w', encoding='utf-8') as f:
+                config.insert(
+                    0, '# Added by SkyPilot for ssh config of all clusters\n'
+                    f'{include_str}\n')
+                f.write(''.join(config).strip())
+                f.write('\n' * 2)
+
+    @classmethod
     def add_cluster(
         cls,
         cluster_name: str,
@@ -486,41 +530,7 @@ class SSHConfigHelper:
         if docker_user is not None:
             ip = 'localhost'
 
-        config_path = os.path.expanduser(cls.ssh_conf_path)
-        os.makedirs(os.path.dirname(config_path), exist_ok=True, mode=0o700)
-
-        if not os.path.exists(config_path):
-            config = ['\n']
-            with open(config_path,
-                      'w',
-                      encoding='utf-8',
-                      opener=functools.partial(os.open, mode=0o644)) as f:
-                f.writelines(config)
-
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config = f.readlines()
-
-        ssh_dir = cls.ssh_cluster_path.format('')
-        os.makedirs(os.path.expanduser(ssh_dir), exist_ok=True, mode=0o700)
-
-        # Handle Include on top of Config file
-        include_str = f'Include {cls.ssh_cluster_path.format("*")}'
-        found = False
-        for i, line in enumerate(config):
-            config_str = line.strip()
-            if config_str == include_str:
-                found = True
-                break
-            if 'Host' in config_str:
-                break
-        if not found:
-            # Did not find Include string. Insert `Include` lines.
-            with open(config_path, 'w', encoding='utf-8') as f:
-                config.insert(
-                    0, '# Added by SkyPilot for ssh config of all clusters\n'
-                    f'{include_str}\n')
-                f.write(''.join(config).strip())
-                f.write('\n' * 2)
+        cls._ensure_ssh_config_include()
 
         proxy_command = auth_config.get('ssh_proxy_command', None)
 
@@ -571,23 +581,28 @@ class SSHConfigHelper:
         cluster_config_path = os.path.expanduser(
             cls.ssh_cluster_path.format(cluster_name))
 
-        # Atomic write: shared FS readers never see a
-        # torn / zero-byte stanza file mid-update.
-        common_utils.atomic_write_text(cluster_config_path, codegen, mode=0o644)
+        with lock_events.FileLockEvent(
+                cls.ssh_conf_per_cluster_lock_path.format(cluster_name)):
+            # Atomic write: shared FS readers never see a
+            # torn / zero-byte stanza file mid-update.
+            common_utils.atomic_write_text(cluster_config_path,
+                                           codegen,
+                                           mode=0o644)
 
         # Also add to Windows SSH config if running in WSL
         # This enables VSCode on Windows to connect to clusters launched in WSL
         if common_utils.is_wsl():
-            cls._add_cluster_to_windows_ssh_config(
-                cluster_name=cluster_name,
-                cluster_name_on_cloud=cluster_name_on_cloud,
-                ips=ips,
-                username=username,
-                key_path=key_path_for_config,
-                ports=ports,
-                proxy_command=proxy_command,
-                uses_docker=docker_user is not None,
-            )
+            with lock_events.FileLockEvent(cls.ssh_conf_lock_path):
+                cls._add_cluster_to_windows_ssh_config(
+                    cluster_name=cluster_name,
+                    cluster_name_on_cloud=cluster_name_on_cloud,
+                    ips=ips,
+                    username=username,
+                    key_path=key_path_for_config,
+                    ports=ports,
+                    proxy_command=proxy_command,
+                    uses_docker=docker_user is not None,
+                )
 
     @classmethod
     def _remove_stale_cluster_config_for_backward_compatibility(
@@ -448,6 +448,24 @@ def contextual_async(
     return wrapper
 
 
+def with_current_context(func: Callable[P, T]) -> Callable[P, T]:
+    """Binds the function to the current context, for use in thread pools.
+
+    Threads of a pool do not inherit the contextvars of the caller, so the
+    SkyPilot context (e.g., the request's config and log redirection) would
+    be lost in the workers. Each call runs in its own copy of the caller's
+    context, as a contextvars Context cannot be entered by multiple threads
+    at the same time.
+    """
+    parent_context = contextvars.copy_context()
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        return parent_context.copy().run(func, *args, **kwargs)
+
+    return wrapper
+
+
 def initialize(
         base_context: Optional[SkyPilotContext] = None) -> SkyPilotContext:
     """Initialize the current SkyPilot context."""
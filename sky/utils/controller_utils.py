@@ -265,7 +265,11 @@ def high_availability_specified(cluster_name: Optional[str]) -> bool:
     controller = Controllers.from_name(cluster_name, expect_exact_match=False)
     if controller is None:
         return False
+    return controller_high_availability_specified(controller)
 
+
+def controller_high_availability_specified(controller: Controllers) -> bool:
+    """Same as high_availability_specified, for an identified controller."""
     if controller.value.controller_type == 'jobs':
         # pylint: disable-next=import-outside-toplevel
         from sky.jobs import utils as managed_job_utils
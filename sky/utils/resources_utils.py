@@ -1,4 +1,5 @@
 """Utility functions for resources."""
+import bisect
 import dataclasses
 import enum
 import itertools
@@ -309,12 +310,70 @@ def port_set_to_ranges(port_set: Optional[Set[int]]) -> List[str]:
     return ports
 
 
+def _port_ranges_to_intervals(
+        ports: Optional[List[str]]) -> List[Tuple[int, int]]:
+    """Parse a list of port ranges into sorted, merged (start, end) intervals.
+
+    Adjacent intervals are merged as well, so that the result never contains
+    two intervals that could be written as a single port range.
+    """
+    intervals: List[Tuple[int, int]] = []
+    for port in ports or []:
+        if port.isdigit():
+            check_port_str(port)
+            intervals.append((int(port), int(port)))
+        else:
+            check_port_range_str(port)
+            from_port, to_port = port.split('-')
+            intervals.append((int(from_port), int(to_port)))
+    merged: List[Tuple[int, int]] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1] + 1:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def merge_port_ranges(*ports_list: Optional[List[str]]) -> List[str]:
+    """Merge lists of port ranges into the fewest port ranges.
+
+    Same as port_set_to_ranges() on the union of port_ranges_to_set() of each
+    list, but without expanding the ranges into individual ports. For example,
+    ['1-3', '8'] and ['4', '6-7'] will be merged to ['1-4', '6-8'].
+    """
+    intervals = _port_ranges_to_intervals(
+        [port for ports in ports_list if ports for port in ports])
+    return [
+        str(start) if start == end else f'{start}-{end}'
+        for start, end in intervals
+    ]
+
+
+def port_ranges_cover(ports: Optional[List[str]],
+                      other_ports: Optional[List[str]]) -> bool:
+    """Returns whether the port ranges include all of the other port ranges.
+
+    Same as port_ranges_to_set(other_ports) <= port_ranges_to_set(ports), but
+    without expanding the ranges into individual ports.
+    """
+    intervals = _port_ranges_to_intervals(ports)
+    starts = [start for start, _ in intervals]
+    for start, end in _port_ranges_to_intervals(other_ports):
+        # The merged intervals are disjoint, so an interval is covered only if
+        # it is contained in the last interval starting at or before it.
+        idx = bisect.bisect_right(starts, start) - 1
+        if idx < 0 or intervals[idx][1] < end:
+            return False
+    return True
+
+
 def simplify_ports(ports: List[str]) -> List[str]:
     """Simplify a list of ports.
 
     For example, ['1-2', '3', '5-6', '7'] will be simplified to ['1-3', '5-7'].
     """
-    return port_set_to_ranges(port_ranges_to_set(ports))
+    return merge_port_ranges(ports)
 
 
 # The Kubernetes pod template writes the spec memory as decimal gigabytes
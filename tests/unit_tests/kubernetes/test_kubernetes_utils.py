@@ -5549,3 +5549,68 @@ class TestGetNodeAffinity:
             'requiredDuringSchedulingIgnoredDuringExecution',
             'preferredDuringSchedulingIgnoredDuringExecution',
         }
+
+
+def _make_annotated_pod(name: str, annotations):
+    pod = mock.MagicMock()
+    pod.metadata.name = name
+    pod.metadata.annotations = annotations
+    return pod
+
+
+@pytest.mark.parametrize('down,idle_minutes,expected_annotations', [
+    (True, 10, {
+        utils.IDLE_MINUTES_TO_AUTOSTOP_ANNOTATION_KEY: '10',
+        utils.AUTODOWN_ANNOTATION_KEY: 'true',
+    }),
+    (False, -1, {
+        utils.IDLE_MINUTES_TO_AUTOSTOP_ANNOTATION_KEY: None,
+        utils.AUTODOWN_ANNOTATION_KEY: None,
+    }),
+])
+def test_set_autodown_annotations_patches_each_pod_once(
+        down, idle_minutes, expected_annotations):
+    existing = {
+        utils.IDLE_MINUTES_TO_AUTOSTOP_ANNOTATION_KEY: '5',
+        utils.AUTODOWN_ANNOTATION_KEY: 'true',
+    }
+    pods = {
+        'pod-1': _make_annotated_pod('pod-1', dict(existing)),
+        'pod-2': _make_annotated_pod('pod-2', dict(existing)),
+    }
+    handle = mock.MagicMock()
+    handle.cluster_name_on_cloud = 'test-cluster'
+    with patch.object(utils.global_user_state, 'get_cluster_yaml_dict',
+                      return_value={'provider': {}}), \
+         patch.object(utils, 'get_namespace_from_config',
+                      return_value='default'), \
+         patch.object(utils, 'get_context_from_config',
+                      return_value='ctx'), \
+         patch.object(utils, 'filter_pods', return_value=pods), \
+         patch.object(utils.kubernetes, 'core_api') as mock_core_api:
+        utils.set_autodown_annotations(handle, idle_minutes, down=down)
+
+    patch_calls = mock_core_api.return_value.patch_namespaced_pod.call_args_list
+    assert sorted(c.kwargs['name'] for c in patch_calls) == ['pod-1', 'pod-2']
+    for c in patch_calls:
+        assert c.kwargs['body'] == {
+            'metadata': {
+                'annotations': expected_annotations
+            }
+        }
+
+
+def test_set_autodown_annotations_skips_pods_without_annotations():
+    pods = {'pod-1': _make_annotated_pod('pod-1', None)}
+    handle = mock.MagicMock()
+    with patch.object(utils.global_user_state, 'get_cluster_yaml_dict',
+                      return_value={'provider': {}}), \
+         patch.object(utils, 'get_namespace_from_config',
+                      return_value='default'), \
+         patch.object(utils, 'get_context_from_config',
+                      return_value='ctx'), \
+         patch.object(utils, 'filter_pods', return_value=pods), \
+         patch.object(utils.kubernetes, 'core_api') as mock_core_api:
+        utils.set_autodown_annotations(handle, -1, down=False)
+
+    mock_core_api.return_value.patch_namespaced_pod.assert_not_called()
@@ -1,9 +1,11 @@
+import copy
 import os
 import pathlib
 from unittest import mock
 
 import pytest
 
+import sky
 from sky import backends
 from sky import check as sky_check
 from sky import clouds
@@ -665,3 +667,85 @@ def test_make_safe_symlink_command_leaves_target_unquoted():
         source='/etc/config', target='~/.sky/file_mounts/etc/config')
     assert 'ln -s ~/.sky/file_mounts/etc/config /etc/config' in cmd
     assert "'~/.sky/file_mounts/etc/config'" not in cmd
+
+
+def test_touch_creates_and_preserves_file(tmp_path):
+    """touch() creates a missing file and never truncates an existing one."""
+    log_path = tmp_path / 'provision.log'
+    backend_utils.touch(str(log_path))
+    assert log_path.exists()
+    assert log_path.read_text() == ''
+    log_path.write_text('existing')
+    backend_utils.touch(str(log_path))
+    assert log_path.read_text() == 'existing'
+
+
+def test_task_resources_override_matches_set_resources():
+    """Passing resources= matches setting them on a copy of the task, without
+    touching the task itself."""
+    task = sky.Task(run='echo hi', num_nodes=2)
+    task.set_resources([
+        Resources(accelerators={'V100': 1}),
+        Resources(accelerators={'A100': 2}, cpus='4+'),
+    ])
+    original_resources = task.resources
+    chosen = list(task.resources)[1]
+
+    task_copy = copy.copy(task)
+    task_copy.set_resources(chosen)
+    task_copy.best_resources = None
+
+    assert backend_utils.get_task_resources_str(
+        task, resources=chosen) == backend_utils.get_task_resources_str(
+            task_copy) == '2x[A100:2]'
+    assert backend_utils.get_task_demands_dict(
+        task, chosen) == backend_utils.get_task_demands_dict(task_copy)
+    assert task.resources is original_resources
+
+
+def test_parallel_data_transfers_to_nodes_runs_every_pair():
+    runners = [mock.MagicMock(), mock.MagicMock()]
+    for runner in runners:
+        runner.run.return_value = (0, '', '')
+    transfers = [
+        backend_utils.DataTransfer(source='/local/a',
+                                   target='/remote/a',
+                                   cmd='mkdir -p /remote/a',
+                                   run_rsync=True,
+                                   action_message='Syncing'),
+        backend_utils.DataTransfer(source='s3://bucket/b',
+                                   target='/remote/b',
+                                   cmd='sync b',
+                                   run_rsync=False,
+                                   action_message='Syncing',
+                                   source_bashrc=True),
+    ]
+    backend_utils.parallel_data_transfers_to_nodes(runners,
+                                                   transfers,
+                                                   num_threads=4)
+    for runner in runners:
+        assert {
+            c.args[0]: c.kwargs['source_bashrc']
+            for c in runner.run.call_args_list
+        } == {
+            'mkdir -p /remote/a': False,
+            'sync b': True
+        }
+        runner.rsync.assert_called_once_with(source='/local/a',
+                                             target='/remote/a',
+                                             up=True,
+                                             log_path=os.devnull,
+                                             stream_logs=False)
+
+
+def test_parallel_data_transfers_to_nodes_raises_on_failed_command():
+    runner = mock.MagicMock()
+    runner.run.return_value = (1, '', 'error')
+    transfer = backend_utils.DataTransfer(source='/local/a',
+                                          target='/remote/a',
+                                          cmd='mkdir -p /remote/a',
+                                          run_rsync=True,
+                                          action_message='Syncing')
+    with pytest.raises(exceptions.CommandError):
+        backend_utils.parallel_data_transfers_to_nodes([runner], [transfer])
+    runner.rsync.assert_not_called()
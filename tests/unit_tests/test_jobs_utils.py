@@ -1464,3 +1464,11 @@ class TestCleanupExpiredApiAccessTokens:
     def test_no_expired_tokens_is_noop(self, mock_get_expired):
         mock_get_expired.return_value = []
         assert utils.cleanup_expired_api_access_tokens() == 0
+
+
+def test_latest_job_log_dir_codegen_supports_old_job_lib():
+    """The log dir lookup falls back for remote runtimes without
+    job_lib.get_log_dir_for_jobs."""
+    code = utils.ManagedJobCodeGen.get_latest_job_log_dir_by_name('my-job')
+    assert 'hasattr(job_lib, "get_log_dir_for_jobs")' in code
+    assert 'job_lib.run_timestamp_with_globbing_payload(' in code
@@ -1,5 +1,6 @@
 """Unit tests for CloudVmRayBackend task configuration redaction and locking."""
 
+import contextvars
 import multiprocessing
 import socket
 import time
@@ -16,7 +17,11 @@ from sky.backends import backend_utils
 from sky.backends import cloud_vm_ray_backend
 from sky.backends.cloud_vm_ray_backend import CloudVmRayResourceHandle
 from sky.backends.cloud_vm_ray_backend import SSHTunnelInfo
+from sky.skylet import constants
+from sky.utils import command_runner
+from sky.utils import context
 from sky.utils import locks
+from sky.utils import message_utils
 from sky.utils import status_lib
 
 
@@ -632,6 +637,204 @@ class TestCloudVmRayBackendTeardownNoLock:
         mock_run_on_head.assert_not_called()
         mock_get_yaml.assert_called_once_with(refreshed_handle.cluster_yaml)
 
+    @pytest.mark.parametrize('terminate,expect_ray_stop', [(True, False),
+                                                           (False, True)])
+    def test_ray_stop_only_when_stopping(self, monkeypatch, terminate,
+                                         expect_ray_stop):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        handle = self._make_handle('test-cluster',
+                                   '/tmp/test.yaml',
+                                   has_ray=True)
+        monkeypatch.setattr(
+            cloud_vm_ray_backend.backend_utils, 'refresh_cluster_status_handle',
+            MagicMock(return_value=(status_lib.ClusterStatus.UP, handle)))
+        monkeypatch.setattr(cloud_vm_ray_backend.global_user_state,
+                            'get_cluster_yaml_dict',
+                            MagicMock(return_value={'provider': {}}))
+        teardown_cluster = MagicMock()
+        monkeypatch.setattr(cloud_vm_ray_backend.provisioner,
+                            'teardown_cluster', teardown_cluster)
+        run_on_head = MagicMock()
+        monkeypatch.setattr(backend, 'run_on_head', run_on_head)
+        post_teardown_cleanup = MagicMock()
+        monkeypatch.setattr(backend, 'post_teardown_cleanup',
+                            post_teardown_cleanup)
+
+        backend.teardown_no_lock(handle,
+                                 terminate=terminate,
+                                 remove_from_db=False)
+
+        assert run_on_head.called == expect_ray_stop
+        teardown_cluster.assert_called_once()
+        post_teardown_cleanup.assert_called_once_with(
+            handle, terminate, False, False, config={'provider': {}})
+
+    def test_post_teardown_cleanup_reads_cluster_yaml_once(self, monkeypatch):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        handle = self._make_handle('test-cluster',
+                                   '/tmp/test.yaml',
+                                   has_ray=False)
+        handle.launched_resources.is_image_managed = False
+        get_yaml = MagicMock(return_value={'provider': {'region': 'r'}})
+        monkeypatch.setattr(cloud_vm_ray_backend.global_user_state,
+                            'get_cluster_yaml_dict', get_yaml)
+        monkeypatch.setattr(cloud_vm_ray_backend.global_user_state,
+                            'remove_cluster', MagicMock())
+        monkeypatch.setattr(cloud_vm_ray_backend.cluster_utils.SSHConfigHelper,
+                            'remove_cluster', MagicMock())
+        monkeypatch.setattr(cloud_vm_ray_backend.time, 'sleep', MagicMock())
+        # The node takes a few polls to reach the stopped state.
+        query_instances = MagicMock(side_effect=[
+            {
+                'n1': (status_lib.ClusterStatus.UP, None)
+            },
+            {
+                'n1': (status_lib.ClusterStatus.UP, None)
+            },
+            {
+                'n1': (status_lib.ClusterStatus.STOPPED, None)
+            },
+        ])
+        monkeypatch.setattr(cloud_vm_ray_backend.provision_lib,
+                            'query_instances', query_instances)
+
+        backend.post_teardown_cleanup(handle, terminate=False)
+
+        assert query_instances.call_count == 3
+        get_yaml.assert_called_once_with('/tmp/test.yaml')
+        for call in query_instances.call_args_list:
+            assert call.args[3] == {'region': 'r'}
+
+        # A config passed in by the caller is reused as is.
+        get_yaml.reset_mock()
+        query_instances.side_effect = None
+        query_instances.return_value = {}
+        backend.post_teardown_cleanup(handle,
+                                      terminate=False,
+                                      config={'provider': {
+                                          'region': 'r2'
+                                      }})
+        get_yaml.assert_not_called()
+        assert query_instances.call_args.args[3] == {'region': 'r2'}
+
+    def test_post_teardown_cleanup_backs_off_until_budget(self, monkeypatch):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        handle = self._make_handle('test-cluster',
+                                   '/tmp/test.yaml',
+                                   has_ray=False)
+        handle.launched_resources.is_image_managed = False
+        monkeypatch.setattr(cloud_vm_ray_backend.cluster_utils.SSHConfigHelper,
+                            'remove_cluster', MagicMock())
+        sleep = MagicMock()
+        monkeypatch.setattr(cloud_vm_ray_backend.time, 'sleep', sleep)
+        monkeypatch.setattr(
+            cloud_vm_ray_backend.provision_lib, 'query_instances',
+            MagicMock(return_value={'n1': (status_lib.ClusterStatus.UP, None)}))
+
+        with pytest.raises(RuntimeError, match='unexpected state'):
+            backend.post_teardown_cleanup(handle,
+                                          terminate=False,
+                                          config={'provider': {}})
+
+        waits = [call.args[0] for call in sleep.call_args_list]
+        # The waits grow from a short initial wait and stay within the budget.
+        assert waits[0] < waits[-1]
+        assert sum(waits) <= (
+            cloud_vm_ray_backend._TEARDOWN_WAIT_MAX_TOTAL_SECONDS)
+
+    def _patch_terminate_cleanup(self, monkeypatch, backend):
+        for name in ('cleanup_ports', 'cleanup_custom_multi_network',
+                     'cleanup_cluster_resources'):
+            monkeypatch.setattr(cloud_vm_ray_backend.provision_lib, name,
+                                MagicMock())
+        monkeypatch.setattr(cloud_vm_ray_backend.provision_lib,
+                            'query_instances', MagicMock(return_value={}))
+        monkeypatch.setattr(cloud_vm_ray_backend.metadata_utils,
+                            'remove_cluster_metadata', MagicMock())
+        monkeypatch.setattr(cloud_vm_ray_backend.global_user_state,
+                            'remove_cluster', MagicMock())
+        monkeypatch.setattr(cloud_vm_ray_backend.cluster_utils.SSHConfigHelper,
+                            'remove_cluster', MagicMock())
+        remove_cluster_config = MagicMock()
+        monkeypatch.setattr(backend, 'remove_cluster_config',
+                            remove_cluster_config)
+        return remove_cluster_config
+
+    def test_post_teardown_cleanup_runs_network_cleanups(self, monkeypatch):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        handle = self._make_handle('test-cluster',
+                                   '/tmp/test.yaml',
+                                   has_ray=False)
+        handle.launched_resources.is_image_managed = False
+        handle.launched_resources.ports = ['8080']
+        remove_cluster_config = self._patch_terminate_cleanup(
+            monkeypatch, backend)
+        provision_lib = cloud_vm_ray_backend.provision_lib
+
+        backend.post_teardown_cleanup(handle,
+                                      terminate=True,
+                                      config={'provider': {}})
+
+        provision_lib.cleanup_ports.assert_called_once()
+        provision_lib.cleanup_custom_multi_network.assert_called_once()
+        provision_lib.cleanup_cluster_resources.assert_called_once()
+        remove_cluster_config.assert_called_once_with(handle)
+
+    def test_post_teardown_cleanup_runs_with_request_context(
+            self, monkeypatch):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        handle = self._make_handle('test-cluster',
+                                   '/tmp/test.yaml',
+                                   has_ray=False)
+        handle.launched_resources.is_image_managed = False
+        handle.launched_resources.ports = ['8080']
+        self._patch_terminate_cleanup(monkeypatch, backend)
+        provision_lib = cloud_vm_ray_backend.provision_lib
+        contexts = []
+        for name in ('cleanup_ports', 'cleanup_custom_multi_network'):
+            getattr(provision_lib, name).side_effect = (
+                lambda *args, **kwargs: contexts.append(context.get()))
+
+        def _cleanup():
+            ctx = context.initialize()
+            backend.post_teardown_cleanup(handle,
+                                          terminate=True,
+                                          config={'provider': {}})
+            return ctx
+
+        # The cleanups run in pool threads, which must see the request's
+        # context.
+        ctx = contextvars.copy_context().run(_cleanup)
+        assert contexts == [ctx, ctx]
+
+    def test_post_teardown_cleanup_keeps_config_on_purged_failure(
+            self, monkeypatch):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        handle = self._make_handle('test-cluster',
+                                   '/tmp/test.yaml',
+                                   has_ray=False)
+        handle.launched_resources.is_image_managed = False
+        handle.launched_resources.ports = ['8080']
+        remove_cluster_config = self._patch_terminate_cleanup(
+            monkeypatch, backend)
+        provision_lib = cloud_vm_ray_backend.provision_lib
+        provision_lib.cleanup_ports.side_effect = ValueError('boom')
+
+        backend.post_teardown_cleanup(handle,
+                                      terminate=True,
+                                      purge=True,
+                                      config={'provider': {}})
+
+        # The other cleanup still runs, but the config is kept so that the
+        # ports can be cleaned up later.
+        provision_lib.cleanup_custom_multi_network.assert_called_once()
+        remove_cluster_config.assert_not_called()
+
+        with pytest.raises(ValueError, match='boom'):
+            backend.post_teardown_cleanup(handle,
+                                          terminate=True,
+                                          config={'provider': {}})
+
 
 class TestNewHandleRuntimeMetadata:
     """Runtime metadata a freshly constructed handle starts with."""
@@ -655,6 +858,32 @@ class TestNewHandleRuntimeMetadata:
                 metadata.ssh_available) == (False, False, False, False)
 
 
+class TestParseAddJobResult:
+    """Parsing of the legacy add_job output."""
+
+    def test_job_id_and_log_dir(self):
+        result = 'Job ID: 42\nLog Dir: ~/sky_logs/sky-2024-01-01\n'
+        assert cloud_vm_ray_backend._parse_add_job_result(result) == (
+            42, '~/sky_logs/sky-2024-01-01')
+
+    def test_ignores_noise_around_output(self):
+        result = ('LC_ALL: cannot change locale\nJob ID: 7\n'
+                  'Log Dir: ~/sky_logs/7-job\n')
+        assert cloud_vm_ray_backend._parse_add_job_result(result) == (
+            7, '~/sky_logs/7-job')
+
+    def test_legacy_outputs(self):
+        assert cloud_vm_ray_backend._parse_add_job_result('Job ID: 3\n') == (
+            3, None)
+        assert cloud_vm_ray_backend._parse_add_job_result('3\n') == (3, None)
+
+    def test_invalid_output_raises(self):
+        with pytest.raises(ValueError):
+            cloud_vm_ray_backend._parse_add_job_result('Job ID: abc\n')
+        with pytest.raises(ValueError):
+            cloud_vm_ray_backend._parse_add_job_result('')
+
+
 class TestProvisionClusterLockParking:
     """_provision on lock contention: park as WAITING only in request ctx."""
 
@@ -738,3 +967,424 @@ class TestProvisionClusterLockParking:
                                      is_launched_by_jobs_controller=True)
         assert result is sentinel
         assert locked_provision.call_count == 2
+
+
+class TestRetryingVmProvisionerLogDir:
+    """_retry_zones creates the provision log before launching."""
+
+    def test_creates_log_dir_and_provision_log(self, monkeypatch, tmp_path):
+        log_dir = tmp_path / 'logs' / 'sky-launch'
+        provisioner = cloud_vm_ray_backend.RetryingVmProvisioner(
+            str(log_dir),
+            MagicMock(),
+            MagicMock(),
+            set(),
+            MagicMock(),
+            'wheel-hash',
+            extra_launch_context={})
+        monkeypatch.setattr('sky.utils.rich_utils.force_update_status',
+                            lambda msg: None)
+        to_provision = MagicMock(spec=['assert_launchable'])
+        # Stop right after the log is set up.
+        to_provision.assert_launchable.side_effect = RuntimeError('stop')
+
+        with pytest.raises(RuntimeError, match='stop'):
+            provisioner._retry_zones(to_provision,
+                                     num_nodes=1,
+                                     requested_resources=set(),
+                                     dryrun=False,
+                                     stream_logs=False,
+                                     cluster_name='test-cluster',
+                                     cloud_user_identity=None,
+                                     prev_cluster_status=None,
+                                     prev_handle=None,
+                                     prev_cluster_ever_up=False,
+                                     skip_if_config_hash_matches=None,
+                                     volume_mounts=None,
+                                     task=MagicMock())
+
+        assert (log_dir / 'provision.log').is_file()
+
+
+class TestTeardownLockRetry:
+    """_teardown retries the cluster status lock with backoff."""
+
+    def _setup_teardown(self, monkeypatch, lock_enter_side_effect):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        handle = MagicMock()
+        handle.cluster_name = 'test-cluster'
+        lock = MagicMock()
+        lock.__enter__.side_effect = lock_enter_side_effect
+        monkeypatch.setattr('sky.backends.backend_utils.check_owner_identity',
+                            lambda cluster_name: None)
+        self.kill_cluster_requests = MagicMock()
+        monkeypatch.setattr(
+            'sky.server.requests.requests.kill_cluster_requests',
+            self.kill_cluster_requests)
+        monkeypatch.setattr('sky.utils.locks.get_lock',
+                            lambda *args, **kwargs: lock)
+        sleep = MagicMock()
+        monkeypatch.setattr(cloud_vm_ray_backend.time, 'sleep', sleep)
+        teardown_no_lock = MagicMock()
+        monkeypatch.setattr(backend, 'teardown_no_lock', teardown_no_lock)
+        return backend, handle, lock, sleep, teardown_no_lock
+
+    def test_no_force_unlock_when_lock_is_free(self, monkeypatch):
+        backend, handle, lock, sleep, teardown_no_lock = self._setup_teardown(
+            monkeypatch, None)
+        backend._teardown(handle, terminate=False)
+        teardown_no_lock.assert_called_once()
+        sleep.assert_not_called()
+        lock.force_unlock.assert_not_called()
+        # teardown_no_lock() kills the requests within the lock.
+        self.kill_cluster_requests.assert_not_called()
+        assert not teardown_no_lock.call_args.kwargs['already_killed_requests']
+
+    def test_retries_with_backoff(self, monkeypatch):
+        backend, handle, lock, sleep, teardown_no_lock = self._setup_teardown(
+            monkeypatch, [locks.LockTimeout('locked'), None])
+        backend._teardown(handle, terminate=False)
+        teardown_no_lock.assert_called_once()
+        # The holder is killed and the lock released only on the retry.
+        lock.force_unlock.assert_called_once()
+        self.kill_cluster_requests.assert_called_once_with(
+            'test-cluster', 'sky.stop')
+        assert teardown_no_lock.call_args.kwargs['already_killed_requests']
+        sleep.assert_called_once()
+
+    def test_failed_kill_is_retried_within_lock(self, monkeypatch):
+        backend, handle, _, _, teardown_no_lock = self._setup_teardown(
+            monkeypatch, [locks.LockTimeout('locked'), None])
+        self.kill_cluster_requests.side_effect = RuntimeError('db error')
+        backend._teardown(handle, terminate=False)
+        assert not teardown_no_lock.call_args.kwargs['already_killed_requests']
+
+    def test_raises_after_max_attempts(self, monkeypatch):
+        backend, handle, _, sleep, teardown_no_lock = self._setup_teardown(
+            monkeypatch, locks.LockTimeout('locked'))
+        with pytest.raises(RuntimeError, match='is locked by'):
+            backend._teardown(handle, terminate=False)
+        teardown_no_lock.assert_not_called()
+        assert (sleep.call_count ==
+                cloud_vm_ray_backend._TEARDOWN_LOCK_MAX_ATTEMPTS - 1)
+
+
+class TestTeardownEphemeralStorage:
+    """_teardown_ephemeral_storage deletes only non-persistent storages."""
+
+    def _make_task(self, *storages):
+        t = MagicMock()
+        t.storage_mounts = {f'/mnt/{i}': s for i, s in enumerate(storages)}
+        return t
+
+    def test_deletes_ephemeral_storages(self):
+        ephemeral = [MagicMock(persistent=False) for _ in range(3)]
+        persistent = MagicMock(persistent=True)
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        backend._teardown_ephemeral_storage(
+            self._make_task(*ephemeral, persistent))
+        for storage in ephemeral:
+            storage.delete.assert_called_once()
+        persistent.delete.assert_not_called()
+
+    def test_single_failure_is_reraised(self):
+        failing = MagicMock(persistent=False)
+        failing.delete.side_effect = exceptions.StorageBucketDeleteError('x')
+        other = MagicMock(persistent=False)
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        with pytest.raises(exceptions.StorageBucketDeleteError):
+            backend._teardown_ephemeral_storage(self._make_task(failing, other))
+        other.delete.assert_called_once()
+
+    def test_multiple_failures_are_aggregated(self):
+        failing = [MagicMock(persistent=False) for _ in range(2)]
+        for storage in failing:
+            storage.delete.side_effect = ValueError('boom')
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        with pytest.raises(RuntimeError, match='Failed to delete 2'):
+            backend._teardown_ephemeral_storage(self._make_task(*failing))
+
+    def test_deletes_with_request_context(self):
+        contexts = []
+        storages = [MagicMock(persistent=False) for _ in range(2)]
+        for storage in storages:
+            storage.delete.side_effect = lambda: contexts.append(context.get())
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+
+        def _teardown():
+            ctx = context.initialize()
+            backend._teardown_ephemeral_storage(self._make_task(*storages))
+            return ctx
+
+        # The storages are deleted in pool threads, which must see the
+        # request's context.
+        ctx = contextvars.copy_context().run(_teardown)
+        assert contexts == [ctx, ctx]
+
+
+class TestSyncDownLogs:
+    """sync_down_logs maps remote job log dirs to local dirs."""
+
+    def test_maps_and_syncs_each_job_on_each_node(self, monkeypatch, tmp_path):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        handle = MagicMock()
+        handle.cluster_name = 'test-cluster'
+        handle.is_grpc_enabled_with_flag = False
+        runners = [MagicMock(), MagicMock()]
+        handle.get_command_runners.return_value = runners
+        payload = message_utils.encode_payload({
+            '1': f'{constants.SKY_LOGS_DIRECTORY}/1-job',
+            # Legacy runtimes return the run timestamp only.
+            '2': 'sky-2024-01-01',
+        })
+        monkeypatch.setattr(backend, 'run_on_head',
+                            MagicMock(return_value=(0, payload, '')))
+
+        result = backend.sync_down_logs(handle, ['1', '2'],
+                                        local_dir=str(tmp_path))
+
+        assert result == {
+            '1': str(tmp_path / 'test-cluster' / '1-job'),
+            '2': str(tmp_path / 'test-cluster' / 'sky-2024-01-01'),
+        }
+        for local_log_dir in result.values():
+            assert (tmp_path / local_log_dir).is_dir()
+        for runner in runners:
+            # Every (job, node) pair is synced in parallel.
+            sources = sorted(
+                call.kwargs['source']
+                for call in runner.rsync_driver.call_args_list)
+            assert sources == [
+                f'{constants.SKY_LOGS_DIRECTORY}/1-job/',
+                f'{constants.SKY_LOGS_DIRECTORY}/sky-2024-01-01/',
+            ]
+
+
+class TestSyncDownManagedJobLogs:
+    """sync_down_managed_job_logs looks up only what it needs."""
+
+    def test_job_id_skips_log_dir_lookup(self, monkeypatch, tmp_path):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        handle = MagicMock()
+        handle.is_grpc_enabled_with_flag = False
+        run_on_head = MagicMock(return_value=0)
+        monkeypatch.setattr(backend, 'run_on_head', run_on_head)
+        monkeypatch.setattr(cloud_vm_ray_backend,
+                            '_install_interrupt_handlers', lambda: None)
+
+        result = backend.sync_down_managed_job_logs(handle,
+                                                    job_id=3,
+                                                    local_dir=str(tmp_path))
+
+        local_log_dir = str(tmp_path / 'managed_jobs' / 'managed-jobs-3')
+        assert result == {'3': local_log_dir}
+        # Only the log streaming itself runs on the head node.
+        run_on_head.assert_called_once()
+        assert run_on_head.call_args.kwargs['log_path'] == str(
+            tmp_path / 'managed_jobs' / 'managed-jobs-3' / 'run.log')
+
+
+class TestInstallInterruptHandlers:
+    """_install_interrupt_handlers only installs missing handlers."""
+
+    def test_installs_missing_handlers_only(self, monkeypatch):
+        installed = {}
+        monkeypatch.setattr(cloud_vm_ray_backend.signal, 'getsignal',
+                            lambda sig: installed.get(sig))
+        set_signal = MagicMock(
+            side_effect=lambda sig, handler: installed.update({sig: handler}))
+        monkeypatch.setattr(cloud_vm_ray_backend.signal, 'signal', set_signal)
+
+        cloud_vm_ray_backend._install_interrupt_handlers()
+        assert set_signal.call_count == 2
+        cloud_vm_ray_backend._install_interrupt_handlers()
+        assert set_signal.call_count == 2
+
+        # Handlers replaced by someone else are installed again.
+        installed[cloud_vm_ray_backend.signal.SIGINT] = None
+        cloud_vm_ray_backend._install_interrupt_handlers()
+        assert set_signal.call_count == 3
+
+
+@pytest.mark.parametrize('paths,expected', [
+    (['/data', '/models', '~/code'], False),
+    (['/data', '/data-b', '~/data'], False),
+    (['/data', '/data/sub'], True),
+    (['/data/sub/', '/data'], True),
+    (['~/code', '~/code'], True),
+    (['~/code/a', '~/code'], True),
+    ([], False),
+])
+def test_has_nested_paths(paths, expected):
+    assert cloud_vm_ray_backend._has_nested_paths(paths) is expected
+
+
+class TestSyncPathWorkdir:
+    """_sync_path_workdir uploads once and copies from the head node."""
+
+    def _sync(self, monkeypatch, tmp_path, runner_cls, head_returncode=0):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        backend.log_dir = str(tmp_path / 'logs')
+        workdir = tmp_path / 'workdir'
+        workdir.mkdir()
+        (workdir / constants.SKY_IGNORE_FILE).write_text('outputs/\n')
+        monkeypatch.setattr(backend_utils, 'path_size_megabytes',
+                            lambda path: 0)
+        runners = [MagicMock(spec=runner_cls) for _ in range(2)]
+        runners[0].ssh_user = 'ubuntu'
+        runners[0].run.return_value = head_returncode
+        handle = MagicMock()
+        handle.docker_user = None
+        handle.launched_nodes = 2
+        handle.external_ips.return_value = ['1.2.3.4', '5.6.7.8']
+        handle.internal_ips.return_value = ['10.0.0.1', '10.0.0.2']
+        handle.get_command_runners.return_value = runners
+        backend._sync_path_workdir(handle, str(workdir))
+        return runners
+
+    def test_ssh_workers_sync_from_head(self, monkeypatch, tmp_path):
+        head, worker = self._sync(monkeypatch, tmp_path,
+                                  command_runner.SSHCommandRunner)
+        head.rsync.assert_called_once()
+        worker.rsync.assert_not_called()
+        rsync_cmd = head.run.call_args.args[0]
+        assert 'ubuntu@10.0.0.2:' in rsync_cmd
+        # The head node applies the same filters as the upload from local.
+        assert command_runner.RSYNC_FILTER_SKYIGNORE in rsync_cmd
+
+    def test_failed_copy_from_head_falls_back_to_local(self, monkeypatch,
+                                                       tmp_path):
+        head, worker = self._sync(monkeypatch,
+                                  tmp_path,
+                                  command_runner.SSHCommandRunner,
+                                  head_returncode=1)
+        head.rsync.assert_called_once()
+        worker.rsync.assert_called_once()
+
+    def test_non_ssh_runners_sync_from_local(self, monkeypatch, tmp_path):
+        runners = self._sync(monkeypatch, tmp_path,
+                             command_runner.KubernetesCommandRunner)
+        for runner in runners:
+            runner.rsync.assert_called_once()
+            runner.run.assert_not_called()
+
+
+class TestExecuteStorageMounts:
+    """_execute_storage_mounts mounts all storages in one batch."""
+
+    def _make_storage(self, name):
+        from sky.data import storage as storage_lib
+        store = MagicMock()
+        store.mount_command.side_effect = lambda dst, read_only: f'mount {dst}'
+        storage_obj = MagicMock()
+        storage_obj.mode = storage_lib.StorageMode.MOUNT
+        storage_obj.mount_config = None
+        storage_obj.source = None
+        storage_obj.name = name
+        storage_obj.stores = {'s3': store}
+        return storage_obj
+
+    def _run(self, tmp_path, returncodes):
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        backend.log_dir = str(tmp_path)
+        handle = MagicMock()
+        runner = MagicMock()
+        runner.run.side_effect = lambda cmd, **kwargs: (returncodes.get(
+            cmd, 0), '', '')
+        handle.get_command_runners.return_value = [runner]
+        storage_mounts = {
+            '/data': self._make_storage('data'),
+            '/models': self._make_storage('models'),
+        }
+        backend._execute_storage_mounts(handle, storage_mounts)
+        return runner
+
+    def test_mounts_every_storage(self, tmp_path):
+        runner = self._run(tmp_path, {})
+        assert sorted(call.args[0] for call in runner.run.call_args_list
+                     ) == ['mount /data', 'mount /models']
+
+    def test_non_empty_mount_path_names_the_failing_path(self, tmp_path):
+        with pytest.raises(RuntimeError, match='/models'):
+            self._run(tmp_path,
+                      {'mount /models': exceptions.MOUNT_PATH_NON_EMPTY_CODE})
+
+
+class TestExecuteFileMounts:
+    """_execute_file_mounts prepares, syncs and links each mount at once."""
+
+    def test_symlink_created_with_each_mount(self, monkeypatch, tmp_path):
+        src_dir = tmp_path / 'src'
+        src_dir.mkdir()
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        backend.log_dir = str(tmp_path / 'logs')
+        monkeypatch.setattr(backend_utils, 'path_size_megabytes',
+                            lambda path: 0)
+        handle = MagicMock()
+        runner = MagicMock()
+        runner.run.return_value = (0, '', '')
+        handle.get_command_runners.return_value = [runner]
+
+        backend._execute_file_mounts(handle, {
+            '/data': str(src_dir),
+            '~/code': str(src_dir),
+        })
+
+        commands = sorted(call.args[0] for call in runner.run.call_args_list)
+        # One command per mount, without a separate symlink round.
+        assert len(commands) == 2
+        wrapped_data = backend_utils.FileMountHelper.wrap_file_mount('/data')
+        data_cmd = next(cmd for cmd in commands if wrapped_data in cmd)
+        assert data_cmd.startswith(f'mkdir -p {wrapped_data} && ')
+        assert f'ln -s {wrapped_data} /data' in data_cmd
+        code_cmd = next(cmd for cmd in commands if cmd != data_cmd)
+        assert code_cmd == 'mkdir -p ~/code'
+        assert sorted(call.kwargs['target']
+                      for call in runner.rsync.call_args_list) == sorted(
+                          [wrapped_data, '~/code'])
+
+    def test_size_warning_printed_when_sync_fails(self, monkeypatch,
+                                                  tmp_path):
+        src_dir = tmp_path / 'src'
+        src_dir.mkdir()
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        backend.log_dir = str(tmp_path / 'logs')
+        warning = MagicMock()
+        monkeypatch.setattr(backend_utils, 'path_size_megabytes',
+                            lambda path: 10**6)
+        monkeypatch.setattr(cloud_vm_ray_backend.logger, 'warning', warning)
+        handle = MagicMock()
+        runner = MagicMock()
+        runner.run.return_value = (0, '', '')
+        runner.rsync.side_effect = RuntimeError('sync failed')
+        handle.get_command_runners.return_value = [runner]
+
+        with pytest.raises(RuntimeError, match='sync failed'):
+            backend._execute_file_mounts(handle, {'~/code': str(src_dir)})
+
+        warning.assert_called_once()
+        assert 'The size of file mount src' in warning.call_args.args[0]
+
+
+class TestStorageMountsMetadata:
+    """Restoring the storage mounts of a cluster from its metadata."""
+
+    def test_get_restores_every_storage(self, monkeypatch):
+        from sky.data import storage as storage_lib
+        backend = cloud_vm_ray_backend.CloudVmRayBackend()
+        metadata = {'/data': 'data-meta', '/models': 'models-meta'}
+        monkeypatch.setattr(
+            cloud_vm_ray_backend.global_user_state,
+            'get_cluster_storage_mounts_metadata',
+            lambda cluster_name: metadata)
+        from_metadata = MagicMock(
+            side_effect=lambda meta, **kwargs: f'storage({meta})')
+        monkeypatch.setattr(storage_lib.Storage, 'from_metadata',
+                            from_metadata)
+
+        assert backend.get_storage_mounts_metadata('c1') == {
+            '/data': 'storage(data-meta)',
+            '/models': 'storage(models-meta)',
+        }
+        for call in from_metadata.call_args_list:
+            assert call.kwargs == {'sync_on_reconstruction': False}
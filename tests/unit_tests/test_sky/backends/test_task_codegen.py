@@ -229,6 +229,34 @@ def test_slurm_codegen_with_container():
                                     testdata_dir=SLURM_TESTDATA_DIR)
 
 
+@pytest.mark.parametrize('make_codegen', [
+    task_codegen.RayCodeGen,
+    lambda: task_codegen.SlurmCodeGen(slurm_job_id='12345',
+                                      container_name=None),
+])
+def test_resources_dict_not_mutated(make_codegen):
+    """The backend passes the same demands dict to add_setup and add_task."""
+    codegen = make_codegen()
+    codegen.add_prologue(job_id=1)
+    resources_dict = {'CPU': 4.0, 'GPU': 1.0}
+    codegen.add_setup(
+        1,
+        resources_dict=resources_dict,
+        stable_cluster_internal_ips=['10.0.0.1'],
+        env_vars={},
+        log_dir='/sky/logs',
+        setup_cmd=None,
+    )
+    codegen.add_task(
+        1,
+        bash_script='python train.py',
+        task_name='train_task',
+        resources_dict=resources_dict,
+        log_dir='/sky/logs/tasks',
+    )
+    assert resources_dict == {'CPU': 4.0, 'GPU': 1.0}
+
+
 class TestRcloneFlushScript:
     """Unit tests for the rclone flush script output format."""
 
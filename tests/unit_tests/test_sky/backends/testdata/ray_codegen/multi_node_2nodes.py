@@ -534,80 +534,44 @@ job_ip_rank_list = sorted(
 job_ip_rank_map = {ip: i for i, ip in enumerate(job_ip_rank_list)}
 job_ip_list_str = '\n'.join(job_ip_rank_list)
 
-sky_env_vars_dict = {}
-sky_env_vars_dict['SKYPILOT_NODE_IPS'] = job_ip_list_str
-sky_env_vars_dict['SKYPILOT_NUM_NODES'] = len(job_ip_rank_list)
-
-sky_env_vars_dict['SKYPILOT_TASK_ID'] = 'sky-2024-11-17-00-00-00-000002-cluster-3'
+task_env_vars = {'SKYPILOT_TASK_ID': 'sky-2024-11-17-00-00-00-000002-cluster-3'}
 script = 'unset RAY_RAYLET_PID; echo "Running on node $SKYPILOT_NODE_RANK"\n__skypilot_user_exit_code=$?\n# Only waits if cached mount is enabled (RCLONE_MOUNT_CACHED_LOG_DIR is not empty)\n# findmnt alone is not enough, as some clouds (e.g. AWS on ARM64) uses\n# rclone for normal mounts as well.\nif [ $(findmnt -t fuse.rclone --noheading | wc -l) -gt 0 ] &&            [ -d ~/.sky/rclone_log ] &&            [ "$(ls -A ~/.sky/rclone_log)" ]; then\n    FLUSH_START_TIME=$(date +%s)\n    flushed=0\n    # extra second on top of --vfs-cache-poll-interval to\n    # avoid race condition between rclone log line creation and this check.\n    sleep 1\n    while [ $flushed -eq 0 ]; do\n        # sleep for the same interval as --vfs-cache-poll-interval\n        sleep 10\n        flushed=1\n        for file in ~/.sky/rclone_log/*; do\n            exitcode=0\n            tac $file | grep "vfs cache: cleaned:" -m 1 | grep "in use 0, to upload 0, uploading 0" -q || exitcode=$?\n            if [ $exitcode -ne 0 ]; then\n                ELAPSED=$(($(date +%s) - FLUSH_START_TIME))\n                # Extract the last vfs cache status line to show what we\'re waiting for\n                CACHE_STATUS=$(tac $file | grep "vfs cache: cleaned:" -m 1 | sed \'s/.*vfs cache: cleaned: //\' 2>/dev/null)\n                # Extract currently uploading files from recent log lines (show up to 2 files)\n                UPLOADING_FILES=$(tac $file | head -30 | grep -E "queuing for upload" | head -2 | sed \'s/.*INFO  : //\' | sed \'s/: vfs cache:.*//\' | tr \'\\n\' \',\' | sed \'s/,$//\' | sed \'s/,/, /g\' 2>/dev/null)\n                # Build status message with available info\n                if [ -n "$CACHE_STATUS" ] && [ -n "$UPLOADING_FILES" ]; then\n                    echo "skypilot: cached mount is still uploading (elapsed: ${ELAPSED}s) [${CACHE_STATUS}] uploading: ${UPLOADING_FILES}"\n                elif [ -n "$CACHE_STATUS" ]; then\n                    echo "skypilot: cached mount is still uploading (elapsed: ${ELAPSED}s) [${CACHE_STATUS}]"\n                else\n                    # Fallback: show last non-empty line from log\n                    LAST_LINE=$(tac $file | grep -v "^$" | head -1 | sed \'s/.*INFO  : //\' | sed \'s/.*ERROR : //\' | sed \'s/.*NOTICE: //\' 2>/dev/null)\n                    if [ -n "$LAST_LINE" ]; then\n                        echo "skypilot: cached mount is still uploading (elapsed: ${ELAPSED}s) ${LAST_LINE}"\n                    else\n                        echo "skypilot: cached mount is still uploading (elapsed: ${ELAPSED}s)"\n                    fi\n                fi\n                flushed=0\n                break\n            fi\n        done\n    done\n    TOTAL_FLUSH_TIME=$(($(date +%s) - FLUSH_START_TIME))\n    echo "skypilot: cached mount upload complete (took ${TOTAL_FLUSH_TIME}s)"\nfi\nexit $__skypilot_user_exit_code'
 
 if script is not None:
-    sky_env_vars_dict['SKYPILOT_NUM_GPUS_PER_NODE'] = 0
-
-    ip = gang_scheduling_id_to_ip[0]
-    rank = job_ip_rank_map[ip]
-
-    if len(cluster_ips_to_node_id) == 1: # Single-node task on single-node cluter
-        name_str = 'distributed_task,' if 'distributed_task' != None else 'task,'
-        log_path = os.path.expanduser(os.path.join('/sky/logs/tasks', 'run.log'))
-    else: # Single-node or multi-node task on multi-node cluster
-        idx_in_cluster = cluster_ips_to_node_id.get(ip, len(cluster_ips_to_node_id) + 0)
-        if idx_in_cluster == 0:
-            node_name = 'head'
-        else:
-            node_name = f'worker{idx_in_cluster}'
-        name_str = f'{node_name}, rank={rank},'
-        log_path = os.path.expanduser(os.path.join('/sky/logs/tasks', f'{rank}-{node_name}.log'))
-    sky_env_vars_dict['SKYPILOT_NODE_RANK'] = rank
-
-    sky_env_vars_dict['SKYPILOT_INTERNAL_JOB_ID'] = 3
-
-    futures.append(run_bash_command_with_log_and_return_pid \
-            .options(name=name_str, num_cpus=2.0, scheduling_strategy=ray.util.scheduling_strategies.PlacementGroupSchedulingStrategy(placement_group=pg, placement_group_bundle_index=0)) \
-            .remote(
-                script,
-                log_path,
-                env_vars=sky_env_vars_dict,
-                stream_logs=True,
-                with_ray=True,
-            ))
-sky_env_vars_dict = {}
-sky_env_vars_dict['SKYPILOT_NODE_IPS'] = job_ip_list_str
-sky_env_vars_dict['SKYPILOT_NUM_NODES'] = len(job_ip_rank_list)
-
-sky_env_vars_dict['SKYPILOT_TASK_ID'] = 'sky-2024-11-17-00-00-00-000002-cluster-3'
-script = 'unset RAY_RAYLET_PID; echo "Running on node $SKYPILOT_NODE_RANK"\n__skypilot_user_exit_code=$?\n# Only waits if cached mount is enabled (RCLONE_MOUNT_CACHED_LOG_DIR is not empty)\n# findmnt alone is not enough, as some clouds (e.g. AWS on ARM64) uses\n# rclone for normal mounts as well.\nif [ $(findmnt -t fuse.rclone --noheading | wc -l) -gt 0 ] &&            [ -d ~/.sky/rclone_log ] &&            [ "$(ls -A ~/.sky/rclone_log)" ]; then\n    FLUSH_START_TIME=$(date +%s)\n    flushed=0\n    # extra second on top of --vfs-cache-poll-interval to\n    # avoid race condition between rclone log line creation and this check.\n    sleep 1\n    while [ $flushed -eq 0 ]; do\n        # sleep for the same interval as --vfs-cache-poll-interval\n        sleep 10\n        flushed=1\n        for file in ~/.sky/rclone_log/*; do\n            exitcode=0\n            tac $file | grep "vfs cache: cleaned:" -m 1 | grep "in use 0, to upload 0, uploading 0" -q || exitcode=$?\n            if [ $exitcode -ne 0 ]; then\n                ELAPSED=$(($(date +%s) - FLUSH_START_TIME))\n                # Extract the last vfs cache status line to show what we\'re waiting for\n                CACHE_STATUS=$(tac $file | grep "vfs cache: cleaned:" -m 1 | sed \'s/.*vfs cache: cleaned: //\' 2>/dev/null)\n                # Extract currently uploading files from recent log lines (show up to 2 files)\n                UPLOADING_FILES=$(tac $file | head -30 | grep -E "queuing for upload" | head -2 | sed \'s/.*INFO  : //\' | sed \'s/: vfs cache:.*//\' | tr \'\\n\' \',\' | sed \'s/,$//\' | sed \'s/,/, /g\' 2>/dev/null)\n                # Build status message with available info\n                if [ -n "$CACHE_STATUS" ] && [ -n "$UPLOADING_FILES" ]; then\n                    echo "skypilot: cached mount is still uploading (elapsed: ${ELAPSED}s) [${CACHE_STATUS}] uploading: ${UPLOADING_FILES}"\n                elif [ -n "$CACHE_STATUS" ]; then\n                    echo "skypilot: cached mount is still uploading (elapsed: ${ELAPSED}s) [${CACHE_STATUS}]"\n                else\n                    # Fallback: show last non-empty line from log\n                    LAST_LINE=$(tac $file | grep -v "^$" | head -1 | sed \'s/.*INFO  : //\' | sed \'s/.*ERROR : //\' | sed \'s/.*NOTICE: //\' 2>/dev/null)\n                    if [ -n "$LAST_LINE" ]; then\n                        echo "skypilot: cached mount is still uploading (elapsed: ${ELAPSED}s) ${LAST_LINE}"\n                    else\n                        echo "skypilot: cached mount is still uploading (elapsed: ${ELAPSED}s)"\n                    fi\n                fi\n                flushed=0\n                break\n            fi\n        done\n    done\n    TOTAL_FLUSH_TIME=$(($(date +%s) - FLUSH_START_TIME))\n    echo "skypilot: cached mount upload complete (took ${TOTAL_FLUSH_TIME}s)"\nfi\nexit $__skypilot_user_exit_code'
-
-if script is not None:
-    sky_env_vars_dict['SKYPILOT_NUM_GPUS_PER_NODE'] = 0
-
-    ip = gang_scheduling_id_to_ip[1]
-    rank = job_ip_rank_map[ip]
-
-    if len(cluster_ips_to_node_id) == 1: # Single-node task on single-node cluter
-        name_str = 'distributed_task,' if 'distributed_task' != None else 'task,'
-        log_path = os.path.expanduser(os.path.join('/sky/logs/tasks', 'run.log'))
-    else: # Single-node or multi-node task on multi-node cluster
-        idx_in_cluster = cluster_ips_to_node_id.get(ip, len(cluster_ips_to_node_id) + 1)
-        if idx_in_cluster == 0:
-            node_name = 'head'
-        else:
-            node_name = f'worker{idx_in_cluster}'
-        name_str = f'{node_name}, rank={rank},'
-        log_path = os.path.expanduser(os.path.join('/sky/logs/tasks', f'{rank}-{node_name}.log'))
-    sky_env_vars_dict['SKYPILOT_NODE_RANK'] = rank
-
-    sky_env_vars_dict['SKYPILOT_INTERNAL_JOB_ID'] = 3
-
-    futures.append(run_bash_command_with_log_and_return_pid \
-            .options(name=name_str, num_cpus=2.0, scheduling_strategy=ray.util.scheduling_strategies.PlacementGroupSchedulingStrategy(placement_group=pg, placement_group_bundle_index=1)) \
-            .remote(
-                script,
-                log_path,
-                env_vars=sky_env_vars_dict,
-                stream_logs=True,
-                with_ray=True,
-            ))
+    for gang_scheduling_id in range(2):
+        sky_env_vars_dict = {}
+        sky_env_vars_dict['SKYPILOT_NODE_IPS'] = job_ip_list_str
+        sky_env_vars_dict['SKYPILOT_NUM_NODES'] = len(job_ip_rank_list)
+        sky_env_vars_dict.update(task_env_vars)
+        sky_env_vars_dict['SKYPILOT_NUM_GPUS_PER_NODE'] = 0
+
+        ip = gang_scheduling_id_to_ip[gang_scheduling_id]
+        rank = job_ip_rank_map[ip]
+
+        if len(cluster_ips_to_node_id) == 1: # Single-node task on single-node cluter
+            name_str = 'distributed_task,' if 'distributed_task' != None else 'task,'
+            log_path = os.path.expanduser(os.path.join('/sky/logs/tasks', 'run.log'))
+        else: # Single-node or multi-node task on multi-node cluster
+            idx_in_cluster = cluster_ips_to_node_id.get(ip, len(cluster_ips_to_node_id) + gang_scheduling_id)
+            if idx_in_cluster == 0:
+                node_name = 'head'
+            else:
+                node_name = f'worker{idx_in_cluster}'
+            name_str = f'{node_name}, rank={rank},'
+            log_path = os.path.expanduser(os.path.join('/sky/logs/tasks', f'{rank}-{node_name}.log'))
+        sky_env_vars_dict['SKYPILOT_NODE_RANK'] = rank
+
+        sky_env_vars_dict['SKYPILOT_INTERNAL_JOB_ID'] = 3
+
+        futures.append(run_bash_command_with_log_and_return_pid \
+                .options(name=name_str, num_cpus=2.0, scheduling_strategy=ray.util.scheduling_strategies.PlacementGroupSchedulingStrategy(placement_group=pg, placement_group_bundle_index=gang_scheduling_id)) \
+                .remote(
+                    script,
+                    log_path,
+                    env_vars=sky_env_vars_dict,
+                    stream_logs=True,
+                    with_ray=True,
+                ))
 returncodes, _ = get_or_fail(futures, pg)
 if sum(returncodes) != 0:
     # Save exit codes to job metadata for potential recovery logic
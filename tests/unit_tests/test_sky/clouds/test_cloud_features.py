@@ -0,0 +1,23 @@
+"""Tests for the feature support checks of the Cloud class."""
+import pytest
+
+from sky import clouds
+from sky import exceptions
+from sky import resources as resources_lib
+
+_FEATURES = clouds.CloudImplementationFeatures
+
+
+def test_get_unsupported_features_matches_check():
+    cloud = clouds.Lambda()
+    resources = resources_lib.Resources(infra='lambda')
+
+    unsupported = cloud.get_unsupported_features(
+        resources, {_FEATURES.STOP, _FEATURES.OPEN_PORTS})
+    assert unsupported == {_FEATURES.STOP}
+    with pytest.raises(exceptions.NotSupportedError, match='stop'):
+        cloud.check_features_are_supported(resources, {_FEATURES.STOP})
+
+    assert not cloud.get_unsupported_features(resources,
+                                              {_FEATURES.OPEN_PORTS})
+    cloud.check_features_are_supported(resources, {_FEATURES.OPEN_PORTS})
@@ -0,0 +1,52 @@
+"""Tests for the OCI config helpers."""
+
+import pytest
+
+from sky import skypilot_config
+from sky.clouds.utils import oci_utils
+
+
+@pytest.mark.parametrize('config, expected', [
+    ({}, [None, None]),
+    ({
+        'oci': {
+            'region_configs': {
+                'default': {
+                    'compartment_ocid': 'default-ocid'
+                }
+            }
+        }
+    }, ['default-ocid', 'default-ocid']),
+    ({
+        'oci': {
+            'region_configs': {
+                'default': {
+                    'compartment_ocid': 'default-ocid'
+                },
+                'us-ashburn-1': {
+                    'compartment_ocid': 'region-ocid'
+                },
+            }
+        }
+    }, ['region-ocid', 'default-ocid']),
+    ({
+        'oci': {
+            'compartment_ocid': 'cloud-ocid',
+            'region_configs': {
+                'default': {
+                    'compartment_ocid': 'default-ocid'
+                }
+            },
+        }
+    }, ['cloud-ocid', 'cloud-ocid']),
+])
+def test_get_compartment_falls_back_to_default_region(config, expected):
+    with skypilot_config.replace_skypilot_config(config):
+        assert [
+            oci_utils.oci_config.get_compartment(region)
+            for region in ('us-ashburn-1', 'us-phoenix-1')
+        ] == expected
+
+
+def test_get_nsg_name():
+    assert oci_utils.oci_config.get_nsg_name('my-cluster') == 'nsg_my-cluster'
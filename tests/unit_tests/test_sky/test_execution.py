@@ -0,0 +1,84 @@
+"""Unit tests for sky.execution."""
+from unittest import mock
+
+import pytest
+
+import sky
+from sky import execution
+from sky.backends import backend_utils
+from sky.utils import common
+from sky.utils import dag_utils
+from sky.utils import status_lib
+
+
+@pytest.mark.parametrize('status, expected_refreshes', [
+    (None, 1),
+    (status_lib.ClusterStatus.STOPPED, 1),
+    (status_lib.ClusterStatus.INIT, 2),
+])
+def test_fast_launch_reuses_fetched_cluster_status(monkeypatch, status,
+                                                   expected_refreshes):
+    refresh = mock.MagicMock(return_value=(status, None))
+    monkeypatch.setattr(backend_utils, 'refresh_cluster_status_handle',
+                        refresh)
+    execute = mock.MagicMock(return_value=(None, None))
+    monkeypatch.setattr(execution, '_execute', execute)
+
+    execution.launch(sky.Task(run='echo hi'), cluster_name='c1', fast=True)
+
+    assert refresh.call_count == expected_refreshes
+    if status == status_lib.ClusterStatus.INIT:
+        # INIT clusters are refreshed again under the status lock.
+        assert refresh.call_args.kwargs['force_refresh_statuses'] == [
+            status_lib.ClusterStatus.INIT
+        ]
+    execute.assert_called_once()
+
+
+def test_construct_storages_groups_by_bucket():
+    constructed = []
+
+    def _make_storage(name, source=None):
+        storage = mock.MagicMock()
+        storage.name = name
+        storage.source = source
+        storage.construct.side_effect = lambda: constructed.append(storage)
+        return storage
+
+    first = _make_storage('bucket-a')
+    second = _make_storage('bucket-a')
+    other = _make_storage(None, 's3://bucket-b')
+
+    execution._construct_storages([first, other, second])
+
+    assert len(constructed) == 3
+    # Storages of the same bucket are constructed in order.
+    assert constructed.index(first) < constructed.index(second)
+
+
+def test_execute_dag_rejects_mixed_autostop_configs():
+    task = sky.Task(run='echo hi')
+    task.set_resources([
+        sky.Resources(cpus=2, autostop=10),
+        sky.Resources(cpus=4, autostop=20),
+    ])
+    with pytest.raises(ValueError, match='same autostop config'):
+        execution._execute_dag(
+            dag_utils.convert_entrypoint_to_dag(task),
+            dryrun=True,
+            stream_logs=False,
+            handle=None,
+            backend=None,
+            retry_until_up=False,
+            optimize_target=common.OptimizeTarget.COST,
+            stages=None,
+            cluster_name=None,
+            detach_setup=False,
+            no_setup=False,
+            clone_disk_from=None,
+            skip_unnecessary_provisioning=False,
+            resize=False,
+            _quiet_optimizer=True,
+            _is_launched_by_jobs_controller=False,
+            _is_launched_by_sky_serve_controller=False,
+            _extra_launch_context={})
@@ -0,0 +1,33 @@
+"""Unit tests for cluster yaml accessors in global_user_state."""
+from sky import global_user_state
+
+
+def test_cluster_yaml_dict_is_parsed_once_per_content(monkeypatch):
+    yaml_strs = {'/tmp/c1.yml': 'a: 1\nb: [1, 2]\n'}
+    monkeypatch.setattr(global_user_state, 'get_cluster_yaml_str',
+                        lambda path: yaml_strs[path])
+    calls = []
+    original_safe_load = global_user_state.yaml_utils.safe_load
+
+    def _counting_safe_load(stream):
+        calls.append(stream)
+        return original_safe_load(stream)
+
+    monkeypatch.setattr(global_user_state.yaml_utils, 'safe_load',
+                        _counting_safe_load)
+    global_user_state._parse_cluster_yaml.cache_clear()
+
+    first = global_user_state.get_cluster_yaml_dict('/tmp/c1.yml')
+    assert first == {'a': 1, 'b': [1, 2]}
+    # Callers may mutate the returned dict without affecting the cache.
+    first['b'].append(3)
+    assert global_user_state.get_cluster_yaml_dict('/tmp/c1.yml') == {
+        'a': 1,
+        'b': [1, 2]
+    }
+    assert len(calls) == 1
+
+    # An updated yaml is parsed again.
+    yaml_strs['/tmp/c1.yml'] = 'a: 2\n'
+    assert global_user_state.get_cluster_yaml_dict('/tmp/c1.yml') == {'a': 2}
+    assert len(calls) == 2
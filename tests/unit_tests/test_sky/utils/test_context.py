@@ -1,6 +1,7 @@
 """Unit tests for sky.utils.context module."""
 
 import asyncio
+import concurrent.futures
 import os
 import pathlib
 import tempfile
@@ -388,3 +389,17 @@ def test_contextual_decorator():
     # Parent remains unchanged by child's mutations
     assert parent.env_overrides.get('K') == 'v1'
     assert 'NEW' not in parent.env_overrides
+
+
+def test_with_current_context_in_threads():
+    """Test that with_current_context carries the context into threads."""
+    context.initialize()
+    parent = context.get()
+
+    @context.with_current_context
+    def inner(_):
+        return context.get()
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        contexts = list(executor.map(inner, range(4)))
+    assert all(ctx is parent for ctx in contexts)
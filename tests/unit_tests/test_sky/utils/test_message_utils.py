@@ -0,0 +1,41 @@
+"""Tests for sky.utils.message_utils module."""
+import math
+
+import pytest
+
+from sky.utils import message_utils
+
+
+def test_payload_round_trip():
+    payload = {'1': 'RUNNING', '2': None, 'ids': [1, 2.5], 'ok': True}
+    encoded = message_utils.encode_payload(payload)
+    # Noise around the payload (e.g. shell warnings) is ignored.
+    assert message_utils.decode_payload(f'warning\n{encoded}') == payload
+
+
+def test_decode_payload_selects_type():
+    encoded = (message_utils.encode_payload([1], payload_type='job_ids') +
+               message_utils.encode_payload({'1': 'd'}, payload_type='dirs'))
+    dirs = message_utils.decode_payload(encoded, payload_type='dirs')
+    assert dirs == {'1': 'd'}
+    assert message_utils.decode_payload(encoded,
+                                        payload_type='job_ids') == [1]
+
+
+def test_decode_payload_falls_back_for_non_standard_json():
+    big_int = 2**70
+    encoded = message_utils.encode_payload({
+        'nan': float('nan'),
+        'big': big_int
+    })
+    decoded = message_utils.decode_payload(encoded)
+    assert math.isnan(decoded['nan'])
+    assert decoded['big'] == big_int
+
+
+def test_decode_payload_mismatch():
+    with pytest.raises(ValueError):
+        message_utils.decode_payload('no payload here')
+    assert message_utils.decode_payload(
+        'no payload here',
+        raise_for_mismatch=False) == (False, 'no payload here')
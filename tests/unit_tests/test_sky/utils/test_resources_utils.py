@@ -460,3 +460,42 @@ class TestLocalDiskSatisfied:
         # Exact match requested, but launched is smaller - should fail
         assert resources_utils.local_disk_satisfied('nvme:1000',
                                                     'nvme:500') is False
+
+
+@pytest.mark.parametrize('ports_list,expected', [
+    ([['1-3', '8'], ['4', '6-7']], ['1-4', '6-8']),
+    ([['10-20'], ['15-30', '40']], ['10-30', '40']),
+    ([None, ['22']], ['22']),
+    ([None, None], []),
+    ([['1-65535'], ['8080']], ['1-65535']),
+])
+def test_merge_port_ranges(ports_list, expected):
+    assert resources_utils.merge_port_ranges(*ports_list) == expected
+    # Matches expanding the ranges into individual ports.
+    port_set = set()
+    for ports in ports_list:
+        port_set |= resources_utils.port_ranges_to_set(ports)
+    assert resources_utils.port_set_to_ranges(port_set) == expected
+
+
+@pytest.mark.parametrize('ports,other_ports,expected', [
+    (['1-10'], ['2', '5-10'], True),
+    (['1-3', '4-6'], ['2-5'], True),
+    (['1-3', '5-6'], ['2-5'], False),
+    (['1-10'], ['11'], False),
+    (['5-10'], ['1'], False),
+    (None, None, True),
+    (None, ['22'], False),
+    (['22'], None, True),
+])
+def test_port_ranges_cover(ports, other_ports, expected):
+    assert resources_utils.port_ranges_cover(ports, other_ports) is expected
+    assert expected == (resources_utils.port_ranges_to_set(other_ports) <=
+                        resources_utils.port_ranges_to_set(ports))
+
+
+def test_merge_port_ranges_validates_ports():
+    with pytest.raises(ValueError):
+        resources_utils.merge_port_ranges(['10-5'])
+    with pytest.raises(ValueError):
+        resources_utils.merge_port_ranges(['0'])